@@ -1,7 +1,14 @@
+import concurrent.futures
 import contextlib
+import heapq
 import inspect
+import itertools
+import os
 import threading
+import time
 from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass, field, replace
+from enum import IntEnum
 from types import TracebackType
 from typing import (
     Any,
@@ -12,6 +19,7 @@ from typing import (
     List,
     Optional,
     Protocol,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -21,6 +29,8 @@ from typing import (
 
 from typing_extensions import ParamSpec, Self
 
+from .utils.logging import LoggingDescriptor
+
 
 class Lockable(Protocol):
     def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
@@ -212,8 +222,207 @@ def check_current_task_canceled(at_least_seconds: Optional[float] = None, raise_
     return True
 
 
+_P = ParamSpec("_P")
+
+
+class TaskPriority(IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+@dataclass
+class TaskPriorityStatistics:
+    queued: int = 0
+    started: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    total_run_time: float = 0.0
+
+
+@dataclass
+class WorkerPoolStatistics:
+    max_workers: int
+    workers: int
+    idle_workers: int
+    overflow_workers: int
+    priorities: Dict[str, TaskPriorityStatistics] = field(default_factory=dict)
+
+
+class _WorkItem:
+    __slots__ = ("future", "callable", "args", "kwargs", "priority", "submitted")
+
+    def __init__(
+        self,
+        future: Task[Any],
+        callable: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        priority: TaskPriority,
+    ) -> None:
+        self.future = future
+        self.callable = callable
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.submitted = time.monotonic()
+
+
+class WorkerPool:
+    _logger = LoggingDescriptor()
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        name: str = "robotcode_worker",
+        idle_timeout: float = 60.0,
+        starvation_timeout: float = 0.5,
+        max_overflow_workers: Optional[int] = None,
+    ) -> None:
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) + 2)
+        self.max_overflow_workers = self.max_workers if max_overflow_workers is None else max_overflow_workers
+        self.name = name
+        self.idle_timeout = idle_timeout
+        self.starvation_timeout = starvation_timeout
+
+        self._condition = threading.Condition(threading.Lock())
+        self._queue: List[Tuple[int, int, _WorkItem]] = []
+        self._counter = itertools.count()
+        self._workers: Set[threading.Thread] = set()
+        self._idle_workers = 0
+        self._overflow_limit_reached = False
+        self._monitor: Optional[threading.Thread] = None
+        self._local = threading.local()
+        self._statistics = {p: TaskPriorityStatistics() for p in TaskPriority}
+
+    def _is_worker_thread(self) -> bool:
+        return getattr(self._local, "is_worker", False)
+
+    def submit(
+        self, priority: TaskPriority, callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs
+    ) -> Task[_TResult]:
+        future: Task[_TResult] = Task()
+        item = _WorkItem(future, callable, args, kwargs, priority)
+
+        with self._condition:
+            heapq.heappush(self._queue, (priority, next(self._counter), item))
+            self._statistics[priority].queued += 1
+
+            if self._idle_workers >= len(self._queue):
+                self._condition.notify()
+            elif len(self._workers) < self.max_workers:
+                self._start_worker()
+            elif not (self._is_worker_thread() and self._start_overflow_worker()):
+                # tasks created by a running task are often awaited by it, so they only wait in the queue if
+                # no more overflow workers can be started
+                self._start_monitor()
+
+        return future
+
+    def _start_worker(self) -> None:
+        thread = threading.Thread(target=self._worker, name=f"{self.name}_{len(self._workers)}", daemon=True)
+        self._workers.add(thread)
+        thread.start()
+
+    def _start_overflow_worker(self) -> bool:
+        if len(self._workers) >= self.max_workers + self.max_overflow_workers:
+            if not self._overflow_limit_reached:
+                self._overflow_limit_reached = True
+                self._logger.warning(
+                    lambda: f"{self.name}: limit of {self.max_overflow_workers} overflow workers reached, "
+                    "tasks are queued until a worker is free"
+                )
+            return False
+
+        self._overflow_limit_reached = False
+        self._start_worker()
+        return True
+
+    def _start_monitor(self) -> None:
+        if self._monitor is None:
+            self._monitor = threading.Thread(target=self._monitor_queue, name=f"{self.name}_monitor", daemon=True)
+            self._monitor.start()
+
+    def _monitor_queue(self) -> None:
+        while True:
+            time.sleep(self.starvation_timeout)
+
+            with self._condition:
+                if not self._queue:
+                    self._monitor = None
+                    return
+
+                if (
+                    self._idle_workers == 0
+                    and time.monotonic() - min(i.submitted for _, _, i in self._queue) > self.starvation_timeout
+                ):
+                    # all workers are blocked, start an additional worker to avoid starving the queue
+                    self._start_overflow_worker()
+
+    def _worker(self) -> None:
+        self._local.is_worker = True
+
+        while True:
+            with self._condition:
+                while not self._queue:
+                    if len(self._workers) > self.max_workers:
+                        self._workers.discard(threading.current_thread())
+                        return
+
+                    self._idle_workers += 1
+                    try:
+                        notified = self._condition.wait(self.idle_timeout)
+                    finally:
+                        self._idle_workers -= 1
+
+                    if not notified and not self._queue:
+                        self._workers.discard(threading.current_thread())
+                        return
+
+                _, _, item = heapq.heappop(self._queue)
+
+                started = time.monotonic()
+                statistics = self._statistics[item.priority]
+                statistics.started += 1
+                wait_time = started - item.submitted
+                statistics.total_wait_time += wait_time
+                if wait_time > statistics.max_wait_time:
+                    statistics.max_wait_time = wait_time
+
+            _run_task_in_thread_handler(item.future, item.callable, item.args, item.kwargs)
+
+            with self._condition:
+                statistics.total_run_time += time.monotonic() - started
+
+            del item
+
+    def get_queue_depth(self) -> Dict[TaskPriority, int]:
+        with self._condition:
+            result = {p: 0 for p in TaskPriority}
+            for priority, _, _ in self._queue:
+                result[TaskPriority(priority)] += 1
+            return result
+
+    def get_statistics(self) -> WorkerPoolStatistics:
+        with self._condition:
+            return WorkerPoolStatistics(
+                self.max_workers,
+                len(self._workers),
+                self._idle_workers,
+                max(0, len(self._workers) - self.max_workers),
+                {p.name.lower(): replace(s) for p, s in self._statistics.items()},
+            )
+
+
+_worker_pool = WorkerPool()
+
+
+def get_worker_pool() -> WorkerPool:
+    return _worker_pool
+
+
 _running_tasks_lock = RLock()
-_running_tasks: Dict[Task[Any], threading.Thread] = {}
+_running_tasks: Dict[Task[Any], Optional[threading.Thread]] = {}
 
 
 def _remove_future_from_running_tasks(future: Task[Any]) -> None:
@@ -221,10 +430,22 @@ def _remove_future_from_running_tasks(future: Task[Any]) -> None:
         _running_tasks.pop(future, None)
 
 
-_P = ParamSpec("_P")
+def run_as_task(callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs) -> Task[_TResult]:
+    return run_as_task_with_priority(TaskPriority.NORMAL, callable, *args, **kwargs)
 
 
-def run_as_task(callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs) -> Task[_TResult]:
+def run_as_task_with_priority(
+    priority: TaskPriority, callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs
+) -> Task[_TResult]:
+    future = _worker_pool.submit(priority, callable, *args, **kwargs)
+    with _running_tasks_lock:
+        _running_tasks[future] = None
+    future.add_done_callback(_remove_future_from_running_tasks)
+
+    return future
+
+
+def run_as_long_running_task(callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs) -> Task[_TResult]:
     future: Task[_TResult] = Task()
     with _running_tasks_lock:
         thread = threading.Thread(
@@ -242,12 +463,16 @@ def run_as_task(callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.k
 
 
 def _cancel_all_running_tasks(timeout: Optional[float] = None) -> None:
+    futures: List[Task[Any]] = []
     threads: List[threading.Thread] = []
     with _running_tasks_lock:
         for future, thread in _running_tasks.items():
             if not future.cancelation_requested:
                 future.cancel()
-                threads.append(thread)
+                futures.append(future)
+                if thread is not None:
+                    threads.append(thread)
     for thread in threads:
         if thread is not threading.current_thread():
             thread.join(timeout=timeout)
+    concurrent.futures.wait([f for f in futures if f is not _local_storage._local_future], timeout=timeout)
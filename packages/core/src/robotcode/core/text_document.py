@@ -1,3 +1,4 @@
+import bisect
 import collections
 import inspect
 import io
@@ -60,6 +61,18 @@ def position_to_utf16(lines: List[str], position: Position) -> Position:
     return Position(line=position.line, character=utf16_counter)
 
 
+def get_utf16_offsets(line: str) -> Optional[List[int]]:
+    """Returns the UTF-16 offsets of all characters of a line, or `None` if they are the same as the UTF-32 offsets."""
+    if line.isascii() or max(line) <= "\uffff":
+        return None
+
+    result = [0]
+    for c in line:
+        result.append(result[-1] + (2 if is_multibyte_char(c) else 1))
+
+    return result
+
+
 def range_from_utf16(lines: List[str], range: Range) -> Range:
     return Range(
         start=position_from_utf16(lines, range.start),
@@ -109,6 +122,8 @@ class TextDocument:
         self._orig_text = text
         self._orig_version = version
         self._lines: Optional[List[str]] = None
+        self._utf16_offsets_lines: Optional[List[str]] = None
+        self._utf16_offsets: Dict[int, Optional[List[int]]] = {}
         self._cache: Dict[weakref.ref[Any], CacheEntry] = collections.defaultdict(CacheEntry)
         self._data_lock = threading.RLock()
         self._data: weakref.WeakKeyDictionary[Any, Any] = weakref.WeakKeyDictionary()
@@ -298,14 +313,49 @@ class TextDocument:
         with self._lock:
             self._clear()
 
+    def __get_utf16_offsets(self, lines: List[str], line: int) -> Optional[List[int]]:
+        with self._lock:
+            if self._utf16_offsets_lines is not lines:
+                self._utf16_offsets_lines = lines
+                self._utf16_offsets = {}
+
+            offsets = self._utf16_offsets
+
+        if line not in offsets:
+            offsets[line] = get_utf16_offsets(lines[line])
+
+        return offsets[line]
+
     def position_from_utf16(self, position: Position) -> Position:
-        return position_from_utf16(self.get_lines(), position)
+        lines = self.get_lines()
+        if position.line >= len(lines):
+            return position
+
+        length = len(lines[position.line])
+
+        offsets = self.__get_utf16_offsets(lines, position.line)
+        if offsets is None:
+            return Position(line=position.line, character=max(0, min(position.character, length)))
+
+        return Position(
+            line=position.line, character=max(0, min(bisect.bisect_right(offsets, position.character) - 1, length))
+        )
 
     def position_to_utf16(self, position: Position) -> Position:
-        return position_to_utf16(self.get_lines(), position)
+        lines = self.get_lines()
+        if position.line >= len(lines):
+            return position
+
+        character = max(0, min(position.character, len(lines[position.line])))
+
+        offsets = self.__get_utf16_offsets(lines, position.line)
+        if offsets is None:
+            return Position(line=position.line, character=character)
+
+        return Position(line=position.line, character=offsets[character])
 
     def range_from_utf16(self, range: Range) -> Range:
-        return range_from_utf16(self.get_lines(), range)
+        return Range(start=self.position_from_utf16(range.start), end=self.position_from_utf16(range.end))
 
     def range_to_utf16(self, range: Range) -> Range:
-        return range_to_utf16(self.get_lines(), range)
+        return Range(start=self.position_to_utf16(range.start), end=self.position_to_utf16(range.end))
@@ -1,6 +1,7 @@
-from collections import defaultdict
+from collections import OrderedDict
+from dataclasses import dataclass
 from threading import RLock
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
+from typing import Any, Callable, Optional, Tuple, TypeVar, cast
 
 _T = TypeVar("_T")
 
@@ -18,40 +19,57 @@ class CacheEntry:
         self.lock = RLock()
 
 
+@dataclass
+class CacheStatistics:
+    items: int
+    max_items: Optional[int]
+    hits: int
+    misses: int
+
+
 class SimpleLRUCache:
     def __init__(self, max_items: Optional[int] = 128) -> None:
         self.max_items = max_items
 
-        self._cache: Dict[Tuple[Any, ...], CacheEntry] = defaultdict(CacheEntry)
-        self._order: Optional[List[Tuple[Any, ...]]] = None
-        if self.max_items:
-            self._order = []
+        self._cache: "OrderedDict[Tuple[Any, ...], CacheEntry]" = OrderedDict()
         self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
 
     def has(self, *args: Any, **kwargs: Any) -> bool:
         key = self._make_key(*args, **kwargs)
 
-        if key in self._cache:
-            return self._cache[key].has_data
+        with self._lock:
+            entry = self._cache.get(key, None)
 
-        return False
+        return entry is not None and entry.has_data
 
     def get(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
         key = self._make_key(*args, **kwargs)
 
-        entry = self._cache[key]
+        with self._lock:
+            entry = self._cache.get(key, None)
+            if entry is None:
+                entry = self._cache[key] = CacheEntry()
+            elif self.max_items:
+                self._cache.move_to_end(key)
 
         with entry.lock:
-            if not entry.has_data:
+            if entry.has_data:
+                self.hits += 1
+            else:
+                self.misses += 1
+
                 entry.data = func(*args, **kwargs)
                 entry.has_data = True
 
-                if self._order is not None and self.max_items is not None:
+                if self.max_items:
                     with self._lock:
-                        self._order.insert(0, key)
-
-                        if len(self._order) > self.max_items:
-                            del self._cache[self._order.pop()]
+                        while len(self._cache) > self.max_items:
+                            self._cache.popitem(last=False)
 
             return cast(_T, entry.data)
 
@@ -65,5 +83,6 @@ class SimpleLRUCache:
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
-            if self._order is not None:
-                self._order.clear()
+
+    def get_statistics(self) -> CacheStatistics:
+        return CacheStatistics(len(self._cache), self.max_items, self.hits, self.misses)
@@ -5,8 +5,9 @@ from __future__ import annotations
 import functools
 import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path, PurePath
-from typing import Any, Iterable, Iterator, Optional, Sequence, Union, cast
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 
 def _glob_pattern_to_re(pattern: str) -> str:
@@ -122,6 +123,169 @@ def _is_hidden(entry: os.DirEntry[str]) -> bool:
     return False
 
 
+_GLOB_CHARS = frozenset("*?[{")
+_GLOB_RE_PREFIX = "(?ms)^"
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(c in _GLOB_CHARS for c in pattern)
+
+
+def _literal_prefix(pattern: str) -> str:
+    result = []
+    for part in pattern.split("/"):
+        if _is_glob(part):
+            break
+        result.append(part)
+
+    return "/".join(result)
+
+
+def _compile_combined_glob_patterns(patterns: Iterable[str]) -> Optional[re.Pattern[str]]:
+    parts = [_glob_pattern_to_re(p)[len(_GLOB_RE_PREFIX) : -1] for p in patterns]
+    if not parts:
+        return None
+
+    return re.compile(f"{_GLOB_RE_PREFIX}(?:{'|'.join(parts)})$")
+
+
+class _PatternMatcher:
+    def __init__(self, patterns: Iterable[Pattern]) -> None:
+        literals: Set[str] = set()
+        dir_literals: Set[str] = set()
+        globs: List[str] = []
+        dir_globs: List[str] = []
+        prefixes: Set[str] = set()
+
+        for p in patterns:
+            if p.re_pattern is None:
+                (dir_literals if p.only_dirs else literals).add(p.pattern)
+            else:
+                (dir_globs if p.only_dirs else globs).append(p.pattern)
+            prefixes.add(_literal_prefix(p.pattern))
+
+        self.is_empty = not prefixes
+        self.literals = frozenset(literals)
+        self.dir_literals = frozenset(dir_literals)
+        self.re_pattern = _compile_combined_glob_patterns(globs)
+        self.dir_re_pattern = _compile_combined_glob_patterns(dir_globs)
+        self.prefixes: Optional[Tuple[str, ...]] = None if not prefixes or "" in prefixes else tuple(prefixes)
+
+    def matches(self, path: str, is_dir: bool) -> bool:
+        if path in self.literals or (self.re_pattern is not None and self.re_pattern.match(path) is not None):
+            return True
+
+        if is_dir:
+            return path in self.dir_literals or (
+                self.dir_re_pattern is not None and self.dir_re_pattern.match(path) is not None
+            )
+
+        return False
+
+    def may_match_below(self, path: str) -> bool:
+        if self.prefixes is None:
+            return True
+
+        return any(p == path or p.startswith(path + "/") or path.startswith(p + "/") for p in self.prefixes)
+
+
+class _IgnoreFile:
+    def __init__(self, base: str, lines: Iterable[str]) -> None:
+        self.base = base
+        self.rules: List[Tuple[bool, bool, re.Pattern[str]]] = []
+
+        group: List[str] = []
+        group_key: Optional[Tuple[bool, bool]] = None
+
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            if line.startswith("\\"):
+                line = line[1:]
+
+            only_dirs = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+
+            if line.startswith("/"):
+                line = line[1:]
+            elif "/" not in line:
+                line = "**/" + line
+
+            if group_key != (negate, only_dirs):
+                self._add_rule(group_key, group)
+                group = []
+                group_key = (negate, only_dirs)
+
+            group.append(line)
+
+        self._add_rule(group_key, group)
+
+    def _add_rule(self, key: Optional[Tuple[bool, bool]], patterns: List[str]) -> None:
+        if key is None or not patterns:
+            return
+
+        pattern = _compile_combined_glob_patterns(patterns)
+        if pattern is not None:
+            self.rules.append((*key, pattern))
+
+    def is_ignored(self, path: str, is_dir: bool) -> Optional[bool]:
+        if self.base:
+            path = path[len(self.base) + 1 :]
+
+        for negate, only_dirs, pattern in reversed(self.rules):
+            if only_dirs and not is_dir:
+                continue
+            if pattern.match(path) is not None:
+                return not negate
+
+        return None
+
+
+def _scan_dir(path: str, ignore_files: Sequence[str]) -> Tuple[List[os.DirEntry[str]], List[str]]:
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return [], []
+
+    ignore_lines: List[str] = []
+    if ignore_files:
+        names = {e.name for e in entries}
+        for name in ignore_files:
+            if name in names:
+                try:
+                    with open(os.path.join(path, name), encoding="utf-8", errors="replace") as f:
+                        ignore_lines.extend(f.read().splitlines())
+                except OSError:
+                    pass
+
+    return entries, ignore_lines
+
+
+class _DirFrame:
+    __slots__ = ("entries", "ignore_stack", "index", "path_to_yield", "prefetched")
+
+    def __init__(
+        self,
+        entries: List[Tuple[str, str, bool, bool, bool]],
+        ignore_stack: Tuple[_IgnoreFile, ...],
+        path_to_yield: Optional[str],
+        prefetched: Dict[str, Future[Tuple[List[os.DirEntry[str]], List[str]]]],
+    ) -> None:
+        self.entries = entries
+        self.ignore_stack = ignore_stack
+        self.index = 0
+        self.path_to_yield = path_to_yield
+        self.prefetched = prefetched
+
+
 def iter_files(
     path: Union[PurePath, str, os.PathLike[str]],
     patterns: Union[Sequence[Union[Pattern, str]], Pattern, str, None] = None,
@@ -129,9 +293,18 @@ def iter_files(
     *,
     include_hidden: bool = False,
     absolute: bool = False,
+    ignore_files: Optional[Sequence[str]] = None,
+    workers: Optional[int] = None,
 ) -> Iterator[Path]:
-    if not isinstance(path, PurePath):
-        path = PurePath(path or ".")
+    """Walks `path` and yields all files and directories that match `patterns`.
+
+    Directories that match `ignore_patterns` or a rule from one of the `ignore_files` (like `.gitignore`) found in
+    the tree are not entered. If `workers` is greater than 1, the directories are scanned in parallel, the order of
+    the results is the same as for a sequential walk.
+    """
+    root = os.fspath(path) or "."
+    if absolute:
+        root = str(Path(root).absolute())
 
     if patterns is not None and isinstance(patterns, (str, Pattern)):
         patterns = [patterns]
@@ -139,52 +312,99 @@ def iter_files(
     if ignore_patterns is not None and isinstance(ignore_patterns, (str, Pattern)):
         ignore_patterns = [ignore_patterns]
 
-    yield from _iter_files_recursive_re(
-        path=path,
-        patterns=[] if patterns is None else [p if isinstance(p, Pattern) else Pattern(p) for p in patterns],
-        ignore_patterns=[]
-        if ignore_patterns is None
-        else [p if isinstance(p, Pattern) else Pattern(p) for p in ignore_patterns],
-        include_hidden=include_hidden,
-        absolute=absolute,
-        _base_path=path,
+    yield from _iter_files(
+        root,
+        _PatternMatcher(p if isinstance(p, Pattern) else Pattern(p) for p in patterns or []),
+        _PatternMatcher(p if isinstance(p, Pattern) else Pattern(p) for p in ignore_patterns or []),
+        list(ignore_files or []),
+        include_hidden,
+        workers,
     )
 
 
-def _iter_files_recursive_re(
-    path: PurePath,
-    patterns: Sequence[Pattern],
-    ignore_patterns: Sequence[Pattern],
+def _iter_files(
+    root: str,
+    patterns: _PatternMatcher,
+    ignore_patterns: _PatternMatcher,
+    ignore_files: List[str],
     include_hidden: bool,
-    absolute: bool,
-    _base_path: PurePath,
+    workers: Optional[int],
 ) -> Iterator[Path]:
-    try:
-        with os.scandir(path) as it:
-            for f in it:
-                if not include_hidden and _is_hidden(f):
+    executor = ThreadPoolExecutor(workers, thread_name_prefix="iter_files") if workers and workers > 1 else None
+
+    def create_frame(
+        rel_path: str,
+        scan_result: Tuple[List[os.DirEntry[str]], List[str]],
+        ignore_stack: Tuple[_IgnoreFile, ...],
+        path_to_yield: Optional[str],
+    ) -> _DirFrame:
+        dir_entries, ignore_lines = scan_result
+        if ignore_lines:
+            ignore_stack = (*ignore_stack, _IgnoreFile(rel_path, ignore_lines))
+
+        entries = []
+        prefetched: Dict[str, Future[Tuple[List[os.DirEntry[str]], List[str]]]] = {}
+
+        for entry in dir_entries:
+            if not include_hidden and _is_hidden(entry):
+                continue
+
+            rel = f"{rel_path}/{entry.name}" if rel_path else entry.name
+            is_dir = entry.is_dir()
+
+            if not ignore_patterns.is_empty and ignore_patterns.matches(rel, is_dir):
+                continue
+
+            if ignore_stack:
+                ignored = None
+                for ignore_file in ignore_stack:
+                    r = ignore_file.is_ignored(rel, is_dir)
+                    if r is not None:
+                        ignored = r
+                if ignored:
                     continue
 
-                relative_path = (path / f.name).relative_to(_base_path)
-
-                if not ignore_patterns or not any(
-                    p.matches(relative_path) and (not p.only_dirs or p.only_dirs and f.is_dir())
-                    for p in cast(Iterable[Pattern], ignore_patterns)
-                ):
-                    if f.is_dir():
-                        yield from _iter_files_recursive_re(
-                            PurePath(f),
-                            patterns,
-                            ignore_patterns,
-                            include_hidden=include_hidden,
-                            absolute=absolute,
-                            _base_path=_base_path,
-                        )
-                    if not patterns or any(
-                        p.matches(relative_path) and (not p.only_dirs or p.only_dirs and f.is_dir())
-                        for p in cast(Iterable[Pattern], patterns)
-                    ):
-                        yield Path(f).absolute() if absolute else Path(f)
-
-    except (OSError, PermissionError):
-        pass
+            matched = patterns.is_empty or patterns.matches(rel, is_dir)
+            descend = is_dir and patterns.may_match_below(rel)
+
+            if descend and executor is not None:
+                prefetched[entry.path] = executor.submit(_scan_dir, entry.path, ignore_files)
+
+            entries.append((entry.path, rel, is_dir, matched, descend))
+
+        return _DirFrame(entries, ignore_stack, path_to_yield, prefetched)
+
+    stack: List[_DirFrame] = []
+    try:
+        stack.append(create_frame("", _scan_dir(root, ignore_files), (), None))
+
+        while stack:
+            frame = stack[-1]
+
+            if frame.index >= len(frame.entries):
+                stack.pop()
+                if frame.path_to_yield is not None:
+                    yield Path(frame.path_to_yield)
+                continue
+
+            entry_path, rel, is_dir, matched, descend = frame.entries[frame.index]
+            frame.index += 1
+
+            if descend:
+                future = frame.prefetched.pop(entry_path, None)
+                stack.append(
+                    create_frame(
+                        rel,
+                        future.result() if future is not None else _scan_dir(entry_path, ignore_files),
+                        frame.ignore_stack,
+                        entry_path if matched else None,
+                    )
+                )
+            elif matched:
+                yield Path(entry_path)
+    finally:
+        if executor is not None:
+            for frame in stack:
+                for future in frame.prefetched.values():
+                    future.cancel()
+            executor.shutdown(wait=False)
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-import collections
 import functools
 import inspect
+import itertools
 import logging
 import os
 import reprlib
 import time
-from enum import Enum
+import weakref
 from typing import (
     Any,
     Callable,
     ClassVar,
-    List,
+    Dict,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -74,13 +75,6 @@ def get_unwrapped_func(func: Callable[..., Any]) -> Callable[..., Any]:
     return cast(Callable[..., Any], result)
 
 
-_LoggerEntry = collections.namedtuple("_LoggerEntry", "level prefix condition states")
-
-
-class _HasLoggerEntries:
-    __logging_entries__: List[_LoggerEntry]
-
-
 _FUNC_TYPE = Union[Callable[[], logging.Logger], Callable[[], None], None]
 
 _F = TypeVar("_F", bound=Callable[..., Any])
@@ -90,12 +84,6 @@ class LoggerError(Exception):
     pass
 
 
-class CallState(Enum):
-    ENTERING = "entering"
-    EXITING = "exiting"
-    EXCEPTION = "exception"
-
-
 TRACE = logging.DEBUG - 6
 logging.addLevelName(TRACE, "TRACE")
 
@@ -126,6 +114,9 @@ class LoggingDescriptor:
         self.__level = level
         self.__postfix = postfix
 
+        self._reset_call_tracing()
+        type(self)._instances.add(self)
+
     def __init_logger(self) -> LoggingDescriptor:
         if self.__logger is None:
             returned_logger = None
@@ -353,15 +344,64 @@ class LoggingDescriptor:
         if "ROBOT_CALL_TRACING_LEVEL" in os.environ
         else TRACE
     )
+    _call_tracing_sample_rate: ClassVar[int] = int(os.environ.get("ROBOT_CALL_TRACING_SAMPLE_RATE", 1))
+    _call_tracing_rules: ClassVar[Dict[str, Tuple[bool, int]]] = {}
+    _instances: ClassVar[weakref.WeakSet[LoggingDescriptor]] = weakref.WeakSet()
+
+    # checked by every traced call, so it is a plain attribute that is only true if tracing is possibly enabled
+    _trace_calls: bool = False
+    _trace_calls_resolved: bool = False
+    _trace_calls_sample_rate: int = 1
 
     @classmethod
-    def set_call_tracing(cls, value: bool) -> None:
-        cls._call_tracing_enabled = value
+    def set_call_tracing(cls, value: bool, name: Optional[str] = None, sample_rate: Optional[int] = None) -> None:
+        """Enables or disables call tracing at runtime.
+
+        If `name` is given, only loggers whose name is `name` or starts with `name.` are changed. With a `sample_rate`
+        greater than 1 only every n-th call of a function is logged.
+        """
+        if name is None:
+            cls._call_tracing_enabled = value
+            cls._call_tracing_rules = {}
+            if sample_rate is not None:
+                cls._call_tracing_sample_rate = sample_rate
+        else:
+            cls._call_tracing_rules = {
+                **cls._call_tracing_rules,
+                name: (value, sample_rate if sample_rate is not None else cls._call_tracing_sample_rate),
+            }
+
+        for instance in list(cls._instances):
+            instance._reset_call_tracing()
 
     @classmethod
     def set_call_tracing_default_level(cls, level: int) -> None:
         cls._call_tracing_default_level = level
 
+    def _reset_call_tracing(self) -> None:
+        cls = type(self)
+        self._trace_calls_resolved = False
+        self._trace_calls = cls._call_tracing_enabled or bool(cls._call_tracing_rules)
+
+    def _resolve_call_tracing(self) -> None:
+        cls = type(self)
+
+        enabled = cls._call_tracing_enabled
+        sample_rate = cls._call_tracing_sample_rate
+
+        if cls._call_tracing_rules:
+            name = self.name
+            matches = [k for k in cls._call_tracing_rules if name == k or name.startswith(k + ".")]
+            if matches:
+                enabled, sample_rate = cls._call_tracing_rules[max(matches, key=len)]
+
+        self._trace_calls_sample_rate = max(1, sample_rate)
+        self._trace_calls = enabled
+        self._trace_calls_resolved = True
+
+    def _get_call_name(self, func: Callable[..., Any]) -> str:
+        return str(func.__qualname__) if self.__owner is None or self.__name else str(func.__name__)
+
     @overload
     def call(self, _func: _F) -> _F:
         ...
@@ -396,143 +436,151 @@ class LoggingDescriptor:
         if level is None:
             level = type(self)._call_tracing_default_level
 
-        def _decorator(func: _F) -> Callable[[_F], _F]:
-            unwrapped_func = inspect.unwrap(func)
-
-            if not hasattr(unwrapped_func, "__logging_entries__"):
-                unwrapped_func.__logging_entries__ = []
-
-            unwrapped_func.__logging_entries__.append(
-                _LoggerEntry(
-                    level=level,
-                    prefix=prefix,
-                    condition=condition,
-                    states={
-                        CallState.ENTERING: entering,
-                        CallState.EXITING: exiting,
-                        CallState.EXCEPTION: exception,
-                    },
-                )
-            )
+        def _decorator(func: _F) -> _F:
+            tracer = _CallTracer(self, func, level, prefix, condition, entering, exiting, exception, timed, kwargs)
+            real_func = tracer.func
 
-            skip_first_arg = _get_callable_has_self_or_cls_parameter(unwrapped_func)
+            if tracer.is_staticmethod:
 
-            @functools.wraps(func)
-            def _wrapper(*wrapper_args: Any, **wrapper_kwargs: Any) -> Any:
-                if isinstance(unwrapped_func, staticmethod):
-                    real_args = wrapper_args[1:]
-                    real_func = unwrapped_func.__func__
-                else:
-                    real_args = wrapper_args
-                    real_func = unwrapped_func
-
-                def has_logging_entries() -> bool:
-                    return hasattr(unwrapped_func, "__logging_entries__")
-
-                def func_name() -> str:
-                    if isinstance(unwrapped_func, staticmethod):
-                        return (
-                            unwrapped_func.__func__.__qualname__
-                            if self.__owner or self.__name is None
-                            else unwrapped_func.__func__.__name__
-                        )
-
-                    return (
-                        str(unwrapped_func.__qualname__)
-                        if self.__owner is None or self.__name
-                        else str(unwrapped_func.__name__)
-                    )
+                @functools.wraps(func)
+                def _static_wrapper(*wrapper_args: Any, **wrapper_kwargs: Any) -> Any:
+                    if not self._trace_calls:
+                        return real_func(*wrapper_args[1:], **wrapper_kwargs)
 
-                def _log(
-                    message: Callable[[], str],
-                    *,
-                    state: CallState,
-                    log_level: Optional[int] = None,
-                    stacklevel: int = 4,
-                    **log_kwargs: Any,
-                ) -> None:
-                    if has_logging_entries():
-                        for c in cast(_HasLoggerEntries, unwrapped_func).__logging_entries__:
-                            if c.states[state]:
-
-                                def state_msg() -> str:
-                                    return (
-                                        (str(state.value) + " ")
-                                        if state != CallState.ENTERING or c.states[CallState.EXITING]
-                                        else ""
-                                    )
-
-                                self.log(
-                                    log_level if log_level is not None else c.level,
-                                    lambda: f"{state_msg()}{prefix}{message()}",
-                                    condition=lambda: c.condition is None or c.condition(*real_args, **wrapper_kwargs),
-                                    stacklevel=stacklevel,
-                                    **{**kwargs, **log_kwargs},
-                                )
-
-                def build_enter_message() -> str:
-                    message_args = wrapper_args[1:] if skip_first_arg else wrapper_args
-
-                    return "{0}({1}{2}{3})".format(
-                        func_name(),
-                        ", ".join(_repr(a) for a in message_args),
-                        (", " if len(message_args) > 0 and len(wrapper_kwargs) > 0 else ""),
-                        (
-                            ", ".join(f"{k!s}={_repr(v)}" for k, v in wrapper_kwargs.items())
-                            if len(wrapper_kwargs) > 0
-                            else ""
-                        ),
-                    )
+                    return tracer.trace(wrapper_args[1:], wrapper_kwargs)
 
-                def build_exit_message(res: Any, duration: Optional[float]) -> str:
-                    return "{0}(...) -> {1}{2}".format(
-                        func_name(),
-                        _repr(res),
-                        f" duration: {duration}" if duration is not None else "",
-                    )
+                return cast(_F, _static_wrapper)
 
-                def build_exception_message(exception: BaseException) -> str:
-                    return f"{func_name()}(...) -> {type(exception).__qualname__}: {exception}"
+            @functools.wraps(func)
+            def _wrapper(*wrapper_args: Any, **wrapper_kwargs: Any) -> Any:
+                if not self._trace_calls:
+                    return real_func(*wrapper_args, **wrapper_kwargs)
 
-                _log(build_enter_message, state=CallState.ENTERING)
+                return tracer.trace(wrapper_args, wrapper_kwargs)
 
-                result = None
-                try:
-                    start_time: float = 0.0
-                    end_time: float = 0.0
-                    if timed:
-                        start_time = time.monotonic()
+            return cast(_F, _wrapper)
 
-                    result = real_func(*real_args, **wrapper_kwargs)
+        if _func is None:
+            return cast(Callable[[_F], _F], _decorator)
+
+        return _decorator(_func)
+
+
+class _CallTracer:
+    __slots__ = (
+        "descriptor",
+        "func",
+        "is_staticmethod",
+        "level",
+        "prefix",
+        "condition",
+        "entering",
+        "exiting",
+        "exception",
+        "timed",
+        "log_kwargs",
+        "skip_first_arg",
+        "counter",
+        "_name",
+    )
 
-                    if timed:
-                        end_time = time.monotonic()
+    def __init__(
+        self,
+        descriptor: LoggingDescriptor,
+        func: Callable[..., Any],
+        level: int,
+        prefix: str,
+        condition: Optional[Callable[..., bool]],
+        entering: bool,
+        exiting: bool,
+        exception: bool,
+        timed: bool,
+        log_kwargs: Dict[str, Any],
+    ) -> None:
+        unwrapped_func = inspect.unwrap(func)
 
-                except BaseException as e:
-                    ex = e
-                    _log(
-                        lambda: build_exception_message(ex),
-                        log_level=logging.ERROR,
-                        state=CallState.EXCEPTION,
-                        exc_info=True,
-                    )
-                    raise
-                else:
-                    _log(
-                        lambda: build_exit_message(result, end_time - start_time if timed else None),
-                        state=CallState.EXITING,
-                    )
-                return result
+        self.descriptor = descriptor
+        self.is_staticmethod = isinstance(unwrapped_func, staticmethod)
+        self.func: Callable[..., Any] = (
+            unwrapped_func.__func__ if isinstance(unwrapped_func, staticmethod) else unwrapped_func
+        )
+        self.level = level
+        self.prefix = prefix
+        self.condition = condition
+        self.entering = entering
+        self.exiting = exiting
+        self.exception = exception
+        self.timed = timed
+        self.log_kwargs = log_kwargs
+        self.skip_first_arg = _get_callable_has_self_or_cls_parameter(unwrapped_func)
+        self.counter = itertools.count()
+        self._name: Optional[str] = None
 
-            return _wrapper
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            self._name = self.descriptor._get_call_name(self.func)
+        return self._name
 
-        def _empty__decorator(func: _F) -> Callable[[_F], _F]:
-            return func
+    def _log(self, msg: Callable[[], str], level: Optional[int] = None, **kwargs: Any) -> None:
+        self.descriptor.log(
+            self.level if level is None else level,
+            msg,
+            stacklevel=5,
+            **{**self.log_kwargs, **kwargs},
+        )
 
-        if _func is None:
-            return cast(
-                Callable[[_F], _F],
-                _decorator if type(self)._call_tracing_enabled else _empty__decorator,
+    def _state_prefix(self, state: str) -> str:
+        return f"{state} " if state != "entering" or self.exiting else ""
+
+    def trace(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        descriptor = self.descriptor
+        if not descriptor._trace_calls_resolved:
+            descriptor._resolve_call_tracing()
+
+        if (
+            not descriptor._trace_calls
+            or not descriptor.is_enabled_for(self.level)
+            or (descriptor._trace_calls_sample_rate > 1 and next(self.counter) % descriptor._trace_calls_sample_rate)
+            or (self.condition is not None and not self.condition(*args, **kwargs))
+        ):
+            return self.func(*args, **kwargs)
+
+        if self.entering:
+            message_args = args[1:] if self.skip_first_arg else args
+            self._log(
+                lambda: "{0}{1}{2}({3}{4}{5})".format(
+                    self._state_prefix("entering"),
+                    self.prefix,
+                    self.name,
+                    ", ".join(_repr(a) for a in message_args),
+                    (", " if len(message_args) > 0 and len(kwargs) > 0 else ""),
+                    ", ".join(f"{k!s}={_repr(v)}" for k, v in kwargs.items()),
+                )
+            )
+
+        start_time = time.perf_counter() if self.timed else 0.0
+        try:
+            result = self.func(*args, **kwargs)
+        except BaseException as e:
+            if self.exception:
+                ex = e
+                self._log(
+                    lambda: f"exception {self.prefix}{self.name}(...) -> {type(ex).__qualname__}: {ex}",
+                    logging.ERROR,
+                    exc_info=True,
+                )
+            raise
+
+        if self.exiting:
+            duration = time.perf_counter() - start_time if self.timed else None
+            self._log(
+                lambda: "exiting {0}{1}(...) -> {2}{3}".format(
+                    self.prefix,
+                    self.name,
+                    _repr(result),
+                    f" duration: {duration}" if duration is not None else "",
+                )
             )
 
-        return _decorator(_func) if type(self)._call_tracing_enabled else _empty__decorator(_func)
+        return result
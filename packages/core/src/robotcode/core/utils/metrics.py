@@ -0,0 +1,231 @@
+import bisect
+import dataclasses
+import json
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+HISTOGRAM_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.002,
+    0.005,
+    0.01,
+    0.02,
+    0.05,
+    0.1,
+    0.2,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = HISTOGRAM_BUCKETS) -> None:
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._counts: List[int] = [0] * (len(buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            self.count += 1
+            self.total += value
+            self._counts[index] += 1
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Returns the upper bound of the bucket that contains the given percentile."""
+        with self._lock:
+            if self.count == 0:
+                return None
+
+            rank = self.count * p / 100
+            current = 0
+            for i, c in enumerate(self._counts):
+                current += c
+                if current >= rank:
+                    return self.buckets[i] if i < len(self.buckets) else self.max
+
+            return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            result: Dict[str, Any] = {
+                "count": self.count,
+                "total": self.total,
+                "mean": self.total / self.count if self.count else None,
+                "min": self.min,
+                "max": self.max,
+            }
+
+        result["p50"] = self.percentile(50)
+        result["p95"] = self.percentile(95)
+        result["p99"] = self.percentile(99)
+        result["buckets"] = {
+            **{f"<={b}": c for b, c in zip(self.buckets, counts) if c},
+            **({"+Inf": counts[-1]} if counts[-1] else {}),
+        }
+        return result
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram) -> None:
+        self._histogram = histogram
+        self._start = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+def _to_json_value(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _to_json_value(dataclasses.asdict(value))
+    if isinstance(value, dict):
+        return {str(k): _to_json_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_to_json_value(v) for v in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+class Metrics:
+    """Collects latency histograms, counters and gauges.
+
+    Collecting is disabled by default. As long as it is disabled, `timer` returns a shared no-op context manager and
+    `observe`/`increment` return immediately, so instrumenting hot paths costs only one attribute check.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.dump_file: Optional[Path] = None
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Dict[str, int] = {}
+        self._gauges: Dict[str, Callable[[], Any]] = {}
+        self._started = time.time()
+
+    def _get_histogram(self, name: str) -> Histogram:
+        result = self._histograms.get(name)
+        if result is None:
+            with self._lock:
+                result = self._histograms.get(name)
+                if result is None:
+                    result = self._histograms[name] = Histogram()
+        return result
+
+    def timer(self, name: str) -> Union[_Timer, _NullTimer]:
+        if not self.enabled:
+            return _NULL_TIMER
+
+        return _Timer(self._get_histogram(name))
+
+    def observe(self, name: str, value: float) -> None:
+        if not self.enabled:
+            return
+
+        self._get_histogram(name).observe(value)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def register_gauge(self, name: str, func: Callable[[], Any]) -> None:
+        with self._lock:
+            self._gauges[name] = func
+
+    def unregister_gauge(self, name: str) -> None:
+        with self._lock:
+            self._gauges.pop(name, None)
+
+    def get_histogram(self, name: str) -> Optional[Histogram]:
+        return self._histograms.get(name)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._started = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            histograms = dict(self._histograms)
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+
+        gauge_values: Dict[str, Any] = {}
+        for name, func in sorted(gauges.items()):
+            try:
+                gauge_values[name] = _to_json_value(func())
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as e:
+                gauge_values[name] = f"error: {e}"
+
+        return {
+            "enabled": self.enabled,
+            "uptime": time.time() - self._started,
+            "histograms": {k: v.to_dict() for k, v in sorted(histograms.items())},
+            "counters": dict(sorted(counters.items())),
+            "gauges": gauge_values,
+        }
+
+    def dump(self, path: Optional[Path] = None) -> Optional[Path]:
+        path = path or self.dump_file
+        if path is None:
+            return None
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.snapshot(), indent=2), "utf-8")
+        return path
+
+
+metrics = Metrics()
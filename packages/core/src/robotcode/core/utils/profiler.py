@@ -0,0 +1,214 @@
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+from typing import Dict, List, Optional, Tuple
+
+from .logging import LoggingDescriptor
+
+_logger = LoggingDescriptor(name=__name__)
+
+DEFAULT_SAMPLE_INTERVAL = 0.005
+PROFILES_DIR = Path(".robotcode_cache", "profiles")
+
+_FrameKey = Tuple[str, int, str]
+
+
+@dataclass
+class ProfileResult:
+    samples: int
+    duration: float
+    collapsed_file: Path
+    pstats_file: Path
+
+
+def _format_frame(frame: _FrameKey) -> str:
+    return f"{frame[2]} ({frame[0]}:{frame[1]})"
+
+
+class StackSampler:
+    """A low overhead sampling profiler.
+
+    Samples the python stacks of all threads in a fixed interval and writes the result as collapsed stacks, which
+    can be viewed with flame graph tools like speedscope, and as a `pstats` compatible file.
+    """
+
+    def __init__(self, output_dir: Path, interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        self.output_dir = output_dir
+        self.interval = interval
+        self.samples = 0
+        self.result: Optional[ProfileResult] = None
+        self._stacks: Counter[Tuple[str, Tuple[_FrameKey, ...]]] = Counter()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_time = 0.0
+        self._duration = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, duration: Optional[float] = None) -> None:
+        if self._thread is not None:
+            raise RuntimeError("Profiler already started.")
+
+        self._start_time = time.monotonic()
+        self._thread = threading.Thread(target=self._run, args=(duration,), name="RobotCode Profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Optional[ProfileResult]:
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+        return self.result
+
+    def _run(self, duration: Optional[float]) -> None:
+        own_id = threading.get_ident()
+        deadline = self._start_time + duration if duration is not None else None
+
+        while not self._stop_event.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+
+                stack: List[_FrameKey] = []
+                f: Optional[FrameType] = frame
+                while f is not None:
+                    code = f.f_code
+                    stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                    f = f.f_back
+                stack.reverse()
+
+                self._stacks[(names.get(thread_id, str(thread_id)), tuple(stack))] += 1
+
+            self.samples += 1
+
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+        self._duration = time.monotonic() - self._start_time
+
+        try:
+            self.result = self._write_result()
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            _logger.exception(e)
+
+    def _write_result(self) -> ProfileResult:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        name = f"profile-{os.getpid()}-{time.strftime('%Y%m%d-%H%M%S')}"
+        collapsed_file = self.output_dir / f"{name}.collapsed"
+        pstats_file = self.output_dir / f"{name}.pstats"
+
+        self.write_collapsed(collapsed_file)
+        self.write_pstats(pstats_file)
+
+        _logger.info(lambda: f"Profile with {self.samples} samples written to {collapsed_file} and {pstats_file}")
+
+        return ProfileResult(self.samples, self._duration, collapsed_file, pstats_file)
+
+    def write_collapsed(self, path: Path) -> None:
+        with path.open("w", encoding="utf-8") as f:
+            for (thread_name, stack), count in sorted(self._stacks.items()):
+                f.write(";".join([thread_name, *(_format_frame(frame) for frame in stack)]))
+                f.write(f" {count}\n")
+
+    def write_pstats(self, path: Path) -> None:
+        # pstats expects {func: (primitive calls, calls, own time, cumulative time, {caller: (...)})},
+        # samples are counted as calls and weighted with the average time between two samples
+        sample_time = self._duration / self.samples if self.samples else self.interval
+
+        stats: Dict[_FrameKey, List[float]] = {}
+        callers: Dict[_FrameKey, Dict[_FrameKey, List[float]]] = {}
+
+        for (_, stack), count in self._stacks.items():
+            if not stack:
+                continue
+
+            elapsed = count * sample_time
+
+            for frame in set(stack):
+                entry = stats.setdefault(frame, [0, 0, 0.0, 0.0])
+                entry[0] += count
+                entry[1] += count
+                entry[3] += elapsed
+
+            stats[stack[-1]][2] += elapsed
+
+            for caller, callee in set(zip(stack, stack[1:])):
+                caller_entry = callers.setdefault(callee, {}).setdefault(caller, [0, 0, 0.0, 0.0])
+                caller_entry[0] += count
+                caller_entry[1] += count
+                caller_entry[3] += elapsed
+            if len(stack) > 1:
+                callers[stack[-1]][stack[-2]][2] += elapsed
+
+        with path.open("wb") as f:
+            marshal.dump(
+                {
+                    frame: (
+                        int(entry[0]),
+                        int(entry[1]),
+                        entry[2],
+                        entry[3],
+                        {c: (int(v[0]), int(v[1]), v[2], v[3]) for c, v in callers.get(frame, {}).items()},
+                    )
+                    for frame, entry in stats.items()
+                },
+                f,
+            )
+
+
+_current: Optional[StackSampler] = None
+_current_lock = threading.Lock()
+
+
+def is_profiling() -> bool:
+    with _current_lock:
+        return _current is not None and _current.is_running
+
+
+def get_profiling_output_dir(base_path: Optional[Path] = None) -> Path:
+    """Returns the directory for the profiler output, `.robotcode_cache/profiles` in the given path or the
+    current working directory."""
+    return Path(base_path or Path.cwd(), PROFILES_DIR).absolute()
+
+
+def start_profiling(
+    output_dir: Path, duration: Optional[float] = None, interval: float = DEFAULT_SAMPLE_INTERVAL
+) -> bool:
+    global _current
+
+    with _current_lock:
+        if _current is not None and _current.is_running:
+            return False
+
+        _logger.info(lambda: f"start profiling, output is written to {output_dir}")
+
+        _current = StackSampler(output_dir, interval)
+        _current.start(duration)
+
+        return True
+
+
+def stop_profiling() -> Optional[ProfileResult]:
+    global _current
+
+    with _current_lock:
+        sampler = _current
+        _current = None
+
+    if sampler is None:
+        return None
+
+    return sampler.stop()
@@ -1,9 +1,12 @@
 import asyncio
+from pathlib import Path
 from typing import Optional, Sequence, Tuple
 
 import click
 
 from robotcode.core.types import ServerMode
+from robotcode.core.utils.cli import show_hidden_arguments
+from robotcode.core.utils.profiler import get_profiling_output_dir, start_profiling, stop_profiling
 from robotcode.plugin import Application, UnknownError, pass_application
 from robotcode.plugin.click_helper.options import (
     resolve_server_options,
@@ -12,6 +15,7 @@ from robotcode.plugin.click_helper.options import (
 from robotcode.plugin.click_helper.types import AddressesPort, add_options
 
 from .__version__ import __version__
+from .warm_pool import WARM_POOL_IDLE_TIMEOUT
 
 DEBUGGER_DEFAULT_PORT = 6612
 DEBUGPY_DEFAULT_PORT = 5678
@@ -103,6 +107,15 @@ DEBUGPY_DEFAULT_PORT = 5678
     help="Fold/group messages or log messages.",
     show_default=True,
 )
+@click.option(
+    "--profile / --no-profile",
+    "start_profiler",
+    default=False,
+    is_flag=True,
+    help="Profile the debug session with the sampling profiler, the profile is written to "
+    "`.robotcode_cache/profiles`.",
+    show_default=True,
+)
 @add_options(
     *server_options(
         ServerMode.TCP,
@@ -135,6 +148,7 @@ def debug(
     output_timestamps: bool,
     group_output: bool,
     stop_on_entry: bool,
+    start_profiler: bool,
     robot_options_and_args: Tuple[str, ...],
 ) -> None:
     """Starts a Robot Framework debug session and waits for incomming connections."""
@@ -166,8 +180,12 @@ def debug(
     app.verbose(f"Output timestamps: {output_timestamps}")
     app.verbose(f"Group output: {group_output}")
     app.verbose(f"Stop in entry: {stop_on_entry}")
+    app.verbose(f"Profile: {start_profiler}")
     app.verbose(f"Robot options and args: {robot_options_and_args}")
 
+    if start_profiler:
+        start_profiling(get_profiling_output_dir())
+
     try:
         app.exit(
             asyncio.run(
@@ -201,3 +219,60 @@ def debug(
         app.keyboard_interrupt()
     except Exception as e:
         raise UnknownError(str(e)) from e
+    finally:
+        result = stop_profiling()
+        if result is not None:
+            app.verbose(f"Profile written to {result.collapsed_file} and {result.pstats_file}")
+
+
+@click.command(add_help_option=True, hidden=show_hidden_arguments())
+@click.option(
+    "--pool-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    required=True,
+    help="The file in which the process registers itself as idle.",
+)
+@click.option(
+    "--import",
+    "imports",
+    type=str,
+    multiple=True,
+    help="A module or library to import before waiting for a launch request. Can be specified multiple times.",
+)
+@click.option(
+    "--pythonpath",
+    "python_path",
+    type=str,
+    multiple=True,
+    help="Additional locations to add to the module search path before importing. Can be specified multiple times.",
+)
+@click.option(
+    "--idle-timeout",
+    type=float,
+    default=WARM_POOL_IDLE_TIMEOUT,
+    help="Timeout in seconds after which an unused process exits.",
+    show_default=True,
+)
+@pass_application
+def debug_warm(
+    app: Application,
+    pool_file: Path,
+    imports: Tuple[str, ...],
+    python_path: Tuple[str, ...],
+    idle_timeout: float,
+) -> None:
+    """Starts an idle debug runner with Robot Framework already imported.
+
+    The process waits until the debug launcher hands it a launch request and then runs
+    `robotcode debug` in this process. This is an internal command used by the debug launcher.
+    """
+    from .warm_pool import run_warm_process
+
+    try:
+        app.exit(run_warm_process(app, pool_file.absolute(), imports, python_path, idle_timeout))
+    except SystemExit:
+        raise
+    except KeyboardInterrupt:
+        app.keyboard_interrupt()
+    except Exception as e:
+        raise UnknownError(str(e)) from e
@@ -9,7 +9,7 @@ import reprlib
 import threading
 import time
 import weakref
-from collections import deque
+from collections import OrderedDict, deque
 from enum import Enum
 from pathlib import Path, PurePath
 from typing import (
@@ -255,6 +255,129 @@ else:
             self.steps.pop()
 
 
+# maximum number of container values the client can reference at once
+VARIABLES_REFERENCES_SIZE = 1000
+
+# maximum number of children returned for a container if the client does not request a page
+MAX_UNPAGED_VARIABLES = 1000
+
+# maximum length of the value of a single variable
+MAX_VARIABLE_VALUE_LENGTH = 1000
+
+# maximum length of all values returned in one variables response, after that only the types are shown
+VARIABLES_REPR_BUDGET = 100_000
+
+
+class VariablesReferences:
+    """Maps the variables references given to the client to container values, the least recently used
+    references are dropped if there are more than `max_size`."""
+
+    def __init__(self, max_size: int = VARIABLES_REFERENCES_SIZE) -> None:
+        self.max_size = max_size
+        self._ids = itertools.count(1)
+        self._values: OrderedDict[int, Any] = OrderedDict()
+        self._references: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, value: Any) -> int:
+        v_id = self._references.get(id(value))
+        if v_id is not None and self._values.get(v_id) is value:
+            self._values.move_to_end(v_id)
+            return v_id
+
+        v_id = next(self._ids)
+        self._values[v_id] = value
+        self._references[id(value)] = v_id
+
+        while len(self._values) > self.max_size:
+            _, removed = self._values.popitem(last=False)
+            self._references.pop(id(removed), None)
+
+        return v_id
+
+    def get(self, v_id: int) -> Any:
+        if v_id not in self._values:
+            return None
+
+        self._values.move_to_end(v_id)
+        return self._values[v_id]
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._references.clear()
+
+
+class _BoundedRepr(reprlib.Repr):
+    def __init__(self) -> None:
+        super().__init__()
+        self.maxstring = MAX_VARIABLE_VALUE_LENGTH
+        self.maxlong = MAX_VARIABLE_VALUE_LENGTH
+        self.maxother = MAX_VARIABLE_VALUE_LENGTH
+
+    def repr1(self, x: Any, level: int) -> str:
+        # subclasses like DotDict would otherwise be converted completely by their own __repr__
+        if not hasattr(self, "repr_" + type(x).__name__):
+            if isinstance(x, Mapping):
+                return self.repr_dict(cast(Dict[Any, Any], x), level)
+            if isinstance(x, Sequence) and not isinstance(x, (str, bytes)):
+                return self.repr_list(cast(List[Any], x), level)
+
+        return super().repr1(x, level)
+
+
+class ValueFormatter:
+    """Creates bounded representations of values, until the budget is used up."""
+
+    def __init__(self, budget: Optional[int] = None) -> None:
+        self.budget = budget
+
+        self._repr = _BoundedRepr()
+
+    def format(self, value: Any) -> str:
+        if self.budget is not None and self.budget <= 0:
+            size = get_container_size(value)
+            return f"<{type(value).__name__}>" if size is None else f"<{type(value).__name__} with {size} items>"
+
+        result = self._repr.repr(value)
+        if self.budget is not None:
+            self.budget -= len(result)
+
+        return result
+
+
+def get_container_size(value: Any) -> Optional[int]:
+    """Returns the number of children if the value can be expanded in the client."""
+    if isinstance(value, Mapping) or isinstance(value, Sequence) and not isinstance(value, str):
+        try:
+            return len(value)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException:
+            return None
+
+    return None
+
+
+def _changed_variables(variables: Dict[str, Any], parent: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the variables that are not defined in the parent scope or have another value there."""
+    result = {}
+    for k, v in variables.items():
+        if k in parent:
+            parent_value = parent[k]
+            try:
+                if parent_value is v or parent_value == v:
+                    continue
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException:
+                pass
+        result[k] = v
+
+    return result
+
+
 class Debugger:
     __instance: ClassVar[Optional[Debugger]] = None
     __lock: ClassVar = threading.RLock()
@@ -327,8 +450,7 @@ class Debugger:
         self.debug_logger: Optional[DebugLogger] = None
         self.run_started = False
         self._evaluate_cache: List[Any] = []
-        self._variables_cache: Dict[int, Any] = {}
-        self._variables_object_cache: List[Any] = []
+        self._variables_references = VariablesReferences()
 
     @property
     def state(self) -> State:
@@ -342,8 +464,7 @@ class Debugger:
             State.Paused,
             State.CallKeyword,
         ]:
-            self._variables_cache.clear()
-            self._variables_object_cache.clear()
+            self._variables_references.clear()
             self._evaluate_cache.clear()
 
         time.sleep(0.01)
@@ -1337,37 +1458,67 @@ class Debugger:
 
         return result
 
-    def _new_cache_id(self) -> int:
-        o = object()
-        self._variables_object_cache.append(o)
-        return id(o)
+    def _create_variable(self, name: str, value: Any, formatter: Optional[ValueFormatter] = None) -> Variable:
+        if formatter is None:
+            formatter = ValueFormatter()
 
-    def _create_variable(self, name: str, value: Any) -> Variable:
-        if isinstance(value, Mapping):
-            v_id = self._new_cache_id()
-            self._variables_cache[v_id] = value
+        size = get_container_size(value)
+        if size is not None:
             return Variable(
                 name=name,
-                value=reprlib.repr(value),
+                value=formatter.format(value),
                 type=repr(type(value)),
-                variables_reference=v_id,
-                named_variables=len(value) + 1,
-                indexed_variables=0,
+                variables_reference=self._variables_references.add(value),
+                named_variables=1,
+                indexed_variables=size,
             )
 
-        if isinstance(value, Sequence) and not isinstance(value, str):
-            v_id = self._new_cache_id()
-            self._variables_cache[v_id] = value
-            return Variable(
-                name=name,
-                value=reprlib.repr(value),
-                type=repr(type(value)),
-                variables_reference=v_id,
-                named_variables=1,
-                indexed_variables=len(value),
+        return Variable(name=name, value=formatter.format(value), type=repr(type(value)))
+
+    def _get_children(
+        self,
+        value: Any,
+        filter: Optional[Literal["indexed", "named"]],
+        start: Optional[int],
+        count: Optional[int],
+        formatter: ValueFormatter,
+    ) -> List[Variable]:
+        size = get_container_size(value)
+        if size is None:
+            return []
+
+        result: List[Variable] = []
+
+        if filter is None or filter == "named":
+            result.append(self._create_variable("len()", size, formatter))
+
+        if filter is None or filter == "indexed":
+            first = start or 0
+            last = (
+                first + count
+                if count
+                else first + MAX_UNPAGED_VARIABLES
+                if filter is None and size - first > MAX_UNPAGED_VARIABLES
+                else size
             )
 
-        return Variable(name=name, value=repr(value), type=repr(type(value)))
+            if isinstance(value, Mapping):
+                result.extend(
+                    self._create_variable(repr(k), v, formatter)
+                    for k, v in itertools.islice(value.items(), first, last)
+                )
+            else:
+                result.extend(self._create_variable(str(i), value[i], formatter) for i in range(first, min(last, size)))
+
+            if filter is None and not count and last < size:
+                result.append(
+                    self._create_variable(
+                        "Unable to handle",
+                        f"Maximum number of items ({MAX_UNPAGED_VARIABLES}) reached, request the items in pages.",
+                    )
+                )
+
+        return result
 
     def get_variables(
         self,
@@ -1377,117 +1528,76 @@ class Debugger:
         count: Optional[int] = None,
         format: Optional[ValueFormat] = None,
     ) -> List[Variable]:
-        result: MutableMapping[str, Any] = NormalizedDict(ignore="_")
-
-        if filter is None:
-            entry = next(
-                (
-                    v
-                    for v in self.stack_frames
-                    if variables_reference in [v.global_id(), v.suite_id(), v.test_id(), v.local_id()]
-                ),
-                None,
-            )
-            if entry is not None:
-                context = entry.context()
-                if context is not None:
-                    if entry.global_id() == variables_reference:
-                        result.update(
-                            {k: self._create_variable(k, v) for k, v in context.variables._global.as_dict().items()}
-                        )
-                    elif entry.suite_id() == variables_reference:
-                        globals = context.variables._global.as_dict()
-                        result.update(
-                            {
-                                k: self._create_variable(k, v)
-                                for k, v in context.variables._suite.as_dict().items()
-                                if k not in globals or globals[k] != v
-                            }
-                        )
-                    elif entry.test_id() == variables_reference:
-                        globals = context.variables._suite.as_dict()
-                        result.update(
-                            {
-                                k: self._create_variable(k, v)
-                                for k, v in context.variables._test.as_dict().items()
-                                if k not in globals or globals[k] != v
-                            }
-                        )
-                    elif entry.local_id() == variables_reference:
-                        vars = entry.get_first_or_self().variables()
-                        if vars is not None:
-                            p = entry.parent() if entry.parent else None
-
-                            globals = (
-                                (p.get_first_or_self().variables() if p is not None else None)
-                                or context.variables._test
-                                or context.variables._suite
-                                or context.variables._global
-                            ).as_dict()
-
-                            suite_vars = (context.variables._suite or context.variables._global).as_dict()
-
-                            result.update(
-                                {
-                                    k: self._create_variable(k, v)
-                                    for k, v in vars.as_dict().items()
-                                    if (k not in globals or globals[k] != v)
-                                    and (entry.handler is None or k not in suite_vars or suite_vars[k] != v)
-                                }
-                            )
+        formatter = ValueFormatter(VARIABLES_REPR_BUDGET)
 
-                            if entry.handler is not None and entry.handler.arguments:
-                                for argument in entry.handler.arguments.argument_names:
-                                    name = f"${{{argument}}}"
-                                    try:
-                                        value = vars[name]
-                                    except (SystemExit, KeyboardInterrupt):
-                                        raise
-                                    except BaseException as e:
-                                        value = str(e)
-
-                                    result[name] = self._create_variable(name, value)
-            else:
-                value = self._variables_cache.get(variables_reference, None)
-
-                if value is not None and isinstance(value, Mapping):
-                    result.update({"len()": self._create_variable("len()", len(value))})
+        entry = next(
+            (
+                v
+                for v in self.stack_frames
+                if variables_reference in [v.global_id(), v.suite_id(), v.test_id(), v.local_id()]
+            ),
+            None,
+        )
 
-                    for i, (k, v) in enumerate(value.items(), start or 0):
-                        result[repr(i)] = self._create_variable(repr(k), v)
-                        if i >= 500:
-                            result["Unable to handle"] = self._create_variable(
-                                "Unable to handle",
-                                "Maximum number of items (500) reached.",
-                            )
-                            break
+        if entry is None:
+            return self._get_children(
+                self._variables_references.get(variables_reference), filter, start, count, formatter
+            )
 
-                elif value is not None and isinstance(value, Sequence) and not isinstance(value, str):
-                    result.update({"len()": self._create_variable("len()", len(value))})
+        if filter == "indexed":
+            return []
 
-        elif filter == "indexed":
-            value = self._variables_cache.get(variables_reference, None)
+        context = entry.context()
+        if context is None:
+            return []
 
-            if value is not None:
-                c = 0
-                for i, v in enumerate(value, start or 0):
-                    result[str(i)] = self._create_variable(str(i), v)
-                    c += 1
-                    if count is not None and c >= count:
-                        break
+        scope: Dict[str, Any] = {}
+        arguments: Dict[str, Any] = {}
+
+        if entry.global_id() == variables_reference:
+            scope = context.variables._global.as_dict()
+        elif entry.suite_id() == variables_reference:
+            scope = _changed_variables(context.variables._suite.as_dict(), context.variables._global.as_dict())
+        elif entry.test_id() == variables_reference:
+            scope = _changed_variables(context.variables._test.as_dict(), context.variables._suite.as_dict())
+        elif entry.local_id() == variables_reference:
+            vars = entry.get_first_or_self().variables()
+            if vars is not None:
+                p = entry.parent() if entry.parent else None
+
+                globals = (
+                    (p.get_first_or_self().variables() if p is not None else None)
+                    or context.variables._test
+                    or context.variables._suite
+                    or context.variables._global
+                ).as_dict()
+
+                scope = _changed_variables(vars.as_dict(), globals)
+
+                if entry.handler is not None:
+                    suite_vars = (context.variables._suite or context.variables._global).as_dict()
+                    scope = _changed_variables(scope, suite_vars)
+
+                    if entry.handler.arguments:
+                        for argument in entry.handler.arguments.argument_names:
+                            name = f"${{{argument}}}"
+                            try:
+                                arguments[name] = vars[name]
+                            except (SystemExit, KeyboardInterrupt):
+                                raise
+                            except BaseException as e:
+                                arguments[name] = str(e)
 
-        elif filter == "named":
-            value = self._variables_cache.get(variables_reference, None)
+        names: MutableMapping[str, Any] = NormalizedDict(ignore="_")
+        names.update(scope)
+        names.update(arguments)
 
-            if value is not None and isinstance(value, Mapping):
-                for i, (k, v) in enumerate(value.items(), start or 0):
-                    result[repr(i)] = self._create_variable(repr(k), v)
-                    if count is not None and i >= count:
-                        break
-            elif value is not None and isinstance(value, Sequence) and not isinstance(value, str):
-                result.update({"len()": self._create_variable("len()", len(value))})
+        # the values are only formatted for the requested page
+        items = list(names.items())
+        if start or count:
+            items = items[start or 0 : (start or 0) + count if count else None]
 
-        return list(result.values())
+        return [self._create_variable(k, v, formatter) for k, v in items]
 
     IS_VARIABLE_RE: ClassVar = re.compile(r"^[$@&%]\{.*\}(\[[^\]]*\])?$")
     IS_VARIABLE_ASSIGNMENT_RE: ClassVar = re.compile(r"^[$@&%]\{.*\}=?$")
@@ -1650,29 +1760,14 @@ class Debugger:
         if len(self._evaluate_cache) > 50:
             self._evaluate_cache.pop()
 
-        if isinstance(value, Mapping):
-            v_id = self._new_cache_id()
-            self._variables_cache[v_id] = value
-            return EvaluateResult(
-                result=reprlib.repr(value),
-                type=repr(type(value)),
-                variables_reference=v_id,
-                named_variables=len(value) + 1,
-                indexed_variables=0,
-            )
-
-        if isinstance(value, Sequence) and not isinstance(value, str):
-            v_id = self._new_cache_id()
-            self._variables_cache[v_id] = value
-            return EvaluateResult(
-                result=reprlib.repr(value),
-                type=repr(type(value)),
-                variables_reference=v_id,
-                named_variables=1,
-                indexed_variables=len(value),
-            )
-
-        return EvaluateResult(result=repr(value), type=repr(type(value)))
+        variable = self._create_variable("", value)
+        return EvaluateResult(
+            result=variable.value,
+            type=variable.type,
+            variables_reference=variable.variables_reference,
+            named_variables=variable.named_variables,
+            indexed_variables=variable.indexed_variables,
+        )
 
     def run_in_robot_thread(self, kw: Callable[[], Any]) -> Any:
         with self.condition:
@@ -1707,29 +1802,14 @@ class Debugger:
         if len(self._evaluate_cache) > 50:
             self._evaluate_cache.pop()
 
-        if isinstance(value, Mapping):
-            v_id = self._new_cache_id()
-            self._variables_cache[v_id] = value
-            return SetVariableResult(
-                value=reprlib.repr(value),
-                type=repr(type(value)),
-                variables_reference=v_id,
-                named_variables=len(value) + 1,
-                indexed_variables=0,
-            )
-
-        if isinstance(value, Sequence) and not isinstance(value, str):
-            v_id = self._new_cache_id()
-            self._variables_cache[v_id] = value
-            return SetVariableResult(
-                value=reprlib.repr(value),
-                type=repr(type(value)),
-                variables_reference=v_id,
-                named_variables=1,
-                indexed_variables=len(value),
-            )
-
-        return SetVariableResult(value=repr(value), type=repr(type(value)))
+        variable = self._create_variable("", value)
+        return SetVariableResult(
+            value=variable.value,
+            type=variable.type,
+            variables_reference=variable.variables_reference or None,
+            named_variables=variable.named_variables,
+            indexed_variables=variable.indexed_variables,
+        )
 
     def set_variable(
         self,
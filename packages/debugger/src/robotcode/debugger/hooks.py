@@ -4,10 +4,10 @@ import click
 
 from robotcode.plugin import hookimpl
 
-from .cli import debug
+from .cli import debug, debug_warm
 from .launcher.cli import debug_launch
 
 
 @hookimpl
 def register_cli_commands() -> List[click.Command]:
-    return [debug, debug_launch]
+    return [debug, debug_launch, debug_warm]
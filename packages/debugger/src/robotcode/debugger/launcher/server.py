@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
 from robotcode.core.types import ServerMode, TcpParams
+from robotcode.core.utils.dataclasses import as_json, from_json
 from robotcode.core.utils.logging import LoggingDescriptor
 from robotcode.jsonrpc2.protocol import rpc_method
 from robotcode.jsonrpc2.server import JsonRPCServer
@@ -40,6 +41,15 @@ from ..dap_types import (
     TerminateRequest,
 )
 from ..protocol import DebugAdapterProtocol
+from ..warm_pool import (
+    WARM_POOL_ORDER_TIMEOUT,
+    WarmOrder,
+    WarmReply,
+    claim_warm_process,
+    get_warm_pool_file,
+    get_warm_pool_key,
+    spawn_warm_process,
+)
 from .client import DAPClient, DAPClientError
 
 
@@ -68,6 +78,7 @@ class LauncherDebugAdapterProtocol(DebugAdapterProtocol):
 
         self._client: Optional[DAPClient] = None
         self._process: Optional[asyncio.subprocess.Process] = None
+        self._warm_output_task: Optional[asyncio.Task[None]] = None
         self._initialize_arguments: Optional[InitializeRequestArguments] = None
 
     @property
@@ -169,6 +180,9 @@ class LauncherDebugAdapterProtocol(DebugAdapterProtocol):
         include: Optional[List[str]] = None,
         exclude: Optional[List[str]] = None,
         robotCodeArgs: Optional[List[str]] = None,  # noqa: N803
+        warmPool: Optional[bool] = False,  # noqa: N803
+        warmPoolImports: Optional[List[str]] = None,  # noqa: N803
+        warmPoolIdleTimeout: Optional[float] = None,  # noqa: N803
         arguments: Optional[LaunchRequestArguments] = None,
         *_args: Any,
         **_kwargs: Any,
@@ -274,15 +288,27 @@ class LauncherDebugAdapterProtocol(DebugAdapterProtocol):
         if run_args:
             run_args.insert(0, "--")
 
-        env = {k: ("" if v is None else str(v)) for k, v in env.items()} if env else {}
+        launch_env: Dict[str, str] = {k: ("" if v is None else str(v)) for k, v in env.items()} if env else {}
+
+        command = [python or sys.executable, *debugger_script]
+        warm_pool_file: Optional[Path] = None
+        if warmPool:
+            warm_pool_file = get_warm_pool_file(
+                Path(cwd).absolute(),
+                get_warm_pool_key(command[0], command[1:], launch_env, warmPoolImports or [], robotPythonPath or []),
+            )
 
-        if console in ["integratedTerminal", "externalTerminal"]:
+        if warm_pool_file is not None and await self._launch_warm(
+            warm_pool_file, cwd, launch_env, [*robotcode_run_args[len(command) :], *run_args], connect_timeout
+        ):
+            pass
+        elif console in ["integratedTerminal", "externalTerminal"]:
             await self.send_request_async(
                 RunInTerminalRequest(
                     arguments=RunInTerminalRequestArguments(
                         cwd=cwd,
                         args=[*robotcode_run_args, *run_args],
-                        env=env,
+                        env={**launch_env},
                         kind=RunInTerminalKind.INTEGRATED
                         if console == "integratedTerminal"
                         else RunInTerminalKind.EXTERNAL
@@ -295,7 +321,7 @@ class LauncherDebugAdapterProtocol(DebugAdapterProtocol):
             )
         elif console is None or console == "internalConsole":
             run_env: Dict[str, Optional[str]] = dict(os.environ)
-            run_env.update(env)
+            run_env.update(launch_env)
 
             await asyncio.get_event_loop().subprocess_exec(
                 lambda: OutputProtocol(self), *run_args, cwd=cwd, env=run_env
@@ -304,6 +330,11 @@ class LauncherDebugAdapterProtocol(DebugAdapterProtocol):
         else:
             raise ValueError(f'Unknown console type "{console}".')
 
+        if warm_pool_file is not None:
+            self._spawn_warm(
+                command, warm_pool_file, cwd, launch_env, warmPoolImports, robotPythonPath, warmPoolIdleTimeout
+            )
+
         self.client = DAPClient(self, TcpParams(None, port))
         self.client.on_closed.add(self._client_on_closed)
         try:
@@ -321,6 +352,95 @@ class LauncherDebugAdapterProtocol(DebugAdapterProtocol):
         if self._initialize_arguments is not None:
             await self.client.protocol.send_request_async(InitializeRequest(arguments=self._initialize_arguments))
 
+    async def _launch_warm(
+        self,
+        pool_file: Path,
+        cwd: str,
+        env: Dict[str, str],
+        args: List[str],
+        timeout: float,
+    ) -> bool:
+        """Hands the launch to an idle debug runner from the warm pool, returns `False` if there is none."""
+
+        entry = claim_warm_process(pool_file)
+        if entry is None:
+            self._logger.debug(lambda: f"No warm debug process available for {pool_file}.")
+            return False
+
+        run_env = dict(os.environ)
+        run_env.update(env)
+
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", entry.port), timeout)
+
+            writer.write(
+                as_json(WarmOrder(entry.token, str(Path(cwd).absolute()), run_env, args), compact=True).encode("utf-8")
+                + b"\n"
+            )
+            await writer.drain()
+
+            reply = from_json(
+                await asyncio.wait_for(reader.readline(), WARM_POOL_ORDER_TIMEOUT),
+                WarmReply,
+            )
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            ex = e
+            self._logger.warning(lambda: f"Can't connect to warm debug process {entry.pid}: {ex}")
+            return False
+
+        if not reply.accepted:
+            self._logger.info(lambda: f"Warm debug process {entry.pid} rejected the launch: {reply.reason}")
+            writer.close()
+            return False
+
+        self._logger.info(lambda: f"Launch in warm debug process {entry.pid}.")
+
+        self._warm_output_task = asyncio.create_task(self._forward_warm_output(reader, writer))
+
+        return True
+
+    async def _forward_warm_output(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                data = await reader.read(0x10000)
+                if not data:
+                    break
+
+                self.send_event(
+                    OutputEvent(
+                        body=OutputEventBody(
+                            output=data.decode("utf-8", errors="replace"), category=OutputCategory.STDOUT
+                        )
+                    )
+                )
+        finally:
+            writer.close()
+
+    def _spawn_warm(
+        self,
+        command: List[str],
+        pool_file: Path,
+        cwd: str,
+        env: Dict[str, str],
+        imports: Optional[List[str]],
+        python_path: Optional[List[str]],
+        idle_timeout: Optional[float],
+    ) -> None:
+        run_env = dict(os.environ)
+        run_env.update(env)
+
+        try:
+            spawn_warm_process(
+                command, pool_file, Path(cwd).absolute(), run_env, imports or [], python_path or [], idle_timeout
+            )
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            ex = e
+            self._logger.warning(lambda: f"Can't start warm debug process: {ex}")
+
     def _client_on_closed(self, sender: Any) -> None:
         self._logger.info("Client closed.")
         if self.loop is not None:
@@ -0,0 +1,341 @@
+import hashlib
+import importlib
+import io
+import itertools
+import os
+import secrets
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from robotcode.core.utils.dataclasses import as_json, from_json
+from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.plugin import Application
+
+_logger = LoggingDescriptor(name=__name__)
+
+WARM_POOL_DIR = Path(".robotcode_cache", "debug_pool")
+
+# seconds an idle warm process waits for a launch request before it exits
+WARM_POOL_IDLE_TIMEOUT = 600.0
+
+# seconds to wait for the launch order after a pool file was claimed
+WARM_POOL_ORDER_TIMEOUT = 10.0
+
+PRELOAD_MODULES = [
+    "robot.running",
+    "robot.libraries.BuiltIn",
+    "robot.reporting",
+    "robotcode.runner.cli.robot",
+    "robotcode.debugger.run",
+]
+
+
+@dataclass
+class WarmPoolEntry:
+    pid: int
+    port: int
+    token: str
+
+
+@dataclass
+class WarmOrder:
+    token: str
+    cwd: str
+    env: Dict[str, str] = field(default_factory=dict)
+    args: List[str] = field(default_factory=list)
+
+
+@dataclass
+class WarmReply:
+    accepted: bool
+    reason: Optional[str] = None
+
+
+def get_warm_pool_key(
+    python: str,
+    debugger_script: Sequence[str],
+    env: Mapping[str, str],
+    imports: Sequence[str],
+    python_path: Sequence[str],
+) -> str:
+    """A warm process can only be reused by launches that would have started the same process."""
+
+    data = as_json([python, list(debugger_script), sorted(env.items()), list(imports), list(python_path)], compact=True)
+
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+
+
+def get_warm_pool_file(cwd: Path, key: str) -> Path:
+    return Path(cwd, WARM_POOL_DIR, f"{key}.json")
+
+
+def claim_warm_process(pool_file: Path) -> Optional[WarmPoolEntry]:
+    """Takes the idle process registered in `pool_file` out of the pool.
+
+    The pool file is renamed before it is read, so a warm process is handed to one launch only.
+    """
+
+    claimed_file = pool_file.with_name(f"{pool_file.stem}.{os.getpid()}.claimed")
+    try:
+        os.replace(pool_file, claimed_file)
+    except OSError:
+        return None
+
+    try:
+        return from_json(claimed_file.read_text("utf-8"), WarmPoolEntry)
+    except (SystemExit, KeyboardInterrupt):
+        raise
+    except BaseException as e:
+        ex = e
+        _logger.warning(lambda: f"Can't read warm pool file {pool_file}: {ex}")
+        return None
+    finally:
+        claimed_file.unlink(missing_ok=True)
+
+
+def spawn_warm_process(
+    command: Sequence[str],
+    pool_file: Path,
+    cwd: Path,
+    env: Mapping[str, str],
+    imports: Sequence[str],
+    python_path: Sequence[str],
+    idle_timeout: Optional[float] = None,
+) -> Optional["subprocess.Popen[bytes]"]:
+    """Starts a detached, idle debug runner for `pool_file` if there is not already one waiting."""
+
+    if pool_file.exists():
+        return None
+
+    args = [
+        *command,
+        "debug-warm",
+        "--pool-file",
+        str(pool_file),
+        *itertools.chain.from_iterable(["--import", m] for m in imports),
+        *itertools.chain.from_iterable(["--pythonpath", p] for p in python_path),
+    ]
+    if idle_timeout is not None:
+        args += ["--idle-timeout", str(idle_timeout)]
+
+    _logger.debug(lambda: f"Spawn warm debug process: {args}")
+
+    if sys.platform == "win32":
+        return subprocess.Popen(
+            args,
+            cwd=cwd,
+            env=dict(env),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+        )
+
+    return subprocess.Popen(
+        args,
+        cwd=cwd,
+        env=dict(env),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _get_module_times(cwd: Path, imports: Sequence[str]) -> Dict[str, float]:
+    """Modification times of the preloaded and the project modules, used to detect stale imports."""
+
+    result: Dict[str, float] = {}
+
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if not file:
+            continue
+
+        if name.split(".")[0] not in imports and name not in imports:
+            try:
+                Path(file).relative_to(cwd)
+            except ValueError:
+                continue
+
+        try:
+            result[file] = os.stat(file).st_mtime
+        except OSError:
+            pass
+
+    return result
+
+
+def _write_pool_file(pool_file: Path, entry: WarmPoolEntry) -> bool:
+    if pool_file.exists():
+        return False
+
+    pool_file.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_file = pool_file.with_name(f"{pool_file.stem}.{entry.pid}.tmp")
+    tmp_file.write_text(as_json(entry), "utf-8")
+    os.replace(tmp_file, pool_file)
+
+    return True
+
+
+def _owns_pool_file(pool_file: Path, entry: WarmPoolEntry) -> Optional[bool]:
+    """`None` if the pool file does not exist, otherwise if it still belongs to this process."""
+    try:
+        return from_json(pool_file.read_text("utf-8"), WarmPoolEntry).pid == entry.pid
+    except FileNotFoundError:
+        return None
+    except (SystemExit, KeyboardInterrupt):
+        raise
+    except BaseException:
+        return False
+
+
+def _send_reply(connection: socket.socket, reply: WarmReply) -> None:
+    connection.sendall(as_json(reply, compact=True).encode("utf-8") + b"\n")
+
+
+def _read_order(connection: socket.socket) -> Optional[WarmOrder]:
+    connection.settimeout(WARM_POOL_ORDER_TIMEOUT)
+    data = connection.makefile("rb").readline()
+    connection.settimeout(None)
+
+    try:
+        return from_json(data, WarmOrder)
+    except (SystemExit, KeyboardInterrupt):
+        raise
+    except BaseException:
+        return None
+
+
+def wait_for_order(
+    app: Application,
+    pool_file: Path,
+    imports: Sequence[str],
+    idle_timeout: float,
+) -> Optional[socket.socket]:
+    """Registers this process in the pool and waits until a launcher hands it a launch order.
+
+    Returns the connection to the launcher after the order was applied, or `None` if the process
+    timed out, was replaced by another warm process or its imports are outdated.
+    """
+
+    cwd = Path.cwd()
+    module_times = _get_module_times(cwd, imports)
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        listener.settimeout(1.0)
+
+        entry = WarmPoolEntry(os.getpid(), listener.getsockname()[1], secrets.token_hex(16))
+        if not _write_pool_file(pool_file, entry):
+            app.verbose(f"There is already a warm process registered in {pool_file}.")
+            return None
+
+        app.verbose(f"Wait for launch requests on port {entry.port}.")
+
+        try:
+            deadline = time.monotonic() + idle_timeout
+            missing_since: Optional[float] = None
+
+            while True:
+                try:
+                    connection, _ = listener.accept()
+                except socket.timeout:
+                    owns = _owns_pool_file(pool_file, entry)
+                    if owns is False:
+                        return None
+
+                    if owns is None:
+                        # the file was claimed by a launcher, give it some time to connect
+                        if missing_since is None:
+                            missing_since = time.monotonic()
+                        elif time.monotonic() - missing_since > WARM_POOL_ORDER_TIMEOUT:
+                            return None
+                    elif time.monotonic() > deadline:
+                        return None
+
+                    continue
+
+                order = _read_order(connection)
+                if order is None or order.token != entry.token:
+                    connection.close()
+                    continue
+
+                if Path(order.cwd).absolute() != cwd:
+                    reason = f"working directory changed to {order.cwd}"
+                elif _get_module_times(cwd, imports) != module_times:
+                    reason = "preloaded modules changed"
+                else:
+                    reason = None
+
+                _send_reply(connection, WarmReply(reason is None, reason))
+
+                if reason is not None:
+                    app.verbose(f"Reject launch request: {reason}.")
+                    connection.close()
+                    return None
+
+                os.environ.clear()
+                os.environ.update(order.env)
+                sys.argv = ["robotcode", *order.args]
+
+                return connection
+        finally:
+            if _owns_pool_file(pool_file, entry):
+                pool_file.unlink(missing_ok=True)
+
+
+def run_warm_process(
+    app: Application,
+    pool_file: Path,
+    imports: Sequence[str],
+    python_path: Sequence[str],
+    idle_timeout: float,
+) -> int:
+    for p in reversed(python_path):
+        if p not in sys.path:
+            sys.path.insert(0, str(Path(p).absolute()))
+
+    for name in [*PRELOAD_MODULES, *imports]:
+        try:
+            importlib.import_module(name)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            app.warning(f"Can't preload module {name}: {e}")
+
+    connection = wait_for_order(app, pool_file, imports, idle_timeout)
+    if connection is None:
+        return 0
+
+    with connection:
+        output: Any = io.TextIOWrapper(
+            connection.makefile("wb"), encoding="utf-8", errors="replace", line_buffering=True, write_through=True
+        )
+
+        streams = (sys.stdout, sys.stderr, sys.__stdout__, sys.__stderr__)
+
+        # robot writes its console output to sys.__stdout__
+        sys.stdout = sys.stderr = output
+        setattr(sys, "__stdout__", output)
+        setattr(sys, "__stderr__", output)
+
+        from robotcode.cli import robotcode
+
+        try:
+            robotcode.main(args=sys.argv[1:], prog_name="robotcode")
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 0 if e.code is None else 1
+        finally:
+            output.flush()
+
+            sys.stdout, sys.stderr = streams[0], streams[1]
+            setattr(sys, "__stdout__", streams[2])
+            setattr(sys, "__stderr__", streams[3])
@@ -6,6 +6,7 @@ import inspect
 import json
 import re
 import threading
+import time
 import weakref
 from abc import ABC, abstractmethod
 from collections import OrderedDict
@@ -17,6 +18,7 @@ from typing import (
     Dict,
     Final,
     Generic,
+    Hashable,
     Iterator,
     List,
     Mapping,
@@ -33,11 +35,12 @@ from typing import (
 )
 
 from robotcode.core.async_tools import run_coroutine_in_thread
-from robotcode.core.concurrent import Task, run_as_task
+from robotcode.core.concurrent import Task, TaskPriority, run_as_task, run_as_task_with_priority
 from robotcode.core.event import event
 from robotcode.core.utils.dataclasses import as_json, from_dict
 from robotcode.core.utils.inspect import ensure_coroutine, iter_methods
 from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.core.utils.metrics import metrics
 
 __all__ = [
     "JsonRPCErrors",
@@ -78,6 +81,8 @@ class JsonRPCErrors:
 
 PROTOCOL_VERSION = "2.0"
 
+NOTIFICATION_COALESCE_DELAY = 0.05
+
 
 @dataclass
 class JsonRPCMessage:
@@ -363,14 +368,23 @@ class ReceivedRequestEntry:
         future: asyncio.Future[Any],
         request: JsonRPCRequest,
         cancelable: bool,
+        start_time: Optional[float] = None,
     ) -> None:
         self.future = future
         self.request = request
         self.cancelable = cancelable
+        self.start_time = start_time
         self.cancel_requested = False
+        self.cancel_error_code: int = JsonRPCErrors.REQUEST_CANCELLED
+        self.cancel_error_message = "Request canceled."
 
-    def cancel(self) -> None:
+    def cancel(self, error_code: Optional[int] = None, error_message: Optional[str] = None) -> None:
         self.cancel_requested = True
+        if error_code is not None:
+            self.cancel_error_code = error_code
+        if error_message is not None:
+            self.cancel_error_message = error_message
+
         if self.future is not None and not self.future.cancelled():
             self.future.cancel()
 
@@ -464,8 +478,14 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
         self._sended_request_count = 0
         self._received_request: OrderedDict[Union[str, int, None], ReceivedRequestEntry] = OrderedDict()
         self._received_request_lock = threading.RLock()
+        self._dropped_requests: Dict[str, int] = {}
         self._signature_cache: Dict[Callable[..., Any], inspect.Signature] = {}
         self._running_handle_message_tasks: Set[asyncio.Future[Any]] = set()
+        self._send_lock = threading.RLock()
+        self._pending_notifications_lock = threading.Lock()
+        self._pending_notifications: OrderedDict[Tuple[str, Hashable], JsonRPCNotification] = OrderedDict()
+        self._pending_notifications_scheduled = False
+        self.notification_coalesce_delay = NOTIFICATION_COALESCE_DELAY
 
     @staticmethod
     def _generate_json_rpc_messages_from_dict(
@@ -545,6 +565,14 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
 
     @__logger.call
     def send_message(self, message: JsonRPCMessage) -> None:
+        # coalesced notifications must not be overtaken by messages sent later
+        with self._send_lock:
+            if self._pending_notifications:
+                self.flush_notifications()
+
+            self._write_message(message)
+
+    def _write_message(self, message: JsonRPCMessage) -> None:
         message.jsonrpc = PROTOCOL_VERSION
 
         body = as_json(message, compact=True).encode(self.CHARSET)
@@ -590,8 +618,38 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
         return asyncio.wrap_future(self.send_request(method, params, return_type_or_converter))
 
     @__logger.call
-    def send_notification(self, method: str, params: Any) -> None:
-        self.send_message(JsonRPCNotification(method=method, params=params))
+    def send_notification(self, method: str, params: Any, coalesce_key: Optional[Hashable] = None) -> None:
+        """Sends a notification.
+
+        If a `coalesce_key` is given, the notification is delayed for a short time and is replaced by later
+        notifications with the same method and key, so only the last state is sent.
+        """
+        notification = JsonRPCNotification(method=method, params=params)
+
+        if coalesce_key is None or self._loop is None or self.notification_coalesce_delay <= 0:
+            self.send_message(notification)
+            return
+
+        with self._pending_notifications_lock:
+            self._pending_notifications[(method, coalesce_key)] = notification
+
+            if self._pending_notifications_scheduled:
+                return
+
+            self._pending_notifications_scheduled = True
+
+        loop = self._loop
+        loop.call_soon_threadsafe(loop.call_later, self.notification_coalesce_delay, self.flush_notifications)
+
+    def flush_notifications(self) -> None:
+        with self._send_lock:
+            with self._pending_notifications_lock:
+                pending = list(self._pending_notifications.values())
+                self._pending_notifications.clear()
+                self._pending_notifications_scheduled = False
+
+            for notification in pending:
+                self._write_message(notification)
 
     @__logger.call(exception=True)
     async def handle_response(self, message: JsonRPCResponse) -> None:
@@ -729,6 +787,7 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
         return args, kw_args
 
     async def handle_request(self, message: JsonRPCRequest) -> None:
+        start_time = time.perf_counter() if metrics.enabled else None
         try:
             e = self.registry.get_entry(message.method)
 
@@ -744,6 +803,9 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
 
             if not e.threaded and not e.is_coroutine:
                 self.send_response(message.id, e.method(*params[0], **params[1]))
+
+                if start_time is not None:
+                    metrics.observe(f"rpc.request.{message.method}", time.perf_counter() - start_time)
             else:
                 if e.threaded:
                     if e.is_coroutine:
@@ -753,12 +815,14 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
                             **params[1],
                         )
                     else:
-                        task = asyncio.wrap_future(run_as_task(e.method, *params[0], **params[1]))
+                        task = asyncio.wrap_future(
+                            run_as_task_with_priority(TaskPriority.HIGH, e.method, *params[0], **params[1])
+                        )
                 else:
                     task = asyncio.create_task(e.method(*params[0], **params[1]), name=message.method)
 
                 with self._received_request_lock:
-                    self._received_request[message.id] = ReceivedRequestEntry(task, message, e.cancelable)
+                    self._received_request[message.id] = ReceivedRequestEntry(task, message, e.cancelable, start_time)
 
                 task.add_done_callback(functools.partial(self._received_request_done, message))
 
@@ -777,11 +841,15 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
                 self.__logger.critical(lambda: f"unknown request {message!r}")
                 return
 
+            if entry.start_time is not None:
+                metrics.observe(f"rpc.request.{message.method}", time.perf_counter() - entry.start_time)
+
             if entry.cancel_requested:
+                metrics.increment(f"rpc.canceled.{message.method}")
                 self.__logger.debug(lambda: f"request {message!r} canceled")
                 self.send_error(
-                    JsonRPCErrors.REQUEST_CANCELLED,
-                    "Request canceled.",
+                    entry.cancel_error_code,
+                    entry.cancel_error_message,
                     id=message.id,
                 )
             else:
@@ -827,6 +895,33 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
             self.__logger.debug(lambda: f"try to cancel request {entry.request if entry is not None else ''}")
             entry.cancel()
 
+    def drop_received_requests(
+        self,
+        predicate: Callable[[JsonRPCRequest], bool],
+        error_code: int = JsonRPCErrors.REQUEST_CANCELLED,
+        error_message: str = "Request dropped.",
+    ) -> int:
+        with self._received_request_lock:
+            entries = [
+                entry
+                for entry in self._received_request.values()
+                if entry.cancelable and not entry.cancel_requested and predicate(entry.request)
+            ]
+
+            for entry in entries:
+                self._dropped_requests[entry.request.method] = self._dropped_requests.get(entry.request.method, 0) + 1
+
+        for entry in entries:
+            self.__logger.debug(lambda: f"drop request {entry.request!r}")
+            entry.cancel(error_code, error_message)
+
+        return len(entries)
+
+    @property
+    def dropped_requests(self) -> Dict[str, int]:
+        with self._received_request_lock:
+            return dict(self._dropped_requests)
+
     def cancel_all_received_request(self) -> None:
         for entry in self._received_request.values():
             entry.cancel()
@@ -838,6 +933,8 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
         if e is None or not callable(e.method):
             self.__logger.warning(lambda: f"Unknown method: {message.method}")
             return
+
+        start_time = time.perf_counter() if metrics.enabled else None
         try:
             params = self._convert_params(e.method, e.param_type, message.params)
 
@@ -861,6 +958,9 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
             raise
         except BaseException as e:
             self.__logger.exception(e)
+        finally:
+            if start_time is not None:
+                metrics.observe(f"rpc.notification.{message.method}", time.perf_counter() - start_time)
 
 
 TProtocol = TypeVar("TProtocol", bound=JsonRPCProtocol)
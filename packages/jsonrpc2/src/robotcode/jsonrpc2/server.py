@@ -1,15 +1,17 @@
 import abc
 import asyncio
+import contextlib
 import io
+import os
 import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor
 from types import TracebackType
 from typing import (
     BinaryIO,
     Callable,
     Coroutine,
     Generic,
+    List,
     Optional,
     Sequence,
     Type,
@@ -34,19 +36,81 @@ class NotSupportedError(Exception):
     pass
 
 
+STDIO_READ_BUFFER_MIN_SIZE = 64 * 1024
+STDIO_READ_BUFFER_MAX_SIZE = 4 * 1024 * 1024
+
+
 class StdOutTransportAdapter(asyncio.Transport):
     def __init__(self, rfile: BinaryIO, wfile: BinaryIO) -> None:
         super().__init__()
         self.rfile = rfile
         self.wfile = wfile
 
+        try:
+            self._read_fd: Optional[int] = rfile.fileno()
+        except (OSError, ValueError, AttributeError):
+            self._read_fd = None
+
+        self._write_condition = threading.Condition()
+        self._write_buffer: List[bytes] = []
+        self._writer: Optional[threading.Thread] = None
+        self._closing = False
+
+    def read(self, size: int) -> bytes:
+        if self._read_fd is not None:
+            return os.read(self._read_fd, size)
+
+        return cast(io.BufferedReader, self.rfile).read1(size)
+
     def close(self) -> None:
+        with self._write_condition:
+            self._closing = True
+            self._write_condition.notify()
+            writer = self._writer
+
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(5)
+
         self.rfile.close()
         self.wfile.close()
 
+    def is_closing(self) -> bool:
+        return self._closing
+
     def write(self, data: bytes) -> None:
-        self.wfile.write(data)
-        self.wfile.flush()
+        with self._write_condition:
+            if self._closing:
+                return
+
+            self._write_buffer.append(data)
+
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="stdio_writer", daemon=True)
+                self._writer.start()
+            else:
+                self._write_condition.notify()
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._write_condition:
+                while not self._write_buffer and not self._closing:
+                    self._write_condition.wait()
+
+                if not self._write_buffer:
+                    return
+
+                data = b"".join(self._write_buffer)
+                self._write_buffer.clear()
+
+            try:
+                self.wfile.write(data)
+                self.wfile.flush()
+            except (OSError, ValueError):
+                # the output is gone, drop everything that is written from now on
+                with self._write_condition:
+                    self._closing = True
+                    self._write_buffer.clear()
+                return
 
 
 class JsonRPCServer(Generic[TProtocol], abc.ABC):
@@ -67,6 +131,8 @@ class JsonRPCServer(Generic[TProtocol], abc.ABC):
         self._server: Optional[asyncio.AbstractServer] = None
 
         self._stdio_stop_event: Optional[threading.Event] = None
+        self._stdio_stop_callback: Optional[Callable[[], None]] = None
+        self._stdio_transport: Optional[StdOutTransportAdapter] = None
 
         self._in_closing = False
         self._closed = False
@@ -111,6 +177,13 @@ class JsonRPCServer(Generic[TProtocol], abc.ABC):
         if self._stdio_stop_event is not None:
             self._stdio_stop_event.set()
 
+        if self._stdio_stop_callback is not None:
+            with contextlib.suppress(RuntimeError):
+                self._stdio_stop_callback()
+
+        if self._stdio_transport is not None:
+            self._stdio_transport.close()
+
         if self._server and self._server.is_serving():
             self._server.close()
 
@@ -169,39 +242,60 @@ class JsonRPCServer(Generic[TProtocol], abc.ABC):
     def create_protocol(self) -> TProtocol:
         ...
 
-    stdio_executor: Optional[ThreadPoolExecutor] = None
-
     @_logger.call
     def start_stdio(self) -> None:
         self.mode = ServerMode.STDIO
 
-        transport = StdOutTransportAdapter(sys.__stdin__.buffer, sys.__stdout__.buffer)
+        transport = self._stdio_transport = StdOutTransportAdapter(sys.__stdin__.buffer, sys.__stdout__.buffer)
 
         protocol = self.create_protocol()
 
-        def run_io_nonblocking() -> None:
+        def run_io() -> None:
             stop_event = self._stdio_stop_event = threading.Event()
 
-            async def aio_readline(rfile: BinaryIO, protocol: asyncio.Protocol) -> None:
-                protocol.connection_made(transport)
+            async def serve_stdio() -> None:
+                done = self.loop.create_future()
+
+                def set_done() -> None:
+                    if not done.done():
+                        done.set_result(None)
 
-                def run() -> None:
-                    while not stop_event.is_set() and not rfile.closed:
-                        if cast(io.BufferedReader, rfile).peek(1):
-                            data = cast(io.BufferedReader, rfile).read1(10000)
+                def read() -> None:
+                    size = STDIO_READ_BUFFER_MIN_SIZE
+                    try:
+                        while not stop_event.is_set():
+                            try:
+                                data = transport.read(size)
+                            except (OSError, ValueError):
+                                break
+
+                            if not data:
+                                break
 
                             self.loop.call_soon_threadsafe(protocol.data_received, data)
-                        else:
-                            # no data available, wait a bit if we are not closing
-                            stop_event.wait(0.01)
 
-                with ThreadPoolExecutor(max_workers=1, thread_name_prefix="aio_readline") as stdio_executor:
-                    self._stdio_threadpool = stdio_executor
-                    await asyncio.wrap_future(stdio_executor.submit(run))
+                            if len(data) == size and size < STDIO_READ_BUFFER_MAX_SIZE:
+                                size *= 2
+                            elif len(data) < size // 4 and size > STDIO_READ_BUFFER_MIN_SIZE:
+                                size //= 2
+                    finally:
+                        with contextlib.suppress(RuntimeError):
+                            self.loop.call_soon_threadsafe(set_done)
+
+                def stop() -> None:
+                    self.loop.call_soon_threadsafe(set_done)
+
+                self._stdio_stop_callback = stop
+
+                protocol.connection_made(transport)
+
+                threading.Thread(target=read, name="stdio_reader", daemon=True).start()
+
+                await done
 
-            self.loop.run_until_complete(aio_readline(transport.rfile, protocol))
+            self.loop.run_until_complete(serve_stdio())
 
-        self._run_func = run_io_nonblocking
+        self._run_func = run_io
 
     @_logger.call
     async def start_tcp(self, host: Union[str, Sequence[str], None] = None, port: int = 0) -> None:
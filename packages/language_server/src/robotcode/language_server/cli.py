@@ -5,6 +5,8 @@ from typing import Final, Optional, Sequence, Union
 import click
 
 from robotcode.core.types import ServerMode, TcpParams
+from robotcode.core.utils.metrics import metrics
+from robotcode.core.utils.profiler import get_profiling_output_dir, start_profiling, stop_profiling
 from robotcode.plugin import Application, UnknownError, pass_application
 from robotcode.plugin.click_helper.options import (
     resolve_server_options,
@@ -51,6 +53,34 @@ def run_server(
         },
     )
 )
+@click.option(
+    "--metrics / --no-metrics",
+    "collect_metrics",
+    default=False,
+    show_default=True,
+    help="Collect request latency and analysis phase metrics, they can be queried with the `robot/metrics` request.",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the collected metrics to this file when the language server shuts down. Implies `--metrics`.",
+)
+@click.option(
+    "--profile / --no-profile",
+    "start_profiler",
+    default=False,
+    show_default=True,
+    help="Start the sampling profiler when the language server starts. The profile is written to "
+    "`.robotcode_cache/profiles` when the profiler is stopped or the server shuts down. The profiler can also "
+    "be toggled at runtime with the `robotcode.toggleProfiling` command.",
+)
+@click.option(
+    "--profile-duration",
+    type=float,
+    default=None,
+    help="Stop the profiler started with `--profile` after this number of seconds.",
+)
 @click.version_option(version=__version__, prog_name="RobotCode Language Server")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True, file_okay=False))
 @pass_application
@@ -66,12 +96,19 @@ def language_server(
     stdio: Optional[bool],
     socket: Optional[AddressesPort],
     pipe: Optional[str],
+    collect_metrics: bool,
+    metrics_file: Optional[Path],
+    start_profiler: bool,
+    profile_duration: Optional[float],
     paths: Sequence[Path],
 ) -> None:
     """Run Robot Framework Language Server."""
 
     profile: Optional[RobotBaseProfile] = None
 
+    if metrics_file is not None:
+        metrics_file = metrics_file.absolute()
+
     config_files, root_folder, _ = get_config_files(paths, app.config.config_files, verbose_callback=app.verbose)
     if root_folder:
         os.chdir(root_folder)
@@ -88,6 +125,13 @@ def language_server(
     mode, port, bind, pipe_name = resolve_server_options(
         ctx, app, mode, port, bind, pipe_name, tcp, socket, stdio, pipe, None
     )
+
+    metrics.enabled = collect_metrics or metrics_file is not None
+    metrics.dump_file = metrics_file
+
+    if start_profiler:
+        start_profiling(get_profiling_output_dir(), profile_duration)
+
     try:
         run_server(
             mode=mode,
@@ -102,3 +146,11 @@ def language_server(
         app.keyboard_interrupt()
     except Exception as e:
         raise UnknownError(str(e)) from e
+    finally:
+        stop_profiling()
+
+        if metrics.dump_file is not None:
+            try:
+                metrics.dump()
+            except OSError as e:
+                app.echo(f"Can't write metrics to {metrics.dump_file}: {e}", err=True)
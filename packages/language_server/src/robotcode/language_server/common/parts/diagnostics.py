@@ -1,3 +1,4 @@
+import concurrent.futures
 import functools
 import itertools
 import time
@@ -6,9 +7,18 @@ from concurrent.futures import CancelledError
 from dataclasses import dataclass, field
 from enum import Enum
 from threading import Event, Timer
-from typing import TYPE_CHECKING, Any, Dict, Final, List, Optional, cast
-
-from robotcode.core.concurrent import Lock, RLock, Task, check_current_task_canceled, run_as_task
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, Iterator, List, Optional, Set, Union, cast
+
+from robotcode.core.concurrent import (
+    Lock,
+    RLock,
+    Task,
+    TaskPriority,
+    check_current_task_canceled,
+    run_as_long_running_task,
+    run_as_task,
+    run_as_task_with_priority,
+)
 from robotcode.core.event import event
 from robotcode.core.lsp.types import (
     Diagnostic,
@@ -18,17 +28,24 @@ from robotcode.core.lsp.types import (
     DocumentDiagnosticReport,
     LSPErrorCodes,
     PreviousResultId,
+    ProgressParams,
     ProgressToken,
     PublishDiagnosticsParams,
     RelatedFullDocumentDiagnosticReport,
+    RelatedUnchangedDocumentDiagnosticReport,
     ServerCapabilities,
     TextDocumentIdentifier,
     WorkspaceDiagnosticParams,
     WorkspaceDiagnosticReport,
+    WorkspaceDiagnosticReportPartialResult,
+    WorkspaceDocumentDiagnosticReport,
+    WorkspaceFullDocumentDiagnosticReport,
+    WorkspaceUnchangedDocumentDiagnosticReport,
 )
 from robotcode.core.text_document import TextDocument
 from robotcode.core.uri import Uri
 from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.core.utils.metrics import metrics
 from robotcode.jsonrpc2.protocol import JsonRPCErrorException, rpc_method
 from robotcode.language_server.common.decorators import language_id_filter
 from robotcode.language_server.common.parts.protocol_part import (
@@ -55,6 +72,11 @@ class AnalysisProgressMode(Enum):
 
 WORKSPACE_URI = Uri("workspace:/")
 
+PUBLISH_DIAGNOSTICS_INTERVAL = 0.25
+
+WORKSPACE_DIAGNOSTICS_PARTIAL_RESULT_SIZE = 50
+WORKSPACE_DIAGNOSTICS_PARTIAL_RESULT_INTERVAL = 0.5
+
 
 @dataclass
 class DiagnosticsResult:
@@ -78,6 +100,15 @@ class DiagnosticsData:
     force: bool = False
     single: bool = False
     skipped_entries: bool = False
+    published_id: Optional[str] = None
+
+
+def _get_collector_name(collector: Callable[..., Any]) -> str:
+    return cast(str, getattr(collector, "__qualname__", None) or repr(collector))
+
+
+def _entry_sort_key(entry: Any) -> str:
+    return _get_collector_name(entry[0])
 
 
 class DiagnosticsProtocolPart(LanguageServerProtocolPart):
@@ -92,6 +123,8 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
         self._workspace_loaded = False
 
         self._workspace_diagnostics_task: Optional[Task[Any]] = None
+        self._load_workspace_task: Optional[Task[Any]] = None
+        self._cancel_tasks_timeout: float = 10
 
         self.parent.on_initialized.add(self.server_initialized)
 
@@ -114,13 +147,19 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
         self._current_diagnostics_task: Optional[Task[Any]] = None
         self._diagnostics_task_timeout = 300
 
+        self.collect_concurrently = True
+        self._diagnostics_collector_timeout: float = 120
+
     def server_initialized(self, sender: Any) -> None:
         if not self.client_supports_pull:
             self.parent.documents.did_open.add(self.update_document_diagnostics)
             self.parent.documents.did_change.add(self.update_document_diagnostics)
             self.parent.documents.did_save.add(self.update_document_diagnostics)
 
-        self._workspace_diagnostics_task = run_as_task(self.run_workspace_diagnostics)
+        # the workspace is loaded in the background, so diagnostics for the first documents can start
+        # before all documents are loaded
+        self._load_workspace_task = run_as_long_running_task(self._load_workspace)
+        self._workspace_diagnostics_task = run_as_long_running_task(self.run_workspace_diagnostics)
 
     def extend_capabilities(self, capabilities: ServerCapabilities) -> None:
         if (
@@ -130,7 +169,7 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
         ):
             capabilities.diagnostic_provider = DiagnosticOptions(
                 inter_file_dependencies=True,
-                workspace_diagnostics=False,
+                workspace_diagnostics=True,
                 identifier=f"robotcodelsp_{uuid.uuid4()}",
                 work_done_progress=True,
             )
@@ -194,6 +233,14 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                     self.on_workspace_loaded(self)
                     self.force_refresh_all()
 
+    def _load_workspace(self) -> None:
+        try:
+            self.ensure_workspace_loaded()
+        except (SystemExit, KeyboardInterrupt, CancelledError):
+            raise
+        except BaseException as e:
+            self._logger.exception(e)
+
     def force_refresh_all(self, refresh: bool = True) -> None:
         for doc in self.parent.documents.documents:
             self.get_diagnostics_data(doc).force = True
@@ -211,7 +258,7 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
         run_as_task(self._close_diagnostics_for_document, document)
 
     def _close_diagnostics_for_document(self, document: TextDocument) -> None:
-        if self.get_diagnostics_mode(document.uri) == DiagnosticsMode.WORKSPACE:
+        if self.client_supports_pull or self.get_diagnostics_mode(document.uri) == DiagnosticsMode.WORKSPACE:
             return
 
         try:
@@ -222,6 +269,7 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                 data.future.cancel()
         finally:
             self.publish_diagnostics(document, diagnostics=[])
+            self.get_diagnostics_data(document).published_id = None
 
     def cancel_workspace_diagnostics_task(self, sender: Any) -> None:
         if self._current_diagnostics_task is not None and not self._current_diagnostics_task.done():
@@ -230,6 +278,11 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
         if self._workspace_diagnostics_task is not None and not self._workspace_diagnostics_task.done():
             self._workspace_diagnostics_task.cancel()
 
+        load_workspace_task = self._load_workspace_task
+        if load_workspace_task is not None and not load_workspace_task.done():
+            load_workspace_task.cancel()
+            concurrent.futures.wait([load_workspace_task], timeout=self._cancel_tasks_timeout)
+
     def break_workspace_diagnostics_loop(self) -> None:
         self._break_diagnostics_loop_event.set()
         with self._current_diagnostics_task_lock(timeout=self._diagnostics_task_timeout * 2):
@@ -239,7 +292,6 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
     @_logger.call
     def run_workspace_diagnostics(self) -> None:
         self._logger.debug("start workspace diagnostics loop")
-        self.ensure_workspace_loaded()
 
         while True:
             check_current_task_canceled()
@@ -315,7 +367,8 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
 
                         try:
                             with self._current_diagnostics_task_lock:
-                                self._current_diagnostics_task = run_as_task(
+                                self._current_diagnostics_task = run_as_task_with_priority(
+                                    TaskPriority.LOW,
                                     self.analyze,
                                     self,
                                     document,
@@ -406,7 +459,8 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                                     document,
                                     False,
                                     False,
-                                    mode == DiagnosticsMode.WORKSPACE or document.opened_in_editor,
+                                    not self.client_supports_pull
+                                    and (mode == DiagnosticsMode.WORKSPACE or document.opened_in_editor),
                                 )
                             self._current_diagnostics_task.result(300)
                         except CancelledError:
@@ -423,6 +477,9 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
 
                 if not done_something:
                     check_current_task_canceled(1)
+                elif self.client_supports_pull:
+                    # pulling clients have to be told that there are new results
+                    self.refresh()
 
                 self._logger.debug(
                     lambda: f"collecting workspace diagnostics for {len(documents_to_collect)} "
@@ -461,7 +518,8 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                 future.cancel()
 
             data.version = document.version
-            data.future = run_as_task(
+            data.future = run_as_task_with_priority(
+                TaskPriority.NORMAL if document.opened_in_editor else TaskPriority.LOW,
                 self._get_diagnostics_for_document,
                 document,
                 data,
@@ -475,6 +533,68 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
 
         return data.future
 
+    def _run_collector(self, collector: Callable[..., Any], document: TextDocument) -> Any:
+        if not metrics.enabled:
+            return collector(self, document)
+
+        with metrics.timer(f"phase.collect.{_get_collector_name(collector)}"):
+            return collector(self, document)
+
+    def _collect_diagnostics(self, document: TextDocument) -> Iterator[Union[DiagnosticsResult, BaseException, None]]:
+        callback_filter = language_id_filter(document)
+        collectors = sorted((c for c in self.collect if callback_filter(c)), key=_get_collector_name)
+
+        if not self.collect_concurrently or len(collectors) < 2:
+            for collector in collectors:
+                try:
+                    yield self._run_collector(collector, document)
+                except BaseException as e:
+                    yield e
+            return
+
+        # each collector has its own time budget, counted from the moment it starts running
+        started: Dict[Callable[..., Any], float] = {}
+
+        def run(collector: Callable[..., Any]) -> Any:
+            started[collector] = time.monotonic()
+            return self._run_collector(collector, document)
+
+        tasks: Dict[concurrent.futures.Future[Any], Callable[..., Any]] = {
+            run_as_task(run, collector): collector for collector in collectors
+        }
+        pending: Set[concurrent.futures.Future[Any]] = set(tasks.keys())
+        try:
+            while pending:
+                check_current_task_canceled()
+
+                now = time.monotonic()
+                for task in [
+                    t for t in pending if now - started.get(tasks[t], now) > self._diagnostics_collector_timeout
+                ]:
+                    collector = tasks[task]
+                    self._logger.warning(
+                        lambda: f"Diagnostics collector {_get_collector_name(collector)} for {document} "
+                        f"exceeded its time budget of {self._diagnostics_collector_timeout}s"
+                    )
+                    task.cancel()
+                    pending.discard(task)
+
+                if not pending:
+                    break
+
+                done, pending = concurrent.futures.wait(
+                    pending, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    try:
+                        yield task.result()
+                    except BaseException as e:
+                        yield e
+        finally:
+            for task in pending:
+                task.cancel()
+
     @_logger.call
     def _get_diagnostics_for_document(
         self,
@@ -490,13 +610,11 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
 
         data.skipped_entries = False
         collected_keys: List[Any] = []
+        start_time = time.perf_counter() if metrics.enabled else None
+        last_publish = time.monotonic()
+        completed = False
         try:
-            for result in self.collect(
-                self,
-                document,
-                callback_filter=language_id_filter(document),
-                return_exceptions=True,
-            ):
+            for result in self._collect_diagnostics(document):
                 check_current_task_canceled()
 
                 if isinstance(result, BaseException):
@@ -506,7 +624,6 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                 if result is None:
                     continue
 
-                data.id = str(uuid.uuid4())
                 if result.skipped:
                     data.skipped_entries = True
 
@@ -520,22 +637,48 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                                 r.location.range = doc.range_to_utf16(r.location.range)
 
                 if not result.skipped:
+                    # the result id only changes if the diagnostics changed, so pulling clients get an
+                    # `unchanged` report otherwise
+                    if result.key not in data.entries or data.entries[result.key] != result.diagnostics:
+                        data.id = str(uuid.uuid4())
+
                     data.entries[result.key] = result.diagnostics
 
                 if result.diagnostics is not None:
                     collected_keys.append(result.key)
 
-                if data.entries and send_diagnostics:
-                    self.publish_diagnostics(
-                        document,
-                        diagnostics=[l for l in itertools.chain(*[i for i in data.entries.values() if i is not None])],
-                    )
+                # results of collectors that are finished early are published, if the others take longer
+                if send_diagnostics and time.monotonic() - last_publish >= PUBLISH_DIAGNOSTICS_INTERVAL:
+                    self._publish_collected_diagnostics(document, data)
+                    last_publish = time.monotonic()
 
+            completed = True
         except CancelledError:
             self._logger.debug(lambda: f"_get_diagnostics cancelled for {document}")
         finally:
             for k in set(data.entries.keys()) - set(collected_keys):
                 data.entries.pop(k)
+                data.id = str(uuid.uuid4())
+
+            if completed and send_diagnostics:
+                self._publish_collected_diagnostics(document, data)
+
+            if start_time is not None:
+                metrics.observe("phase.collect", time.perf_counter() - start_time)
+
+    @staticmethod
+    def get_collected_diagnostics(data: DiagnosticsData) -> List[Diagnostic]:
+        return list(
+            itertools.chain(*[i for _, i in sorted(data.entries.items(), key=_entry_sort_key) if i is not None])
+        )
+
+    def _publish_collected_diagnostics(self, document: TextDocument, data: DiagnosticsData) -> None:
+        # the id changes only if the collected diagnostics changes, so there is nothing new to send if it is the same
+        if data.published_id == data.id:
+            return
+
+        data.published_id = data.id
+        self.publish_diagnostics(document, diagnostics=self.get_collected_diagnostics(data))
 
     def publish_diagnostics(self, document: TextDocument, diagnostics: List[Diagnostic]) -> None:
         self.parent.send_notification(
@@ -545,6 +688,7 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                 version=document.version,
                 diagnostics=diagnostics,
             ),
+            coalesce_key=document.document_uri,
         )
 
     def _update_document_diagnostics(self, document: TextDocument) -> None:
@@ -578,9 +722,13 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                     f"Document {text_document!r} not found.",
                 )
 
-            self.create_document_diagnostics_task(document, True).result(300)
+            self.create_document_diagnostics_task(document, True, send_diagnostics=False).result(300)
+
+            data = self.get_diagnostics_data(document)
+            if previous_result_id is not None and previous_result_id == data.id:
+                return RelatedUnchangedDocumentDiagnosticReport(data.id)
 
-            return RelatedFullDocumentDiagnosticReport([])
+            return RelatedFullDocumentDiagnosticReport(self.get_collected_diagnostics(data), result_id=data.id)
         except CancelledError:
             self._logger.debug("canceled _text_document_diagnostic")
             raise
@@ -606,7 +754,68 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
     ) -> WorkspaceDiagnosticReport:
         self._logger.debug("workspace/diagnostic")
 
-        return WorkspaceDiagnosticReport(items=[])
+        self.ensure_workspace_loaded()
+
+        previous_ids = {p.uri: p.value for p in previous_result_ids}
+
+        result: List[WorkspaceDocumentDiagnosticReport] = []
+        last_partial_result = time.monotonic()
+
+        for document in self.parent.documents.documents:
+            check_current_task_canceled()
+
+            # diagnostics for open documents are pulled with `textDocument/diagnostic`
+            if document.opened_in_editor or self.get_diagnostics_mode(document.uri) != DiagnosticsMode.WORKSPACE:
+                continue
+
+            try:
+                self.create_document_diagnostics_task(document, False, False, False).result(
+                    self._diagnostics_task_timeout
+                )
+            except CancelledError:
+                check_current_task_canceled()
+                continue
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as e:
+                ex = e
+                self._logger.exception(lambda: f"Error getting diagnostics for {document}: {ex}", exc_info=ex)
+                continue
+
+            result.append(self._create_workspace_document_report(document, previous_ids.get(document.document_uri)))
+
+            if partial_result_token is not None and (
+                len(result) >= WORKSPACE_DIAGNOSTICS_PARTIAL_RESULT_SIZE
+                or time.monotonic() - last_partial_result >= WORKSPACE_DIAGNOSTICS_PARTIAL_RESULT_INTERVAL
+            ):
+                self._send_workspace_diagnostics_partial_result(partial_result_token, result)
+                result = []
+                last_partial_result = time.monotonic()
+
+        if partial_result_token is not None and result:
+            self._send_workspace_diagnostics_partial_result(partial_result_token, result)
+            result = []
+
+        return WorkspaceDiagnosticReport(items=result)
+
+    def _create_workspace_document_report(
+        self, document: TextDocument, previous_result_id: Optional[str]
+    ) -> WorkspaceDocumentDiagnosticReport:
+        data = self.get_diagnostics_data(document)
+
+        if previous_result_id is not None and previous_result_id == data.id:
+            return WorkspaceUnchangedDocumentDiagnosticReport(document.document_uri, data.id, document.version)
+
+        return WorkspaceFullDocumentDiagnosticReport(
+            document.document_uri, self.get_collected_diagnostics(data), document.version, result_id=data.id
+        )
+
+    def _send_workspace_diagnostics_partial_result(
+        self, token: ProgressToken, items: List[WorkspaceDocumentDiagnosticReport]
+    ) -> None:
+        self.parent.send_notification(
+            "$/progress", ProgressParams(token, WorkspaceDiagnosticReportPartialResult(items))
+        )
 
     def get_analysis_progress_mode(self, uri: Uri) -> AnalysisProgressMode:
         for e in self.on_get_analysis_progress_mode(self, uri):
@@ -148,6 +148,7 @@ class TextDocumentProtocolPart(LanguageServerProtocolPart):
         path: Union[str, os.PathLike[Any]],
         language_id: Optional[str] = None,
         version: Optional[int] = None,
+        text: Optional[str] = None,
     ) -> TextDocument:
         uri = Uri.from_path(path).normalized()
 
@@ -159,7 +160,7 @@ class TextDocumentProtocolPart(LanguageServerProtocolPart):
             return self.append_document(
                 document_uri=DocumentUri(uri),
                 language_id=language_id or self.detect_language_id(path),
-                text=self.read_document_text(uri, language_id),
+                text=text if text is not None else self.read_document_text(uri, language_id),
                 version=version,
             )
         except (SystemExit, KeyboardInterrupt):
@@ -179,6 +180,10 @@ class TextDocumentProtocolPart(LanguageServerProtocolPart):
     def did_create(sender, document: TextDocument) -> None:
         ...
 
+    @event
+    def did_append(sender, document: TextDocument) -> None:
+        ...
+
     @event
     def did_open(sender, document: TextDocument) -> None:
         ...
@@ -242,7 +247,9 @@ class TextDocumentProtocolPart(LanguageServerProtocolPart):
 
             self._documents[document_uri] = document
 
-            return document
+        self.did_append(self, document, callback_filter=language_id_filter(document))
+
+        return document
 
     __NORMALIZE_LINE_ENDINGS: Final = re.compile(r"(\r?\n)")
 
@@ -271,6 +278,8 @@ class TextDocumentProtocolPart(LanguageServerProtocolPart):
                 )
 
                 self._documents[uri] = document
+
+                self.did_append(self, document, callback_filter=language_id_filter(document))
             else:
                 text_changed = document.text() != normalized_text
                 if text_changed:
@@ -381,6 +390,8 @@ class TextDocumentProtocolPart(LanguageServerProtocolPart):
         if document is None:
             raise LanguageServerDocumentError(f"Document {text_document.uri} is not opened.")
 
+        self.parent.drop_outdated_document_requests(text_document.uri)
+
         sync_kind = (
             self.parent.capabilities.text_document_sync
             if isinstance(
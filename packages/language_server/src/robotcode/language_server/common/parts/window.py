@@ -1,6 +1,8 @@
 import contextlib
+import threading
+import time
 import uuid
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 from robotcode.core.lsp.types import (
     URI,
@@ -27,6 +29,9 @@ from .protocol_part import LanguageServerProtocolPart
 if TYPE_CHECKING:
     from robotcode.language_server.common.protocol import LanguageServerProtocol
 
+PROGRESS_UPDATE_INTERVAL = 0.1
+PROGRESS_PERCENTAGE_GRANULARITY = 1
+
 
 class Progress:
     def __init__(
@@ -42,6 +47,13 @@ class Progress:
         self.message = message
         self.max = max
         self.started = False
+        self.update_interval = parent.progress_update_interval
+        self.percentage_granularity = parent.progress_percentage_granularity
+        self._last_report_time = 0.0
+        self._last_report: Optional[Tuple[Optional[str], Optional[int], Optional[bool]]] = None
+        self._pending_report: Optional[Tuple[Optional[str], Optional[int], Optional[bool]]] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
 
     def begin(
         self,
@@ -69,6 +81,7 @@ class Progress:
         )
 
         self.started = True
+        self._last_report_time = time.monotonic()
 
     def report(
         self,
@@ -85,20 +98,74 @@ class Progress:
         if max is not None:
             self.max = max
 
-        self.parent.progress_report(
-            self.token,
+        report = (
             message if message is not None else self.message,
             int(current * 100 / self.max)
             if percentage is None and current is not None and self.max is not None
             else percentage,
             cancellable,
-            title,
         )
 
+        # reports are throttled, the last one is kept and sent at the end of the throttle interval, the final
+        # state is always sent
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._last_report is not None
+                and (report[1] is None or report[1] < 100)
+                and (now - self._last_report_time < self.update_interval or not self._is_significant_change(report))
+            ):
+                self._pending_report = report
+
+                if self._flush_timer is None:
+                    delay = self._last_report_time + self.update_interval - now
+                    self._flush_timer = threading.Timer(delay if delay > 0 else self.update_interval, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+
+            self._send_report(report, now)
+
+    def _is_significant_change(self, report: Tuple[Optional[str], Optional[int], Optional[bool]]) -> bool:
+        if self._last_report is None:
+            return True
+
+        last_message, last_percentage, last_cancellable = self._last_report
+        message, percentage, cancellable = report
+
+        return (
+            message != last_message
+            or cancellable != last_cancellable
+            or last_percentage is None
+            or percentage is None
+            or abs(percentage - last_percentage) >= self.percentage_granularity
+        )
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _send_report(self, report: Tuple[Optional[str], Optional[int], Optional[bool]], now: float) -> None:
+        self._cancel_flush_timer()
+        self._pending_report = None
+        self._last_report = report
+        self._last_report_time = now
+
+        self.parent.progress_report(self.token, *report)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending_report is not None and not self.ended:
+                self._send_report(self._pending_report, time.monotonic())
+
     def end(self, message: Optional[str] = None) -> None:
-        if not self.ended:
-            self.parent.progress_end(self.token, message)
-            self.ended = True
+        with self._lock:
+            if not self.ended:
+                self.flush()
+                self._cancel_flush_timer()
+                self.parent.progress_end(self.token, message)
+                self.ended = True
 
     @property
     def is_canceled(self) -> bool:
@@ -109,6 +176,8 @@ class WindowProtocolPart(LanguageServerProtocolPart):
     def __init__(self, parent: "LanguageServerProtocol") -> None:
         super().__init__(parent)
         self.__progress_tokens: Dict[ProgressToken, bool] = {}
+        self.progress_update_interval = PROGRESS_UPDATE_INTERVAL
+        self.progress_percentage_granularity = PROGRESS_PERCENTAGE_GRANULARITY
 
     def show_message(self, message: str, type: MessageType = MessageType.INFO) -> None:
         self.parent.send_notification("window/showMessage", ShowMessageParams(type=type, message=message))
@@ -217,14 +286,16 @@ class WindowProtocolPart(LanguageServerProtocolPart):
 
         return token in self.__progress_tokens and self.__progress_tokens.get(token, False)
 
-    def send_progress(self, token: Optional[ProgressToken], value: Any) -> None:
+    def send_progress(self, token: Optional[ProgressToken], value: Any, coalesce: bool = False) -> None:
         if (
             token is not None
             and self.parent.client_capabilities
             and self.parent.client_capabilities.window
             and self.parent.client_capabilities.window.work_done_progress
         ):
-            self.parent.send_notification("$/progress", ProgressParams(token, value))
+            self.parent.send_notification(
+                "$/progress", ProgressParams(token, value), coalesce_key=token if coalesce else None
+            )
 
     _default_title = "Dummy"
 
@@ -277,6 +348,7 @@ class WindowProtocolPart(LanguageServerProtocolPart):
                     percentage=percentage,
                     cancellable=cancellable,
                 ),
+                coalesce=True,
             )
 
     def progress_end(self, token: Optional[ProgressToken], message: Optional[str] = None) -> None:
@@ -0,0 +1,51 @@
+from concurrent.futures import CancelledError
+from typing import TYPE_CHECKING, Any, Final, List, Optional
+
+from robotcode.core.event import event
+from robotcode.core.lsp.types import (
+    ServerCapabilities,
+    SymbolInformation,
+    WorkspaceSymbolOptions,
+    WorkspaceSymbolParams,
+)
+from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.jsonrpc2.protocol import rpc_method
+from robotcode.language_server.common.parts.protocol_part import (
+    LanguageServerProtocolPart,
+)
+
+if TYPE_CHECKING:
+    from robotcode.language_server.common.protocol import LanguageServerProtocol
+
+
+class WorkspaceSymbolsProtocolPart(LanguageServerProtocolPart):
+    _logger: Final = LoggingDescriptor()
+
+    def __init__(self, parent: "LanguageServerProtocol") -> None:
+        super().__init__(parent)
+
+    @event
+    def collect(sender, query: str) -> Optional[List[SymbolInformation]]:
+        ...
+
+    def extend_capabilities(self, capabilities: ServerCapabilities) -> None:
+        if len(self.collect):
+            capabilities.workspace_symbol_provider = WorkspaceSymbolOptions(resolve_provider=False)
+
+    @rpc_method(name="workspace/symbol", param_type=WorkspaceSymbolParams, threaded=True)
+    def _workspace_symbol(self, query: str, *args: Any, **kwargs: Any) -> Optional[List[SymbolInformation]]:
+        result: List[SymbolInformation] = []
+
+        for symbols in self.collect(self, query):
+            if isinstance(symbols, BaseException):
+                if not isinstance(symbols, CancelledError):
+                    self._logger.exception(symbols, exc_info=symbols)
+            elif symbols is not None:
+                result.extend(symbols)
+
+        for symbol in result:
+            doc = self.parent.documents.get(symbol.location.uri)
+            if doc is not None:
+                symbol.location.range = doc.range_to_utf16(symbol.location.range)
+
+        return result if result else None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from threading import Event
-from typing import Any, ClassVar, Final, List, NamedTuple, Optional, Set, Union
+from typing import Any, ClassVar, Final, FrozenSet, List, NamedTuple, Optional, Set, Union
 
 from robotcode.core.concurrent import Task
 from robotcode.core.event import event
@@ -15,6 +15,7 @@ from robotcode.core.lsp.types import (
     InitializeParamsClientInfoType,
     InitializeResult,
     InitializeResultServerInfoType,
+    LSPErrorCodes,
     PositionEncodingKind,
     ProgressToken,
     Registration,
@@ -36,6 +37,7 @@ from robotcode.jsonrpc2.protocol import (
     JsonRPCErrors,
     JsonRPCException,
     JsonRPCProtocol,
+    JsonRPCRequest,
     ProtocolPartDescriptor,
     rpc_method,
 )
@@ -68,6 +70,7 @@ from .parts.semantic_tokens import SemanticTokensProtocolPart
 from .parts.signature_help import SignatureHelpProtocolPart
 from .parts.window import WindowProtocolPart
 from .parts.workspace import Workspace
+from .parts.workspace_symbols import WorkspaceSymbolsProtocolPart
 
 __all__ = ["LanguageServerException", "LanguageServerProtocol"]
 
@@ -108,6 +111,7 @@ class LanguageServerProtocol(JsonRPCProtocol):
     inline_value: Final = ProtocolPartDescriptor(InlineValueProtocolPart)
     inlay_hint: Final = ProtocolPartDescriptor(InlayHintProtocolPart)
     code_action: Final = ProtocolPartDescriptor(CodeActionProtocolPart)
+    workspace_symbols: Final = ProtocolPartDescriptor(WorkspaceSymbolsProtocolPart)
 
     name: Optional[str] = None
     short_name: Optional[str] = None
@@ -117,6 +121,20 @@ class LanguageServerProtocol(JsonRPCProtocol):
     file_extensions: ClassVar[Set[str]] = set()
     languages: ClassVar[List[LanguageDefinition]] = []
 
+    DROP_ON_DOCUMENT_CHANGE_REQUESTS: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            "textDocument/semanticTokens/full",
+            "textDocument/semanticTokens/full/delta",
+            "textDocument/semanticTokens/range",
+            "textDocument/inlayHint",
+            "textDocument/codeLens",
+            "textDocument/documentHighlight",
+            "textDocument/foldingRange",
+            "textDocument/documentSymbol",
+            "textDocument/inlineValue",
+        }
+    )
+
     def __init__(self, server: JsonRPCServer[Any]):
         super().__init__()
         self.server = server
@@ -311,6 +329,16 @@ class LanguageServerProtocol(JsonRPCProtocol):
     def _set_trace(self, value: TraceValues, *args: Any, **kwargs: Any) -> None:
         self.trace = value
 
+    def drop_outdated_document_requests(self, uri: str) -> int:
+        def is_outdated(request: JsonRPCRequest) -> bool:
+            if request.method not in self.DROP_ON_DOCUMENT_CHANGE_REQUESTS or not isinstance(request.params, dict):
+                return False
+
+            text_document = request.params.get("textDocument", None)
+            return isinstance(text_document, dict) and text_document.get("uri", None) == uri
+
+        return self.drop_received_requests(is_outdated, LSPErrorCodes.CONTENT_MODIFIED, "Content modified.")
+
     @rpc_method(name="$/cancelRequest", param_type=CancelParams)
     @__logger.call
     def _cancel_request(self, id: Union[int, str], **kwargs: Any) -> None:
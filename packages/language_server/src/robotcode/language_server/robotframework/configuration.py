@@ -93,6 +93,8 @@ class Cache(ConfigBase):
     save_location: CacheSaveLocation = CacheSaveLocation.WORKSPACE_STORAGE
     ignored_libraries: List[str] = field(default_factory=list)
     ignored_variables: List[str] = field(default_factory=list)
+    persist_analysis_results: bool = True
+    memory_budget: int = 512
 
 
 @config_section("robotcode.analysis")
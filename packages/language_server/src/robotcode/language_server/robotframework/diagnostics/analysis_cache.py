@@ -0,0 +1,164 @@
+import hashlib
+import os
+import threading
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from robotcode.core.lsp.types import Diagnostic
+from robotcode.core.text_document import TextDocument
+from robotcode.core.utils.dataclasses import as_json, from_json
+from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.robot.diagnostics.entities import LibraryEntry
+
+from ...__version__ import __version__
+
+if TYPE_CHECKING:
+    from .namespace import Namespace
+
+
+@dataclass
+class CachedDependency:
+    source: str
+    mtime: int
+    size: int
+
+
+@dataclass
+class AnalysisCacheEntry:
+    meta_version: str
+    source: str
+    content_hash: str
+    environment_hash: str
+    dependencies: List[CachedDependency] = field(default_factory=list)
+    diagnostics: List[Diagnostic] = field(default_factory=list)
+
+    def get_diagnostics(self) -> List[Diagnostic]:
+        # diagnostics are converted in place by the diagnostics part, so always return copies
+        return [replace(d) for d in self.diagnostics]
+
+
+def get_content_hash(document: TextDocument) -> str:
+    return hashlib.sha1(document.text().encode("utf-8")).hexdigest()
+
+
+def _get_dependency(source: str) -> Optional[CachedDependency]:
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return None
+
+    return CachedDependency(source, stat.st_mtime_ns, stat.st_size)
+
+
+def _iter_dependency_sources(namespace: "Namespace") -> Iterable[Optional[str]]:
+    entries: List[LibraryEntry] = [
+        *namespace.get_libraries().values(),
+        *namespace.get_resources().values(),
+        *namespace.get_imported_variables().values(),
+    ]
+    for entry in entries:
+        yield entry.library_doc.source_or_origin or None
+
+
+class AnalysisCache:
+    """Persists the results of a namespace analysis per document.
+
+    An entry is only valid if the content of the document, the environment (configuration, variables, versions)
+    and every file the namespace imported directly or transitively, is unchanged since the entry was written.
+    """
+
+    _logger = LoggingDescriptor()
+
+    def __init__(self, cache_path: Path, environment_hash: str) -> None:
+        self.cache_path = cache_path
+        self.environment_hash = environment_hash
+        self._lock = threading.RLock()
+
+    def _get_entry_file(self, source: str) -> Path:
+        return Path(self.cache_path, hashlib.sha1(source.encode("utf-8")).hexdigest() + ".json")
+
+    def _is_valid(self, entry: AnalysisCacheEntry, document: TextDocument) -> bool:
+        if (
+            entry.meta_version != __version__
+            or entry.environment_hash != self.environment_hash
+            or entry.content_hash != get_content_hash(document)
+        ):
+            return False
+
+        return all(_get_dependency(d.source) == d for d in entry.dependencies)
+
+    def load(self, document: TextDocument) -> Optional[AnalysisCacheEntry]:
+        source = str(document.uri.to_path())
+        entry_file = self._get_entry_file(source)
+
+        try:
+            if not entry_file.exists():
+                return None
+
+            entry = from_json(entry_file.read_text("utf-8"), AnalysisCacheEntry)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            ex = e
+            self._logger.debug(lambda: f"Can't load analysis cache entry for {source}: {ex}")
+            return None
+
+        if entry.source != source or not self._is_valid(entry, document):
+            self._logger.debug(lambda: f"Analysis cache entry for {source} is outdated")
+            return None
+
+        return entry
+
+    def create_entry(self, document: TextDocument, namespace: "Namespace") -> Optional[AnalysisCacheEntry]:
+        """Returns `None` if the analysis can't be persisted.
+
+        This is the case if an import could not be resolved, because a library that is installed or a file that
+        is created later, would not invalidate the entry.
+        """
+        if namespace.has_unresolved_imports():
+            return None
+
+        source = str(document.uri.to_path())
+
+        dependencies: Dict[str, CachedDependency] = {}
+        for dep_source in _iter_dependency_sources(namespace):
+            if dep_source is None:
+                return None
+
+            if dep_source in dependencies or dep_source == source:
+                continue
+
+            dependency = _get_dependency(dep_source)
+            if dependency is None:
+                return None
+
+            dependencies[dep_source] = dependency
+
+        return AnalysisCacheEntry(
+            __version__,
+            source,
+            get_content_hash(document),
+            self.environment_hash,
+            list(dependencies.values()),
+            [replace(d) for d in namespace.get_diagnostics()],
+        )
+
+    def save(self, entry: AnalysisCacheEntry) -> None:
+        try:
+            data = as_json(entry, compact=True)
+
+            entry_file = self._get_entry_file(entry.source)
+            with self._lock:
+                entry_file.parent.mkdir(parents=True, exist_ok=True)
+                entry_file.write_text(data, "utf-8")
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            self._logger.exception(e)
+
+    @staticmethod
+    def get_environment_hash(*parts: Tuple[str, str]) -> str:
+        return hashlib.sha1(
+            "|".join(f"{k}={v}" for k, v in (("version", __version__), *parts)).encode("utf-8")
+        ).hexdigest()
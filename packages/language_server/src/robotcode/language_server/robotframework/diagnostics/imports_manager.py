@@ -30,7 +30,7 @@ from robotcode.core.event import event
 from robotcode.core.lsp.types import DocumentUri, FileChangeType, FileEvent
 from robotcode.core.text_document import TextDocument
 from robotcode.core.uri import Uri
-from robotcode.core.utils.caching import SimpleLRUCache
+from robotcode.core.utils.caching import CacheStatistics, SimpleLRUCache
 from robotcode.core.utils.dataclasses import as_json, from_json
 from robotcode.core.utils.glob_path import Pattern, iter_files
 from robotcode.core.utils.logging import LoggingDescriptor
@@ -73,6 +73,7 @@ from robotcode.robot.utils import get_robot_version, get_robot_version_str
 from robotcode.robot.utils.robot_path import find_file_ex
 
 from ...__version__ import __version__
+from .analysis_cache import AnalysisCache
 
 if TYPE_CHECKING:
     from robotcode.language_server.robotframework.protocol import (
@@ -534,9 +535,27 @@ class ImportsManager:
             / get_robot_version_str()
             / "variables"
         )
+        self.documentation_cache_path = (
+            self.cache_path
+            / f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+            / get_robot_version_str()
+            / "documentation"
+        )
 
         self.config = config
 
+        self.analysis_cache = AnalysisCache(
+            self.cache_path
+            / f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+            / get_robot_version_str()
+            / "analysis",
+            AnalysisCache.get_environment_hash(
+                ("robot", get_robot_version_str()),
+                ("config", as_json(config)),
+                ("profile", as_json(self.parent_protocol.profile)),
+            ),
+        )
+
         self.ignored_libraries_patters = [Pattern(s) for s in config.analysis.cache.ignored_libraries]
         self.ignored_variables_patters = [Pattern(s) for s in config.analysis.cache.ignored_variables]
         self._libaries_lock = threading.RLock()
@@ -586,6 +605,19 @@ class ImportsManager:
             shutil.rmtree(self.cache_path)
             self._logger.debug(lambda: f"Cleared cache {self.cache_path}")
 
+    def get_cache_statistics(self) -> Dict[str, CacheStatistics]:
+        return {
+            "library_files": self._library_files_cache.get_statistics(),
+            "resource_files": self._resource_files_cache.get_statistics(),
+            "variables_files": self._variables_files_cache.get_statistics(),
+        }
+
+    def get_loaded_library_docs(self) -> List[LibraryDoc]:
+        with self._libaries_lock:
+            entries = list(self._libaries.values())
+
+        return [e._lib_doc for e in entries if e._lib_doc is not None]
+
     @_logger.call
     def get_command_line_variables(self) -> List[VariableDefinition]:
         from robot.utils.text import split_args_from_name_or_path
@@ -59,6 +59,7 @@ from robotcode.core.lsp.types import (
 from robotcode.core.text_document import TextDocument
 from robotcode.core.uri import Uri
 from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.core.utils.metrics import metrics
 from robotcode.robot.diagnostics.entities import (
     ArgumentDefinition,
     BuiltInVariableDefinition,
@@ -547,6 +548,7 @@ class Namespace:
         self._library_doc_lock = RLock(default_timeout=120, name="Namespace.library_doc")
         self._imports: Optional[List[Import]] = None
         self._import_entries: Dict[Import, LibraryEntry] = OrderedDict()
+        self._has_unresolved_imports = False
         self._own_variables: Optional[List[VariableDefinition]] = None
         self._own_variables_lock = RLock(default_timeout=120, name="Namespace.own_variables")
         self._global_variables: Optional[List[VariableDefinition]] = None
@@ -661,6 +663,12 @@ class Namespace:
         with self._initialize_lock:
             return self._initialized
 
+    def has_unresolved_imports(self) -> bool:
+        """Returns `True` if an import, also one of an imported resource, could not be found or loaded."""
+        self.ensure_initialized()
+
+        return self._has_unresolved_imports
+
     def _invalidate(self) -> None:
         self._invalid = True
 
@@ -763,6 +771,7 @@ class Namespace:
         diagnostics: List[Diagnostic] = []
         import_entries: Dict[Import, LibraryEntry] = OrderedDict()
         imported_keywords: Optional[List[KeywordDoc]] = None
+        has_unresolved_imports: bool = False
 
     @_logger.call(condition=lambda self: not self._initialized)
     def ensure_initialized(self) -> bool:
@@ -779,6 +788,8 @@ class Namespace:
                 try:
                     self._logger.debug(lambda: f"ensure_initialized -> initialize {self.document}")
 
+                    start_time = time.perf_counter() if metrics.enabled else None
+
                     imports = self.get_imports()
 
                     data_entry: Optional[Namespace.DataEntry] = None
@@ -805,16 +816,18 @@ class Namespace:
                         self._imported_keywords = (
                             data_entry.imported_keywords.copy() if data_entry.imported_keywords else None
                         )
+                        self._has_unresolved_imports = data_entry.has_unresolved_imports
                     else:
-                        variables = self.get_resolvable_variables()
-
-                        self._import_default_libraries(variables)
-                        self._import_imports(
-                            imports,
-                            str(Path(self.source).parent),
-                            top_level=True,
-                            variables=variables,
-                        )
+                        with metrics.timer("phase.imports"):
+                            variables = self.get_resolvable_variables()
+
+                            self._import_default_libraries(variables)
+                            self._import_imports(
+                                imports,
+                                str(Path(self.source).parent),
+                                top_level=True,
+                                variables=variables,
+                            )
 
                         if self.document is not None:
                             self.document.set_data(
@@ -826,6 +839,7 @@ class Namespace:
                                     self._diagnostics.copy(),
                                     self._import_entries.copy(),
                                     self._imported_keywords.copy() if self._imported_keywords else None,
+                                    self._has_unresolved_imports,
                                 ),
                             )
 
@@ -834,6 +848,9 @@ class Namespace:
                     self._initialized = True
                     run_initialize = True
 
+                    if start_time is not None:
+                        metrics.observe("phase.namespace_initialize", time.perf_counter() - start_time)
+
                 except BaseException:
                     if self.document is not None:
                         self.document.remove_data(Namespace)
@@ -1126,6 +1143,9 @@ class Namespace:
                 else:
                     raise DiagnosticsError("Unknown import type.")
 
+                if result is not None and result.library_doc.errors and not result.library_doc.source_or_origin:
+                    self._has_unresolved_imports = True
+
                 if top_level and result is not None:
                     if result.library_doc.source is not None and result.library_doc.errors:
                         if any(err.source and Path(err.source).is_absolute() for err in result.library_doc.errors):
@@ -1190,6 +1210,7 @@ class Namespace:
             except (SystemExit, KeyboardInterrupt):
                 raise
             except BaseException as e:
+                self._has_unresolved_imports = True
                 if top_level:
                     self.append_diagnostics(
                         range=value.range,
@@ -1234,6 +1255,7 @@ class Namespace:
                             except (SystemExit, KeyboardInterrupt):
                                 raise
                             except BaseException as e:
+                                self._has_unresolved_imports = True
                                 if top_level:
                                     self.append_diagnostics(
                                         range=entry.import_range,
@@ -1383,6 +1405,7 @@ class Namespace:
             except (SystemExit, KeyboardInterrupt):
                 raise
             except BaseException as e:
+                self._has_unresolved_imports = True
                 self.append_diagnostics(
                     range=Range.zero(),
                     message=f"Can't import default library '{library}': {str(e) or type(e).__name__}",
@@ -1619,12 +1642,14 @@ class Namespace:
                 start_time = time.monotonic()
 
                 try:
-                    result = Analyzer(
+                    analyzer = Analyzer(
                         self.model,
                         self,
                         self.create_finder(),
                         self.get_ignored_lines(self.document) if self.document is not None else [],
-                    ).run()
+                    )
+                    with metrics.timer("phase.analyze"):
+                        result = analyzer.run()
 
                     self._diagnostics += result.diagnostics
                     self._keyword_references = result.keyword_references
@@ -0,0 +1,216 @@
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from robotcode.core.lsp.types import Range, SymbolKind
+from robotcode.core.utils.dataclasses import as_json, from_json
+from robotcode.core.utils.logging import LoggingDescriptor
+
+from ...__version__ import __version__
+
+_WORD_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+_VARIABLE_PATTERN = re.compile(r"^[$@&%]\{(.*)\}$")
+
+
+@dataclass
+class IndexedSymbol:
+    name: str
+    kind: SymbolKind
+    range: Range
+    container_name: Optional[str] = None
+
+
+@dataclass
+class IndexedDocument:
+    source: str
+    content_hash: str
+    symbols: List[IndexedSymbol] = field(default_factory=list)
+
+
+@dataclass
+class SymbolIndexData:
+    meta_version: str
+    documents: List[IndexedDocument] = field(default_factory=list)
+
+
+class PreparedSymbol(NamedTuple):
+    normalized: str
+    words: Tuple[str, ...]
+    source: str
+    symbol: IndexedSymbol
+
+
+def _strip_variable(name: str) -> str:
+    match = _VARIABLE_PATTERN.match(name)
+    return match.group(1) if match else name
+
+
+def normalize_symbol_name(name: str) -> str:
+    return "".join(c for c in _strip_variable(name).lower() if c.isalnum())
+
+
+def split_words(name: str) -> Tuple[str, ...]:
+    return tuple(w.lower() for w in _WORD_PATTERN.findall(_strip_variable(name)))
+
+
+def get_camel_humps_pattern(query: str) -> "re.Pattern[str]":
+    """A pattern that matches the words of a name joined by spaces, if the query can be split into prefixes of
+    consecutive or skipped words, like `gvj` for `get value from json`.
+    """
+
+    # before each query character, skip the rest of the current word and any number of following words
+    skip = r"(?:[^ ]* )*"
+    return re.compile("".join(skip + re.escape(c) for c in query))
+
+
+def _match_camel_humps(pattern: "re.Pattern[str]", words: Tuple[str, ...]) -> bool:
+    return pattern.match(" ".join(words)) is not None
+
+
+def _is_subsequence(query: str, name: str) -> bool:
+    it = iter(name)
+    return all(c in it for c in query)
+
+
+def match_symbol(
+    query: str, normalized: str, words: Tuple[str, ...], humps_pattern: Optional["re.Pattern[str]"] = None
+) -> Optional[int]:
+    """Returns a score for a normalized query and a symbol name, lower is better, `None` if it does not match.
+
+    `0` is an exact match, `1` a prefix match, `2` a camel hump match like `ob` for `Open Browser` or `gvj` for
+    `Get Value From Json`, `3` a substring match and `4` a fuzzy match of all query characters in the right order.
+    """
+    if not query:
+        return 5
+    if normalized == query:
+        return 0
+    if normalized.startswith(query):
+        return 1
+    # all other matches imply that the query is a subsequence of the name, so this check filters out most symbols
+    if not _is_subsequence(query, normalized):
+        return None
+    if _match_camel_humps(humps_pattern or get_camel_humps_pattern(query), words):
+        return 2
+    if query in normalized:
+        return 3
+    return 4
+
+
+def prepare_symbols(source: str, symbols: Iterable[IndexedSymbol]) -> List[PreparedSymbol]:
+    return [PreparedSymbol(normalize_symbol_name(s.name), split_words(s.name), source, s) for s in symbols]
+
+
+def search_symbols(
+    query: str, prepared: Iterable[PreparedSymbol], max_results: int
+) -> List[Tuple[int, PreparedSymbol]]:
+    normalized_query = normalize_symbol_name(query)
+    humps_pattern = get_camel_humps_pattern(normalized_query)
+
+    result: List[Tuple[int, PreparedSymbol]] = []
+    for p in prepared:
+        score = match_symbol(normalized_query, p.normalized, p.words, humps_pattern)
+        if score is not None:
+            result.append((score, p))
+
+    result.sort(key=lambda v: (v[0], len(v[1].normalized), v[1].symbol.name, v[1].source))
+
+    return result[:max_results]
+
+
+class SymbolIndex:
+    """An index of the symbols of all workspace documents.
+
+    Entries are keyed by the source of a document and are only reused if the content hash of the document is
+    unchanged. The index can be saved to and loaded from a cache file, so symbols are available on startup before
+    the workspace documents are loaded and parsed.
+    """
+
+    _logger = LoggingDescriptor()
+
+    def __init__(self, cache_file: Optional[Path] = None) -> None:
+        self.cache_file = cache_file
+        self._lock = threading.RLock()
+        self._documents: Dict[str, IndexedDocument] = {}
+        self._prepared: Dict[str, List[PreparedSymbol]] = {}
+        self._modified = False
+
+    @property
+    def modified(self) -> bool:
+        return self._modified
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def load(self) -> None:
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+
+        try:
+            data = from_json(self.cache_file.read_text("utf-8"), SymbolIndexData)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            ex = e
+            self._logger.debug(lambda: f"Can't load symbol index {self.cache_file}: {ex}")
+            return
+
+        if data.meta_version != __version__:
+            return
+
+        with self._lock:
+            for doc in data.documents:
+                if doc.source not in self._documents:
+                    self._documents[doc.source] = doc
+                    self._prepared[doc.source] = prepare_symbols(doc.source, doc.symbols)
+
+    def save(self) -> None:
+        if self.cache_file is None:
+            return
+
+        with self._lock:
+            if not self._modified:
+                return
+
+            data = as_json(SymbolIndexData(__version__, list(self._documents.values())), compact=True)
+            self._modified = False
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(data, "utf-8")
+        except OSError as e:
+            self._logger.exception(e)
+
+    def get(self, source: str) -> Optional[IndexedDocument]:
+        with self._lock:
+            return self._documents.get(source)
+
+    def update(self, document: IndexedDocument) -> None:
+        prepared = prepare_symbols(document.source, document.symbols)
+
+        with self._lock:
+            self._documents[document.source] = document
+            self._prepared[document.source] = prepared
+            self._modified = True
+
+    def remove(self, source: str) -> None:
+        with self._lock:
+            if self._documents.pop(source, None) is not None:
+                self._prepared.pop(source, None)
+                self._modified = True
+
+    def retain(self, sources: Iterable[str]) -> None:
+        keep = set(sources)
+
+        with self._lock:
+            for source in [s for s in self._documents if s not in keep]:
+                self.remove(source)
+
+    def search(
+        self, query: str, max_results: int, additional: Iterable[PreparedSymbol] = ()
+    ) -> List[Tuple[int, PreparedSymbol]]:
+        with self._lock:
+            prepared = list(self._prepared.values())
+
+        return search_symbols(query, (p for entries in [*prepared, additional] for p in entries), max_results)
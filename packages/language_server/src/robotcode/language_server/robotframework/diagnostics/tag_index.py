@@ -0,0 +1,96 @@
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+from robotcode.core.lsp.types import Location, Range
+
+
+class TagLocation(NamedTuple):
+    name: str
+    range: Range
+
+
+DocumentTags = Dict[str, List[TagLocation]]
+
+
+class TagIndex:
+    """An index of the tags used in the workspace documents.
+
+    The tags of a document are keyed by their normalized name. Updating a document only touches the entries of this
+    document, so the index can be kept current on every change without rebuilding it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._documents: Dict[str, DocumentTags] = {}
+        self._tag_documents: Dict[str, Set[str]] = {}
+        self._names: Dict[str, Counter[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, uri: str) -> bool:
+        return uri in self._documents
+
+    def update(self, uri: str, tags: DocumentTags) -> None:
+        with self._lock:
+            if self._documents.get(uri) is tags:
+                return
+
+            self._remove(uri)
+
+            self._documents[uri] = tags
+            for tag, locations in tags.items():
+                self._tag_documents.setdefault(tag, set()).add(uri)
+                self._names.setdefault(tag, Counter()).update(loc.name for loc in locations)
+
+    def remove(self, uri: str) -> None:
+        with self._lock:
+            self._remove(uri)
+
+    def _remove(self, uri: str) -> None:
+        tags = self._documents.pop(uri, None)
+        if tags is None:
+            return
+
+        for tag, locations in tags.items():
+            documents = self._tag_documents.get(tag)
+            if documents is not None:
+                documents.discard(uri)
+                if not documents:
+                    del self._tag_documents[tag]
+
+            names = self._names.get(tag)
+            if names is not None:
+                names.subtract(loc.name for loc in locations)
+                names += Counter()
+                if not names:
+                    del self._names[tag]
+
+    def retain(self, uris: Iterable[str]) -> None:
+        keep = set(uris)
+
+        with self._lock:
+            for uri in [u for u in self._documents if u not in keep]:
+                self._remove(uri)
+
+    def get_locations(self, tag: str) -> List[Location]:
+        with self._lock:
+            return [
+                Location(uri, loc.range)
+                for uri in sorted(self._tag_documents.get(tag, ()))
+                for loc in self._documents[uri][tag]
+            ]
+
+    def get_document_counts(self, uri: str) -> Dict[str, int]:
+        with self._lock:
+            return {tag: len(locations) for tag, locations in self._documents.get(uri, {}).items()}
+
+    def get_tags(self) -> List[Tuple[str, int]]:
+        """Returns the tags with their most used spelling and the number of usages, most used tags first."""
+        with self._lock:
+            result = [(names.most_common(1)[0][0], sum(names.values())) for names in self._names.values()]
+
+        result.sort(key=lambda v: (-v[1], v[0]))
+
+        return result
@@ -1,24 +1,30 @@
 from __future__ import annotations
 
 import contextlib
+import glob
+import gzip
+import hashlib
 import io
 import multiprocessing as mp
 import socket
 import threading
 import traceback
 import urllib.parse
-from concurrent.futures import ProcessPoolExecutor
-from dataclasses import dataclass
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from os import PathLike
+from pathlib import Path
 from string import Template
 from threading import Thread
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 from urllib.parse import parse_qs, urlparse
 
 from robot.parsing.lexer.tokens import Token
 
+from robotcode.core.concurrent import run_as_task
 from robotcode.core.lsp.types import (
     CodeAction,
     CodeActionContext,
@@ -28,12 +34,13 @@ from robotcode.core.lsp.types import (
 )
 from robotcode.core.text_document import TextDocument
 from robotcode.core.uri import Uri
-from robotcode.core.utils.dataclasses import CamelSnakeMixin
+from robotcode.core.utils.dataclasses import CamelSnakeMixin, as_json, from_json
 from robotcode.core.utils.logging import LoggingDescriptor
 from robotcode.core.utils.net import find_free_port
 from robotcode.jsonrpc2.protocol import rpc_method
 from robotcode.robot.diagnostics.entities import LibraryEntry
 from robotcode.robot.diagnostics.library_doc import (
+    ALLOWED_RESOURCE_FILE_EXTENSIONS,
     get_library_doc,
     get_robot_library_html_doc_str,
     resolve_robot_variables,
@@ -42,6 +49,7 @@ from robotcode.robot.utils.ast import get_node_at_position, range_from_token
 
 from ...common.decorators import code_action_kinds, language_id
 from ..configuration import DocumentationServerConfig
+from ..diagnostics.imports_manager import ImportsManager
 from ..diagnostics.model_helper import ModelHelper
 from ..diagnostics.namespace import Namespace
 from .protocol_part import RobotLanguageServerProtocolPart
@@ -55,6 +63,43 @@ class ConvertUriParams(CamelSnakeMixin):
     uri: str
 
 
+@dataclass(frozen=True)
+class DocumentationRequest:
+    name: str
+    args: Optional[str] = None
+    base_dir: Optional[str] = None
+    type: Optional[str] = None
+    theme: Optional[str] = None
+
+    @property
+    def is_markdown(self) -> bool:
+        return self.type in ["md", "markdown"]
+
+
+@dataclass
+class DocumentationUsage:
+    request: DocumentationRequest
+    count: int = 0
+
+
+@dataclass
+class DocumentationUsages:
+    usages: List[DocumentationUsage] = field(default_factory=list)
+
+
+@dataclass
+class RenderedDocumentation:
+    etag: str
+    content: Optional[bytes] = None
+    """The gzip compressed page, `None` if the page is not modified."""
+
+
+LOAD_DOCUMENTATION_TIME_OUT = 600
+PRE_RENDER_DOCUMENTATION_COUNT = 10
+MAX_DOCUMENTATION_USAGES = 200
+USAGES_FLUSH_DELAY = 30
+
+
 HTML_ERROR_TEMPLATE = Template(
     """\n
 <!doctype html>
@@ -100,6 +145,30 @@ MARKDOWN_TEMPLATE = Template(
 )
 
 
+def render_documentation(
+    name: str,
+    args: Optional[str],
+    working_dir: str = ".",
+    base_dir: str = ".",
+    type_: Optional[str] = None,
+    theme: Optional[str] = None,
+) -> str:
+    if type_ in ["md", "markdown"]:
+        libdoc = get_library_doc(
+            name,
+            tuple(args.split("::") if args else ()),
+            working_dir=working_dir,
+            base_dir=base_dir,
+        )
+
+        tt = str.maketrans({"<": "&lt;", ">": "&gt;"})
+        content = libdoc.to_markdown(add_signature=False, only_doc=False, header_level=0).translate(tt)
+
+        return MARKDOWN_TEMPLATE.substitute(content=content, name=name)
+
+    return get_robot_library_html_doc_str(name, args, working_dir=working_dir, base_dir=base_dir, theme=theme)
+
+
 class LibDocRequestHandler(SimpleHTTPRequestHandler):
     _logger = LoggingDescriptor()
 
@@ -127,39 +196,37 @@ class LibDocRequestHandler(SimpleHTTPRequestHandler):
 
         if name:
             try:
-                if type_ in ["md", "markdown"]:
-                    libdoc = get_library_doc(
-                        name,
-                        tuple(args.split("::") if args else ()),
-                        base_dir=basedir if basedir else ".",
-                    )
-
-                    def calc_md() -> str:
-                        tt = str.maketrans({"<": "&lt;", ">": "&gt;"})
-                        return libdoc.to_markdown(add_signature=False, only_doc=False, header_level=0).translate(tt)
+                documentation = cast(LibDocServer, self.server).documentation
+                if documentation is None:
+                    raise RuntimeError("Documentation server is not available.")
 
-                    data = MARKDOWN_TEMPLATE.substitute(content=calc_md(), name=name)
+                result = documentation.get_documentation(
+                    DocumentationRequest(name, args, basedir, type_, theme),
+                    self._get_if_none_match(),
+                )
 
-                    self.send_response(200)
-                    self.send_header("Content-type", "text/html")
+                if result.content is None:
+                    self.send_response(HTTPStatus.NOT_MODIFIED)
+                    self.send_header("ETag", result.etag)
                     self.end_headers()
-
-                    self.wfile.write(bytes(data, "utf-8"))
+                    return
+
+                data = result.content
+                accepts_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+
+                self.send_response(200)
+                self.send_header("Content-type", "text/html; charset=utf-8")
+                self.send_header("ETag", result.etag)
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Vary", "Accept-Encoding")
+                if accepts_gzip:
+                    self.send_header("Content-Encoding", "gzip")
                 else:
-                    with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn")) as executor:
-                        result = executor.submit(
-                            get_robot_library_html_doc_str,
-                            name,
-                            args,
-                            base_dir=basedir if basedir else ".",
-                            theme=theme,
-                        ).result(600)
-
-                        self.send_response(200)
-                        self.send_header("Content-type", "text/html")
-                        self.end_headers()
-
-                        self.wfile.write(bytes(result, "utf-8"))
+                    data = gzip.decompress(data)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+
+                self.wfile.write(data)
             except (SystemExit, KeyboardInterrupt):
                 raise
             except BaseException as e:
@@ -181,6 +248,9 @@ class LibDocRequestHandler(SimpleHTTPRequestHandler):
         else:
             super().do_GET()
 
+    def _get_if_none_match(self) -> List[str]:
+        return [v.strip() for v in self.headers.get("If-None-Match", "").split(",") if v.strip()]
+
 
 class DualStackServer(ThreadingHTTPServer):
     def server_bind(self) -> None:
@@ -190,6 +260,12 @@ class DualStackServer(ThreadingHTTPServer):
         return super().server_bind()
 
 
+class LibDocServer(DualStackServer):
+    def __init__(self, *args: Any, documentation: Optional[RobotCodeActionDocumentationProtocolPart] = None) -> None:
+        super().__init__(*args)
+        self.documentation = documentation
+
+
 class RobotCodeActionDocumentationProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
     _logger = LoggingDescriptor()
 
@@ -199,11 +275,19 @@ class RobotCodeActionDocumentationProtocolPart(RobotLanguageServerProtocolPart,
         parent.code_action.collect.add(self.collect)
         self.parent.on_initialized.add(self.server_initialized)
         self.parent.on_shutdown.add(self.server_shutdown)
+        self.parent.diagnostics.on_workspace_loaded.add(self.workspace_loaded)
 
         self._documentation_server: Optional[ThreadingHTTPServer] = None
         self._documentation_server_lock = threading.RLock()
         self._documentation_server_port = 0
 
+        self._rendering_lock = threading.RLock()
+        self._rendering: Dict[Union[Path, DocumentationRequest], Future[bytes]] = {}
+        self._usages_lock = threading.RLock()
+        self._usages: Optional[Dict[DocumentationRequest, DocumentationUsage]] = None
+        self._usages_file: Optional[Path] = None
+        self._usages_flush_timer: Optional[threading.Timer] = None
+
         self.parent.commands.register_all(self)
 
     def server_initialized(self, sender: Any) -> None:
@@ -215,6 +299,208 @@ class RobotCodeActionDocumentationProtocolPart(RobotLanguageServerProtocolPart,
                 self._documentation_server.shutdown()
                 self._documentation_server = None
 
+        self._flush_usages()
+
+    def workspace_loaded(self, sender: Any) -> None:
+        run_as_task(self._pre_render_documentation)
+
+    def _get_imports_manager(self) -> ImportsManager:
+        return self.parent.documents_cache.get_imports_manager_for_workspace_folder(None)
+
+    def _get_cache_file(self, imports_manager: ImportsManager, request: DocumentationRequest) -> Optional[Path]:
+        base_dir = str(Path(imports_manager.folder.to_path(), request.base_dir or "."))
+
+        if Path(request.name).suffix.lower() in ALLOWED_RESOURCE_FILE_EXTENSIONS:
+            try:
+                source = Path(imports_manager.find_resource(request.name, base_dir))
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException:
+                return None
+
+            file_base = f"{zlib.adler32(str(source.parent).encode('utf-8')):08x}_{source.name}"
+            fingerprint = f"{source}:{source.stat().st_mtime_ns}"
+        else:
+            meta, _ = imports_manager.get_library_meta(request.name, base_dir)
+            if meta is None:
+                return None
+
+            file_base = meta.filepath_base
+            fingerprint = as_json(meta)
+
+        request_key = hashlib.sha1(as_json(request, compact=True).encode("utf-8")).hexdigest()
+        digest = hashlib.sha1(as_json([fingerprint, request], compact=True).encode("utf-8")).hexdigest()
+
+        # the name is `<file base>.<request key>.<digest>.html.gz`, the digest is also used as etag
+        return Path(imports_manager.documentation_cache_path, f"{file_base}.{request_key[:12]}.{digest[:16]}.html.gz")
+
+    def get_documentation(
+        self, request: DocumentationRequest, if_none_match: Optional[List[str]] = None
+    ) -> RenderedDocumentation:
+        imports_manager = self._get_imports_manager()
+
+        self._track_usage(imports_manager, request)
+
+        cache_file = self._get_cache_file(imports_manager, request)
+        if cache_file is None:
+            content = self._render(imports_manager, request, None)
+            etag = f'"{hashlib.sha1(content).hexdigest()[:16]}"'
+
+            return RenderedDocumentation(etag, None if if_none_match and etag in if_none_match else content)
+
+        etag = f'"{cache_file.name.split(".")[-3]}"'
+        if if_none_match and etag in if_none_match:
+            return RenderedDocumentation(etag)
+
+        return RenderedDocumentation(etag, self._render(imports_manager, request, cache_file))
+
+    def _render(
+        self, imports_manager: ImportsManager, request: DocumentationRequest, cache_file: Optional[Path]
+    ) -> bytes:
+        if cache_file is not None and cache_file.exists():
+            try:
+                return cache_file.read_bytes()
+            except OSError as e:
+                self._logger.exception(e)
+
+        key: Union[Path, DocumentationRequest] = cache_file or request
+        with self._rendering_lock:
+            future = self._rendering.get(key)
+            if future is None:
+                future = self._rendering[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return future.result(LOAD_DOCUMENTATION_TIME_OUT)
+
+        try:
+            # a new process for every page, a reused process would keep the imported modules and state of
+            # previous renders and could render an outdated version of a changed library
+            executor = ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn"))
+            try:
+                html = executor.submit(
+                    render_documentation,
+                    request.name,
+                    request.args,
+                    working_dir=str(imports_manager.folder.to_path()),
+                    base_dir=request.base_dir or ".",
+                    type_=request.type,
+                    theme=request.theme,
+                ).result(LOAD_DOCUMENTATION_TIME_OUT)
+            finally:
+                executor.shutdown(wait=True)
+
+            content = gzip.compress(html.encode("utf-8"))
+
+            if cache_file is not None:
+                self._write_cache_file(cache_file, content)
+
+            future.set_result(content)
+            return content
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._rendering_lock:
+                self._rendering.pop(key, None)
+
+    def _write_cache_file(self, cache_file: Path, content: bytes) -> None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # only pages for the same request with an outdated fingerprint are removed
+            prefix = cache_file.name[: -len(".html.gz")].rsplit(".", 1)[0]
+            for outdated in cache_file.parent.glob(f"{glob.escape(prefix)}.*.html.gz"):
+                if outdated == cache_file:
+                    continue
+                with contextlib.suppress(OSError):
+                    outdated.unlink()
+
+            tmp_file = cache_file.with_name(cache_file.name + f".{threading.get_ident()}.tmp")
+            tmp_file.write_bytes(content)
+            tmp_file.replace(cache_file)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            self._logger.exception(e)
+
+    def _get_usages_file(self, imports_manager: ImportsManager) -> Path:
+        return Path(imports_manager.documentation_cache_path, "usages.json")
+
+    def _get_usages(self, imports_manager: ImportsManager) -> Dict[DocumentationRequest, DocumentationUsage]:
+        with self._usages_lock:
+            if self._usages is None:
+                self._usages_file = self._get_usages_file(imports_manager)
+                self._usages = {u.request: u for u in self._load_usages(self._usages_file).usages}
+
+            return self._usages
+
+    def _load_usages(self, usages_file: Path) -> DocumentationUsages:
+        if usages_file.exists():
+            try:
+                return from_json(usages_file.read_text("utf-8"), DocumentationUsages)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as e:
+                self._logger.exception(e)
+
+        return DocumentationUsages()
+
+    def _track_usage(self, imports_manager: ImportsManager, request: DocumentationRequest) -> None:
+        with self._usages_lock:
+            usages = self._get_usages(imports_manager)
+
+            usage = usages.get(request)
+            if usage is None:
+                if len(usages) >= MAX_DOCUMENTATION_USAGES:
+                    least_used = min(usages.values(), key=lambda u: u.count)
+                    del usages[least_used.request]
+
+                usage = usages[request] = DocumentationUsage(request)
+            usage.count += 1
+
+            if self._usages_flush_timer is None:
+                self._usages_flush_timer = threading.Timer(USAGES_FLUSH_DELAY, self._flush_usages)
+                self._usages_flush_timer.daemon = True
+                self._usages_flush_timer.start()
+
+    def _flush_usages(self) -> None:
+        with self._usages_lock:
+            if self._usages_flush_timer is not None:
+                self._usages_flush_timer.cancel()
+                self._usages_flush_timer = None
+
+            if self._usages is None or self._usages_file is None:
+                return
+
+            try:
+                self._usages_file.parent.mkdir(parents=True, exist_ok=True)
+                self._usages_file.write_text(as_json(DocumentationUsages(list(self._usages.values()))), "utf-8")
+            except OSError as e:
+                self._logger.exception(e)
+
+    def _pre_render_documentation(self) -> None:
+        imports_manager = self._get_imports_manager()
+
+        with self._usages_lock:
+            usages = sorted(self._get_usages(imports_manager).values(), key=lambda u: -u.count)
+
+        for usage in usages[:PRE_RENDER_DOCUMENTATION_COUNT]:
+            try:
+                cache_file = self._get_cache_file(imports_manager, usage.request)
+                if cache_file is not None and not cache_file.exists():
+                    self._logger.debug(lambda: f"Pre-render documentation for {usage.request.name}")
+                    self._render(imports_manager, usage.request, cache_file)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as e:
+                ex = e
+                self._logger.debug(lambda: f"Can't pre-render documentation for {usage.request.name}: {ex}")
+
     def _run_server(self) -> None:
         config = self.parent.workspace.get_configuration(DocumentationServerConfig)
 
@@ -222,7 +508,11 @@ class RobotCodeActionDocumentationProtocolPart(RobotLanguageServerProtocolPart,
 
         self._logger.debug(lambda: f"Start documentation server on port {self._documentation_server_port}")
 
-        with DualStackServer(("127.0.0.1", self._documentation_server_port), LibDocRequestHandler) as server:
+        with LibDocServer(
+            ("127.0.0.1", self._documentation_server_port),
+            LibDocRequestHandler,
+            documentation=self,
+        ) as server:
             self._documentation_server = server
             try:
                 server.serve_forever()
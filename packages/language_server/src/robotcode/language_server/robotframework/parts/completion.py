@@ -2420,16 +2420,33 @@ class CompletionCollector(ModelHelper):
         if get_robot_version() >= (6, 1):
             built_in_tags.add("robot:flatten")
 
+        project_tags = [
+            (tag, count) for tag, count in self.parent.robot_references.get_project_tags() if tag not in built_in_tags
+        ]
+
         return [
-            CompletionItem(
-                label=tag,
-                kind=CompletionItemKind.ENUM_MEMBER,
-                detail="Reserved Tag",
-                sort_text=f"080_{tag}",
-                insert_text_format=InsertTextFormat.PLAIN_TEXT,
-                text_edit=TextEdit(range=range, new_text=f"{tag}") if range is not None else None,
-            )
-            for tag in built_in_tags
+            *(
+                CompletionItem(
+                    label=tag,
+                    kind=CompletionItemKind.ENUM_MEMBER,
+                    detail=f"Tag ({count} usage{'s' if count != 1 else ''})",
+                    sort_text=f"070_{i:06}_{tag}",
+                    insert_text_format=InsertTextFormat.PLAIN_TEXT,
+                    text_edit=TextEdit(range=range, new_text=f"{tag}") if range is not None else None,
+                )
+                for i, (tag, count) in enumerate(project_tags)
+            ),
+            *(
+                CompletionItem(
+                    label=tag,
+                    kind=CompletionItemKind.ENUM_MEMBER,
+                    detail="Reserved Tag",
+                    sort_text=f"080_{tag}",
+                    insert_text_format=InsertTextFormat.PLAIN_TEXT,
+                    text_edit=TextEdit(range=range, new_text=f"{tag}") if range is not None else None,
+                )
+                for tag in built_in_tags
+            ),
         ]
 
     def _complete_ForceTags_or_KeywordTags_or_DefaultTags_Tags(  # noqa: N802
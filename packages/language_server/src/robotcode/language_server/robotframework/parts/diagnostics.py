@@ -1,11 +1,12 @@
 import ast
 import threading
+import weakref
 from concurrent.futures import CancelledError
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, cast
 
 from robot.parsing.lexer.tokens import Token
 
-from robotcode.core.concurrent import check_current_task_canceled
+from robotcode.core.concurrent import check_current_task_canceled, run_as_task
 from robotcode.core.lsp.types import (
     Diagnostic,
     DiagnosticSeverity,
@@ -22,6 +23,7 @@ from robotcode.robot.diagnostics.entities import (
     EnvironmentVariableDefinition,
     LibraryArgumentDefinition,
 )
+from robotcode.robot.diagnostics.library_doc import LibraryDoc
 from robotcode.robot.utils.ast import (
     iter_nodes,
     range_from_node,
@@ -32,6 +34,8 @@ from robotcode.robot.utils.stubs import HasError, HasErrors, HeaderAndBodyBlock
 from ...common.decorators import language_id
 from ...common.parts.diagnostics import DiagnosticsResult
 from ..configuration import AnalysisConfig
+from ..diagnostics.analysis_cache import AnalysisCacheEntry
+from ..diagnostics.imports_manager import ImportsManager
 from ..diagnostics.namespace import Namespace
 
 if TYPE_CHECKING:
@@ -39,6 +43,8 @@ if TYPE_CHECKING:
 
 from .protocol_part import RobotLanguageServerProtocolPart
 
+_NOT_LOADED = object()
+
 
 class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
     _logger = LoggingDescriptor()
@@ -64,6 +70,89 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
         parent.diagnostics.on_workspace_diagnostics_analyze.add(self._on_workspace_diagnostics_analyze)
         parent.diagnostics.on_workspace_diagnostics_collect.add(self._on_workspace_diagnostics_collect)
 
+        self._served_from_cache_lock = threading.RLock()
+        self._served_from_cache: weakref.WeakSet[TextDocument] = weakref.WeakSet()
+        self._watched_imports_managers: weakref.WeakSet[ImportsManager] = weakref.WeakSet()
+
+    def get_cached_analysis(self, document: TextDocument) -> Optional[AnalysisCacheEntry]:
+        """The persisted analysis of a document that has not been analyzed in this session, if it is still valid.
+
+        Documents opened in the editor and documents checked for unused references need the namespace anyway,
+        so they are always analyzed.
+        """
+
+        data = document.get_data(AnalysisCacheEntry, _NOT_LOADED)
+        if data is None:
+            return None
+
+        if data is _NOT_LOADED:
+            config = self.parent.workspace.get_configuration(AnalysisConfig, document.uri)
+            entry = None
+            if config.cache.persist_analysis_results and not config.find_unused_references:
+                imports_manager = self.parent.documents_cache.get_imports_manager(document)
+                self._watch_imports_manager(imports_manager)
+                entry = imports_manager.analysis_cache.load(document)
+
+            document.set_data(AnalysisCacheEntry, (document.version, entry) if entry is not None else None)
+            if entry is None:
+                return None
+
+            self._logger.debug(lambda: f"Use cached analysis for {document}")
+            data = document.get_data(AnalysisCacheEntry)
+
+        version, entry = cast(Tuple[Optional[int], AnalysisCacheEntry], data)
+        if version != document.version or document.opened_in_editor:
+            self._drop_cached_analysis(document)
+            return None
+
+        with self._served_from_cache_lock:
+            self._served_from_cache.add(document)
+
+        return entry
+
+    def _watch_imports_manager(self, imports_manager: ImportsManager) -> None:
+        with self._served_from_cache_lock:
+            if imports_manager in self._watched_imports_managers:
+                return
+            self._watched_imports_managers.add(imports_manager)
+
+        imports_manager.libraries_changed.add(self._libraries_changed)
+        imports_manager.resources_changed.add(self._resources_changed)
+        imports_manager.variables_changed.add(self._variables_changed)
+
+    def _libraries_changed(self, sender: Any, libraries: List[LibraryDoc]) -> None:
+        self._imports_changed(libraries)
+
+    def _resources_changed(self, sender: Any, resources: List[LibraryDoc]) -> None:
+        self._imports_changed(resources)
+
+    def _variables_changed(self, sender: Any, variables: List[LibraryDoc]) -> None:
+        self._imports_changed(variables)
+
+    def _imports_changed(self, library_docs: List[LibraryDoc]) -> None:
+        for library_doc in library_docs:
+            if library_doc.source_or_origin:
+                self._drop_cached_analyses_depending_on(library_doc.source_or_origin)
+
+    def _drop_cached_analysis(self, document: TextDocument) -> None:
+        document.set_data(AnalysisCacheEntry, None)
+
+        with self._served_from_cache_lock:
+            self._served_from_cache.discard(document)
+
+    def _drop_cached_analyses_depending_on(self, source: str) -> None:
+        with self._served_from_cache_lock:
+            documents = [
+                d
+                for d in self._served_from_cache
+                if (data := d.get_data(AnalysisCacheEntry)) is not None
+                and any(dep.source == source for dep in data[1].dependencies)
+            ]
+
+        for document in documents:
+            self._drop_cached_analysis(document)
+            self.parent.diagnostics.force_refresh_document(document, False)
+
     def _on_workspace_diagnostics_analyze(self, sender: Any) -> None:
         self._collect_unused_references_event.clear()
 
@@ -72,6 +161,9 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
 
     @language_id("robotframework")
     def analyze(self, sender: Any, document: TextDocument) -> None:
+        if self.get_cached_analysis(document) is not None:
+            return
+
         self.parent.documents_cache.get_namespace(document).analyze()
 
     @language_id("robotframework")
@@ -83,9 +175,14 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
         self.parent.diagnostics.break_workspace_diagnostics_loop()
 
     def _namespace_invalidated(self, namespace: Namespace) -> None:
+        if namespace.source:
+            self._drop_cached_analyses_depending_on(namespace.source)
+
         if namespace.document is not None:
             refresh = namespace.document.opened_in_editor
 
+            self._drop_cached_analysis(namespace.document)
+
             self.parent.diagnostics.force_refresh_document(namespace.document, False)
 
             if namespace.is_initialized():
@@ -102,13 +199,26 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
 
     @language_id("robotframework")
     def collect_namespace_diagnostics(self, sender: Any, document: TextDocument) -> DiagnosticsResult:
+        cached = self.get_cached_analysis(document)
+        if cached is not None:
+            return DiagnosticsResult(self.collect_namespace_diagnostics, cached.get_diagnostics())
+
         return document.get_cache(self._collect_namespace_diagnostics)
 
     def _collect_namespace_diagnostics(self, document: TextDocument) -> DiagnosticsResult:
         try:
             namespace = self.parent.documents_cache.get_namespace(document)
 
-            return DiagnosticsResult(self.collect_namespace_diagnostics, namespace.get_diagnostics())
+            diagnostics = namespace.get_diagnostics()
+
+            config = self.parent.workspace.get_configuration(AnalysisConfig, document.uri)
+            if config.cache.persist_analysis_results:
+                analysis_cache = namespace.imports_manager.analysis_cache
+                entry = analysis_cache.create_entry(document, namespace)
+                if entry is not None:
+                    run_as_task(analysis_cache.save, entry)
+
+            return DiagnosticsResult(self.collect_namespace_diagnostics, diagnostics)
         except (CancelledError, SystemExit, KeyboardInterrupt):
             raise
         except BaseException as e:
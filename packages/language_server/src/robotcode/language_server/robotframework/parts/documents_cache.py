@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import ast
 import io
+import itertools
 import threading
 import weakref
+from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Dict,
     Iterable,
     Iterator,
     List,
@@ -19,17 +22,19 @@ from typing import (
 
 from robot.parsing.lexer.tokens import Token
 
+from robotcode.core.concurrent import Task, TaskPriority, check_current_task_canceled, run_as_task_with_priority
 from robotcode.core.event import event
 from robotcode.core.lsp.types import MessageType
 from robotcode.core.text_document import TextDocument
 from robotcode.core.uri import Uri
 from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.core.utils.metrics import metrics
 from robotcode.robot.utils import get_robot_version
 from robotcode.robot.utils.stubs import Languages
 
 from ...common.decorators import language_id_filter
 from ...common.parts.workspace import WorkspaceFolder
-from ..configuration import RobotCodeConfig, RobotConfig
+from ..configuration import AnalysisConfig, RobotCodeConfig, RobotConfig
 from ..diagnostics.imports_manager import ImportsManager
 from ..diagnostics.namespace import DocumentType, Namespace
 from .protocol_part import RobotLanguageServerProtocolPart
@@ -38,10 +43,28 @@ if TYPE_CHECKING:
     from ..protocol import RobotLanguageServerProtocol
 
 
+DOCUMENT_CACHE_SIZE_FACTOR = 100
+
+
 class UnknownFileTypeError(Exception):
     pass
 
 
+@dataclass
+class DocumentsCacheStatistics:
+    documents: int
+    estimated_size: int
+    memory_budget: int
+    evicted_documents: int
+
+
+@dataclass
+class _CacheUsage:
+    version: Optional[int]
+    size: int
+    last_used: int
+
+
 class DocumentsCache(RobotLanguageServerProtocolPart):
     _logger = LoggingDescriptor()
 
@@ -55,6 +78,31 @@ class DocumentsCache(RobotLanguageServerProtocolPart):
             WorkspaceFolder, Optional[Languages]
         ] = weakref.WeakKeyDictionary()
 
+        self._cache_usage_lock = threading.RLock()
+        self._cache_usage: Dict[weakref.ref[TextDocument], _CacheUsage] = {}
+        self._cache_usage_counter = itertools.count()
+        self._cache_usage_size = 0
+        self._evicting_documents: weakref.WeakSet[TextDocument] = weakref.WeakSet()
+        self._memory_budget = 0
+        self._evicted_documents = 0
+        self._evict_task: Optional[Task[None]] = None
+        self._in_workspace_diagnostics = False
+
+        parent.diagnostics.on_workspace_diagnostics_analyze.add(self.on_workspace_diagnostics_analyze)
+        parent.diagnostics.on_workspace_diagnostics_end.add(self.on_workspace_diagnostics_end)
+
+    def on_workspace_diagnostics_analyze(self, sender: Any) -> None:
+        # the namespaces built in the analyze phase are needed again in the collect phase, so nothing is evicted
+        # until the workspace diagnostics loop has finished its pass
+        with self._cache_usage_lock:
+            self._in_workspace_diagnostics = True
+
+    def on_workspace_diagnostics_end(self, sender: Any) -> None:
+        with self._cache_usage_lock:
+            self._in_workspace_diagnostics = False
+
+        self.__schedule_eviction()
+
     def get_workspace_languages(self, document_or_uri: Union[TextDocument, Uri, str]) -> Optional[Languages]:
         if get_robot_version() < (6, 0):
             return None
@@ -131,6 +179,100 @@ class DocumentsCache(RobotLanguageServerProtocolPart):
             workspace_langs,
         )
 
+    def __touch(self, document: TextDocument) -> None:
+        # called on every access to a cached model or namespace, so only the first access to a new version of
+        # the document takes the lock and calculates the size
+        usage = self._cache_usage.get(weakref.ref(document), None)
+        if usage is not None and usage.version == document.version:
+            usage.last_used = next(self._cache_usage_counter)
+            return
+
+        self.__update_cache_usage(document)
+
+    def __update_cache_usage(self, document: TextDocument) -> None:
+        version = document.version
+        size = len(document.text()) * DOCUMENT_CACHE_SIZE_FACTOR
+
+        with self._cache_usage_lock:
+            reference = weakref.ref(document)
+            usage = self._cache_usage.get(reference, None)
+            if usage is None:
+                self._cache_usage[weakref.ref(document, self.__remove_cache_usage)] = _CacheUsage(
+                    version, size, next(self._cache_usage_counter)
+                )
+                self._cache_usage_size += size
+            else:
+                self._cache_usage_size += size - usage.size
+                usage.version = version
+                usage.size = size
+                usage.last_used = next(self._cache_usage_counter)
+
+        if usage is None:
+            self._memory_budget = (
+                self.parent.workspace.get_configuration(AnalysisConfig, document.uri).cache.memory_budget * 1024 * 1024
+            )
+
+        self.__schedule_eviction()
+
+    def __remove_cache_usage(self, reference: weakref.ref[TextDocument]) -> None:
+        with self._cache_usage_lock:
+            usage = self._cache_usage.pop(reference, None)
+            if usage is not None:
+                self._cache_usage_size -= usage.size
+
+    def __schedule_eviction(self) -> None:
+        with self._cache_usage_lock:
+            if (
+                self._in_workspace_diagnostics
+                or self._memory_budget <= 0
+                or self._cache_usage_size <= self._memory_budget
+            ):
+                return
+
+            if self._evict_task is None or self._evict_task.done():
+                self._evict_task = run_as_task_with_priority(TaskPriority.LOW, self.__evict_document_caches)
+
+    def __evict_document_caches(self) -> None:
+        evicted: List[TextDocument] = []
+
+        with self._cache_usage_lock:
+            if self._in_workspace_diagnostics or self._cache_usage_size <= self._memory_budget:
+                return
+
+            # the most recently used document is kept, it is the one that is currently worked on
+            for reference, usage in sorted(self._cache_usage.items(), key=lambda v: v[1].last_used)[:-1]:
+                if self._cache_usage_size <= self._memory_budget:
+                    break
+
+                document = reference()
+                if document is None or document.opened_in_editor:
+                    continue
+
+                del self._cache_usage[reference]
+                self._cache_usage_size -= usage.size
+                evicted.append(document)
+
+            self._evicted_documents += len(evicted)
+
+        for document in evicted:
+            check_current_task_canceled()
+
+            # the content of an evicted document has not changed, so the namespace is not reported as invalidated
+            self._evicting_documents.add(document)
+            try:
+                document.invalidate_cache()
+            finally:
+                self._evicting_documents.discard(document)
+
+        if evicted:
+            self._logger.debug(lambda: f"Evicted cached models and namespaces of {len(evicted)} documents")
+
+    def get_cache_statistics(self) -> DocumentsCacheStatistics:
+        with self._cache_usage_lock:
+            return DocumentsCacheStatistics(
+                len(self._cache_usage), self._cache_usage_size, self._memory_budget, self._evicted_documents
+            )
+
     def get_document_type(self, document: TextDocument) -> DocumentType:
         return document.get_cache(self.__get_document_type)
 
@@ -148,6 +290,8 @@ class DocumentsCache(RobotLanguageServerProtocolPart):
         return DocumentType.UNKNOWN
 
     def get_tokens(self, document: TextDocument, data_only: bool = False) -> List[Token]:
+        self.__touch(document)
+
         if data_only:
             return document.get_cache(self.__get_tokens_data_only)
         return document.get_cache(self.__get_tokens)
@@ -175,6 +319,8 @@ class DocumentsCache(RobotLanguageServerProtocolPart):
         raise UnknownFileTypeError(str(document.uri))
 
     def get_general_tokens(self, document: TextDocument, data_only: bool = False) -> List[Token]:
+        self.__touch(document)
+
         if data_only:
             return document.get_cache(self.__get_general_tokens_data_only)
         return document.get_cache(self.__get_general_tokens)
@@ -255,9 +401,12 @@ class DocumentsCache(RobotLanguageServerProtocolPart):
         return self.__get_tokens_internal(document, get)
 
     def __get_tokens_internal(self, document: TextDocument, get: Callable[[str], List[Token]]) -> List[Token]:
-        return get(document.text())
+        with metrics.timer("phase.tokenize"):
+            return get(document.text())
 
     def get_resource_tokens(self, document: TextDocument, data_only: bool = False) -> List[Token]:
+        self.__touch(document)
+
         if data_only:
             return document.get_cache(self.__get_resource_tokens_data_only)
 
@@ -282,6 +431,8 @@ class DocumentsCache(RobotLanguageServerProtocolPart):
         return self.__get_tokens_internal(document, get)
 
     def get_init_tokens(self, document: TextDocument, data_only: bool = False) -> List[Token]:
+        self.__touch(document)
+
         if data_only:
             return document.get_cache(self.__get_init_tokens_data_only)
         return document.get_cache(self.__get_init_tokens)
@@ -328,10 +479,11 @@ class DocumentsCache(RobotLanguageServerProtocolPart):
             for t in tokens:
                 yield t
 
-        if get_robot_version() >= (6, 0):
-            model = _get_model(get_tokens, document.uri.to_path(), False, None, None)
-        else:
-            model = _get_model(get_tokens, document.uri.to_path(), False, None)
+        with metrics.timer("phase.parse"):
+            if get_robot_version() >= (6, 0):
+                model = _get_model(get_tokens, document.uri.to_path(), False, None, None)
+            else:
+                model = _get_model(get_tokens, document.uri.to_path(), False, None)
 
         model.source = str(document.uri.to_path())
         model.model_type = document_type
@@ -382,24 +534,32 @@ class DocumentsCache(RobotLanguageServerProtocolPart):
         return self.__get_model(document, tokens, DocumentType.INIT)
 
     def get_namespace(self, document: TextDocument) -> Namespace:
+        self.__touch(document)
+
         return document.get_cache(self.__get_namespace)
 
     def __get_namespace(self, document: TextDocument) -> Namespace:
         return self.__get_namespace_for_document_type(document, None)
 
     def get_resource_namespace(self, document: TextDocument) -> Namespace:
+        self.__touch(document)
+
         return document.get_cache(self.__get_resource_namespace)
 
     def __get_resource_namespace(self, document: TextDocument) -> Namespace:
         return self.__get_namespace_for_document_type(document, DocumentType.RESOURCE)
 
     def get_init_namespace(self, document: TextDocument) -> Namespace:
+        self.__touch(document)
+
         return document.get_cache(self.__get_init_namespace)
 
     def __get_init_namespace(self, document: TextDocument) -> Namespace:
         return self.__get_namespace_for_document_type(document, DocumentType.INIT)
 
     def get_general_namespace(self, document: TextDocument) -> Namespace:
+        self.__touch(document)
+
         return document.get_cache(self.__get_general_namespace)
 
     def __get_general_namespace(self, document: TextDocument) -> Namespace:
@@ -417,6 +577,9 @@ class DocumentsCache(RobotLanguageServerProtocolPart):
             self.namespace_invalidated(self, sender, callback_filter=language_id_filter(document))
 
     def __document_cache_invalidated(self, sender: TextDocument) -> None:
+        if sender in self._evicting_documents:
+            return
+
         namespace: Optional[Namespace] = sender.get_cache_value(self.__get_namespace)
         if namespace is not None:
             self.namespace_invalidated(self, namespace, callback_filter=language_id_filter(sender))
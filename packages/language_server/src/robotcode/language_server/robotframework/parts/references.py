@@ -1,10 +1,12 @@
 import ast
+import threading
 from concurrent.futures import CancelledError
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Type, cast
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type, cast
 
 from robot.parsing.model.statements import Statement
 
-from robotcode.core.concurrent import check_current_task_canceled
+from robotcode.core.concurrent import Task, TaskPriority, check_current_task_canceled, run_as_task_with_priority
 from robotcode.core.event import event
 from robotcode.core.lsp.types import (
     FileEvent,
@@ -42,6 +44,7 @@ from robotcode.robot.utils.match import normalize
 from ...common.decorators import language_id
 from ..diagnostics.model_helper import ModelHelper
 from ..diagnostics.namespace import Namespace
+from ..diagnostics.tag_index import DocumentTags, TagIndex, TagLocation
 from .protocol_part import RobotLanguageServerProtocolPart
 
 if TYPE_CHECKING:
@@ -52,6 +55,52 @@ _ReferencesMethod = Callable[
     Optional[List[Location]],
 ]
 
+# number of leading words that are stripped from a name to cover BDD prefixes like `Given` or `Étant donné que`
+_MAX_PREFIX_WORDS = 3
+
+
+@dataclass
+class DocumentNames:
+    """Normalized names used in a document, used to skip documents that can't contain a reference."""
+
+    keywords: Set[str] = field(default_factory=set)
+    text: str = ""
+
+
+def _iter_name_variants(value: str) -> Iterator[str]:
+    yield value
+
+    # keywords can be called with BDD prefixes and library or resource names, e.g. `Given MyLib.My Keyword`
+    rest = value
+    for _ in range(_MAX_PREFIX_WORDS):
+        _, sep, rest = rest.partition(" ")
+        if not sep:
+            break
+        yield rest
+
+    for v in [value, *value.split(" ", _MAX_PREFIX_WORDS)[1:]]:
+        index = v.find(".")
+        while index >= 0:
+            yield v[index + 1 :]
+            index = v.find(".", index + 1)
+
+
+def _get_literal_parts(name: str) -> List[str]:
+    from robot.variables.search import search_variable
+
+    result = []
+    rest = name
+    while rest:
+        match = search_variable(rest, ignore_errors=True)
+        if not match:
+            result.append(rest)
+            break
+
+        result.append(rest[: match.start])
+        rest = rest[match.end :]
+
+    return [n for n in (normalize(r) for r in result) if n]
+
 
 class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
     _logger = LoggingDescriptor()
@@ -61,11 +110,17 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
 
         self._keyword_reference_cache = SimpleLRUCache(max_items=None)
         self._variable_reference_cache = SimpleLRUCache(max_items=None)
+        self._tag_index = TagIndex()
+        self._tag_index_lock = threading.RLock()
+        self._changed_tag_documents: Dict[str, TextDocument] = {}
+        self._tag_index_task: Optional[Task[None]] = None
 
         parent.on_initialized.add(self.server_initialized)
 
         parent.references.collect.add(self.collect)
         parent.documents.did_change.add(self.document_did_change)
+        parent.documents.did_append.add(self.document_did_append)
+        parent.documents.did_close.add(self.document_did_close)
         parent.documents_cache.namespace_invalidated(self.namespace_invalidated)
         parent.diagnostics.on_workspace_diagnostics_break.add(self.on_workspace_diagnostics_break)
 
@@ -86,6 +141,22 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
     @language_id("robotframework")
     def document_did_change(self, sender: Any, document: TextDocument) -> None:
         self.clear_cache()
+        self._queue_tag_index_update(document)
+
+    @language_id("robotframework")
+    def document_did_append(self, sender: Any, document: TextDocument) -> None:
+        self._queue_tag_index_update(document)
+
+    @language_id("robotframework")
+    def document_did_close(self, sender: Any, document: TextDocument) -> None:
+        if self.parent.documents.get(document.uri) is not None:
+            self._queue_tag_index_update(document)
+            return
+
+        with self._tag_index_lock:
+            self._changed_tag_documents.pop(str(document.uri), None)
+
+        self._tag_index.remove(str(document.uri))
 
     def namespace_invalidated(self, sender: Any, namespace: Namespace) -> None:
         self.clear_cache()
@@ -143,12 +214,49 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
 
         return None
 
+    def get_document_names(self, document: TextDocument) -> DocumentNames:
+        return document.get_cache(self.__get_document_names)
+
+    def __get_document_names(self, document: TextDocument) -> DocumentNames:
+        result = DocumentNames()
+
+        values = [t.value for t in self.parent.documents_cache.get_tokens(document, True) if t.value]
+
+        for value in values:
+            result.keywords.update(normalize(v) for v in _iter_name_variants(value))
+
+        result.text = "\n".join(normalize(v) for v in values)
+
+        return result
+
+    def _is_keyword_candidate(self, doc: TextDocument, kw_doc: KeywordDoc) -> bool:
+        names = self.get_document_names(doc)
+
+        if kw_doc.is_embedded:
+            # embedded arguments can match anything, so only the literal parts of the name can be checked
+            return all(part in names.text for part in _get_literal_parts(kw_doc.name))
+
+        return kw_doc.matcher.normalized_name in names.keywords
+
+    def _is_variable_candidate(self, doc: TextDocument, variable: VariableDefinition) -> bool:
+        try:
+            name = variable.matcher.normalized_name
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException:
+            return True
+
+        # variables can be used with extended syntax or inside of python expressions like `${{ $var + 1 }}`,
+        # so we can only check if the name occurs somewhere in the document
+        return name in self.get_document_names(doc).text
+
     def _find_references_in_workspace(
         self,
         document: TextDocument,
         stop_at_first: bool,
         func: Callable[..., List[Location]],
         *args: Any,
+        candidate_filter: Optional[Callable[[TextDocument], bool]] = None,
         **kwargs: Any,
     ) -> List[Location]:
         result: List[Location] = []
@@ -156,6 +264,9 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         for doc in filter(lambda d: d.language_id == "robotframework", self.parent.documents.documents):
             check_current_task_canceled()
 
+            if candidate_filter is not None and not candidate_filter(doc):
+                continue
+
             result.extend(func(doc, *args, **kwargs))
             if result and stop_at_first:
                 break
@@ -236,6 +347,7 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
                     self.find_variable_references_in_file,
                     variable,
                     False,
+                    candidate_filter=lambda doc: self._is_variable_candidate(doc, variable),
                 )
             )
         return result
@@ -378,6 +490,7 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
                 kw_doc,
                 lib_doc,
                 False,
+                candidate_filter=lambda doc: self._is_keyword_candidate(doc, kw_doc),
             )
         )
 
@@ -582,7 +695,10 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
 
         return None
 
-    def find_tag_references_in_file(self, doc: TextDocument, tag: str, is_normalized: bool = False) -> List[Location]:
+    def get_document_tags(self, doc: TextDocument) -> DocumentTags:
+        return doc.get_cache(self.__get_document_tags)
+
+    def __get_document_tags(self, doc: TextDocument) -> DocumentTags:
         from robot.parsing.lexer.tokens import Token as RobotToken
         from robot.parsing.model import statements
 
@@ -606,18 +722,68 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
 
         model = self.parent.documents_cache.get_model(doc)
 
-        result: List[Location] = []
-        if not is_normalized:
-            tag = normalize(tag)
+        result: DocumentTags = {}
 
         for node in iter_nodes(model):
             if isinstance(node, tag_statments):
                 for token in node.get_tokens(RobotToken.ARGUMENT):
-                    if token.value and normalize(token.value) == tag:
-                        result.append(Location(str(doc.uri), range_from_token(token)))
+                    if token.value:
+                        result.setdefault(normalize(token.value), []).append(
+                            TagLocation(token.value, range_from_token(token))
+                        )
 
         return result
 
+    def _queue_tag_index_update(self, document: TextDocument) -> None:
+        with self._tag_index_lock:
+            self._changed_tag_documents[str(document.uri)] = document
+
+            if self._tag_index_task is None or self._tag_index_task.done():
+                self._tag_index_task = run_as_task_with_priority(TaskPriority.LOW, self._run_tag_index_update)
+
+    def _run_tag_index_update(self) -> None:
+        while True:
+            with self._tag_index_lock:
+                if not self._changed_tag_documents:
+                    self._tag_index_task = None
+                    return
+
+            self.update_tag_index()
+
+    def update_tag_index(self) -> TagIndex:
+        """Updates the tags of the documents that were added or changed since the last update."""
+
+        with self._tag_index_lock:
+            documents = list(self._changed_tag_documents.values())
+            self._changed_tag_documents.clear()
+
+        try:
+            while documents:
+                check_current_task_canceled()
+
+                doc = documents[-1]
+                if self.parent.documents.get(doc.uri) is doc:
+                    self._tag_index.update(str(doc.uri), self.get_document_tags(doc))
+
+                documents.pop()
+        finally:
+            if documents:
+                with self._tag_index_lock:
+                    for doc in documents:
+                        self._changed_tag_documents.setdefault(str(doc.uri), doc)
+
+        return self._tag_index
+
+    def get_project_tags(self) -> List[Tuple[str, int]]:
+        """The tags of the workspace, as currently known by the tag index, documents are not parsed here."""
+        return self._tag_index.get_tags()
+
+    def find_tag_references_in_file(self, doc: TextDocument, tag: str, is_normalized: bool = False) -> List[Location]:
+        if not is_normalized:
+            tag = normalize(tag)
+
+        return [Location(str(doc.uri), loc.range) for loc in self.get_document_tags(doc).get(tag, [])]
+
     def _references_tags(
         self,
         node: ast.AST,
@@ -639,13 +805,7 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         return None
 
     def find_tag_references(self, document: TextDocument, tag: str) -> List[Location]:
-        return self._find_references_in_workspace(
-            document,
-            False,
-            self.find_tag_references_in_file,
-            normalize(tag),
-            True,
-        )
+        return self.update_tag_index().get_locations(normalize(tag))
 
     def references_ForceTags(  # noqa: N802
         self,
@@ -1,13 +1,22 @@
+import os
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 from threading import Event
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
 
+from robotcode.core.concurrent import check_current_task_canceled, get_worker_pool
 from robotcode.core.lsp.types import FileChangeType, FileEvent, WatchKind
 from robotcode.core.uri import InvalidUriError, Uri
+from robotcode.core.utils.caching import CacheStatistics
 from robotcode.core.utils.glob_path import iter_files
 from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.core.utils.metrics import metrics
+from robotcode.core.utils.profiler import get_profiling_output_dir, is_profiling, start_profiling, stop_profiling
 from robotcode.jsonrpc2.protocol import rpc_method
-from robotcode.language_server.common.decorators import language_id
+from robotcode.language_server.common.decorators import command, language_id
 from robotcode.language_server.common.parts.diagnostics import (
     AnalysisProgressMode,
     DiagnosticsMode,
@@ -20,6 +29,7 @@ from robotcode.language_server.robotframework.configuration import (
 from robotcode.robot.diagnostics.library_doc import (
     RESOURCE_FILE_EXTENSION,
     ROBOT_FILE_EXTENSION,
+    get_markdown_cache_statistics,
 )
 
 if TYPE_CHECKING:
@@ -27,13 +37,32 @@ if TYPE_CHECKING:
         RobotLanguageServerProtocol,
     )
 
+from .documents_cache import DocumentsCacheStatistics
 from .protocol_part import RobotLanguageServerProtocolPart
 
+LOAD_WORKSPACE_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+LOAD_WORKSPACE_MAX_PENDING = LOAD_WORKSPACE_MAX_WORKERS * 4
+
 
 class CantReadDocumentError(Exception):
     pass
 
 
+@dataclass
+class CacheStatisticsResult:
+    documents: DocumentsCacheStatistics
+    imports_managers: Dict[str, Dict[str, CacheStatistics]]
+    markdown: Dict[str, CacheStatistics]
+
+
+@dataclass
+class ProfilingStatus:
+    running: bool
+    output_dir: Optional[str] = None
+    collapsed_file: Optional[str] = None
+    pstats_file: Optional[str] = None
+
+
 class RobotWorkspaceProtocolPart(RobotLanguageServerProtocolPart):
     _logger = LoggingDescriptor()
 
@@ -46,6 +75,12 @@ class RobotWorkspaceProtocolPart(RobotLanguageServerProtocolPart):
         self.parent.on_initialized.add(self.server_initialized)
         self.documents_loaded = Event()
 
+        metrics.register_gauge("worker_pool", get_worker_pool().get_statistics)
+        metrics.register_gauge("dropped_requests", lambda: self.parent.dropped_requests)
+        metrics.register_gauge("caches", self.robot_cache_stats)
+
+        self.parent.commands.register_all(self)
+
     def server_initialized(self, sender: Any) -> None:
         self.parent.workspace.add_file_watcher(
             self.on_file_changed,
@@ -84,59 +119,122 @@ class RobotWorkspaceProtocolPart(RobotLanguageServerProtocolPart):
         config = self.parent.workspace.get_configuration(AnalysisConfig, uri)
         return config.progress_mode
 
+    def _read_document_text(self, path: Path) -> str:
+        return self.parent.documents.read_document_text(Uri.from_path(path).normalized(), "robotframework")
+
     def load_workspace_documents(self, sender: Any) -> List[WorkspaceDocumentsResult]:
         start = time.monotonic()
+        result: List[WorkspaceDocumentsResult] = []
         try:
-            result: List[WorkspaceDocumentsResult] = []
-
             for folder in self.parent.workspace.workspace_folders:
                 config = self.parent.workspace.get_configuration(RobotCodeConfig, folder.uri)
+                folder_path = folder.uri.to_path()
+
+                with self.parent.window.progress(
+                    "Load workspace", start=False, cancellable=False
+                ) as progress, ThreadPoolExecutor(
+                    max_workers=LOAD_WORKSPACE_MAX_WORKERS, thread_name_prefix="robotcode_load_workspace"
+                ) as executor:
+                    # scanning, reading and registering of the documents overlap: files are read on the
+                    # thread pool while the directory scan continues, the documents are registered in
+                    # scan order on this thread as soon as their text is available
+                    pending: Deque[Tuple[Path, Future[str]]] = deque()
+                    found = 0
+                    loaded = 0
+                    scanned = False
+
+                    def register(path: Path, future: Future[str]) -> None:
+                        nonlocal loaded
+
+                        try:
+                            document = self.parent.documents.get_or_open_document(path, text=future.result())
+                            result.append(WorkspaceDocumentsResult(str(path.relative_to(folder_path)), document))
+                        except (SystemExit, KeyboardInterrupt):
+                            raise
+                        except BaseException as e:
+                            ex = e
+                            self._logger.critical(lambda: f"Can't load document {path}: {ex}")
+
+                        loaded += 1
+
+                        if config.analysis.progress_mode != AnalysisProgressMode.OFF:
+                            # the number of documents is only known when the scan is finished, until then the
+                            # progress is indeterminate
+                            progress.begin()
+                            progress.report(
+                                f"Load {path.relative_to(folder_path)!s}"
+                                if config.analysis.progress_mode == AnalysisProgressMode.DETAILED
+                                else None,
+                                current=loaded if scanned else None,
+                                max=found if scanned else None,
+                            )
 
-                with self.parent.window.progress("Collect sources", cancellable=False):
-                    files = list(
-                        iter_files(
-                            folder.uri.to_path(),
+                    try:
+                        for f in iter_files(
+                            folder_path,
                             f"**/*.{{{ROBOT_FILE_EXTENSION[1:]},{RESOURCE_FILE_EXTENSION[1:]}}}",
                             ignore_patterns=config.workspace.exclude_patterns or [],
                             absolute=True,
-                        )
-                    )
+                        ):
+                            check_current_task_canceled()
 
-                canceled = False
-                with self.parent.window.progress(
-                    "Load workspace", current=0, max=len(files), start=False, cancellable=False
-                ) as progress:
-                    try:
-                        for i, f in enumerate(files):
-                            try:
-                                self.parent.documents.get_or_open_document(f)
-
-                                if config.analysis.progress_mode != AnalysisProgressMode.OFF:
-                                    name = f.relative_to(folder.uri.to_path())
-
-                                    progress.begin()
-                                    progress.report(
-                                        f"Load {name!s}"
-                                        if config.analysis.progress_mode == AnalysisProgressMode.DETAILED
-                                        else None,
-                                        current=i,
-                                    )
-                            except (SystemExit, KeyboardInterrupt):
-                                raise
-                            except BaseException as e:
-                                ex = e
-                                self._logger.critical(lambda: f"Can't load document {f}: {ex}")
-                    finally:
-                        self.documents_loaded.set()
+                            found += 1
+                            pending.append((f, executor.submit(self._read_document_text, f)))
+
+                            while pending and (len(pending) > LOAD_WORKSPACE_MAX_PENDING or pending[0][1].done()):
+                                register(*pending.popleft())
 
-            if canceled:
-                return []
+                        scanned = True
+
+                        while pending:
+                            check_current_task_canceled()
+
+                            register(*pending.popleft())
+                    finally:
+                        for _, future in pending:
+                            future.cancel()
 
             return result
         finally:
+            self.documents_loaded.set()
+
             self._logger.info(lambda: f"Workspace loaded {len(result)} documents in {time.monotonic() - start}s")
 
     @rpc_method(name="robot/cache/clear", threaded=True)
     def robot_cache_clear(self) -> None:
         for folder in self.parent.workspace.workspace_folders:
             self.parent.documents_cache.get_imports_manager_for_workspace_folder(folder).clear_cache()
+
+    @rpc_method(name="robot/cache/stats", threaded=True)
+    def robot_cache_stats(self) -> CacheStatisticsResult:
+        return CacheStatisticsResult(
+            self.parent.documents_cache.get_cache_statistics(),
+            {
+                str(folder.uri): self.parent.documents_cache.get_imports_manager_for_workspace_folder(
+                    folder
+                ).get_cache_statistics()
+                for folder in self.parent.workspace.workspace_folders
+            },
+            get_markdown_cache_statistics(),
+        )
+
+    @rpc_method(name="robot/metrics", threaded=True)
+    def robot_metrics(self) -> Dict[str, Any]:
+        return metrics.snapshot()
+
+    @command("robotcode.toggleProfiling")
+    def toggle_profiling(self, duration: Optional[float] = None) -> ProfilingStatus:
+        if is_profiling():
+            result = stop_profiling()
+            if result is None:
+                return ProfilingStatus(False)
+
+            return ProfilingStatus(
+                False, str(result.collapsed_file.parent), str(result.collapsed_file), str(result.pstats_file)
+            )
+
+        folders = self.parent.workspace.workspace_folders
+        output_dir = get_profiling_output_dir(folders[0].uri.to_path() if folders else None)
+        start_profiling(output_dir, duration)
+
+        return ProfilingStatus(True, str(output_dir))
@@ -0,0 +1,270 @@
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
+
+from robot.parsing.lexer.tokens import Token
+from robot.parsing.model.blocks import File, Keyword, TestCase
+from robot.parsing.model.statements import Variable
+
+from robotcode.core.concurrent import TaskPriority, check_current_task_canceled, run_as_task_with_priority
+from robotcode.core.lsp.types import Location, Range, SymbolInformation, SymbolKind
+from robotcode.core.text_document import TextDocument
+from robotcode.core.uri import Uri
+from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.robot.diagnostics.library_doc import LibraryDoc
+from robotcode.robot.utils import get_robot_version
+from robotcode.robot.utils.ast import range_from_token
+
+from ...common.decorators import language_id
+from ...common.parts.workspace import WorkspaceFolder
+from ..diagnostics.analysis_cache import get_content_hash
+from ..diagnostics.namespace import DocumentType, Namespace
+from ..diagnostics.symbol_index import (
+    IndexedDocument,
+    IndexedSymbol,
+    PreparedSymbol,
+    SymbolIndex,
+    prepare_symbols,
+)
+from .protocol_part import RobotLanguageServerProtocolPart
+
+if TYPE_CHECKING:
+    from ..protocol import RobotLanguageServerProtocol
+
+MAX_WORKSPACE_SYMBOLS = 1000
+SYMBOL_INDEX_SAVE_DELAY = 10.0
+
+
+def _get_suite_name(path: Path) -> str:
+    if path.stem == "__init__":
+        path = path.parent
+
+    if get_robot_version() >= (6, 1):
+        from robot.running.model import TestSuite
+
+        return str(TestSuite.name_from_source(path))
+
+    from robot.utils import printable_name
+
+    name = path.stem.split("__", 1)[-1] if "__" in path.stem else path.stem
+    return str(printable_name(name, code_style=False))
+
+
+class RobotWorkspaceSymbolsProtocolPart(RobotLanguageServerProtocolPart):
+    _logger = LoggingDescriptor()
+
+    def __init__(self, parent: "RobotLanguageServerProtocol") -> None:
+        super().__init__(parent)
+
+        parent.workspace_symbols.collect.add(self.collect)
+        parent.on_initialized.add(self._on_initialized)
+        parent.on_shutdown.add(self._on_shutdown)
+
+        parent.documents.did_append.add(self._document_changed)
+        parent.documents.did_change.add(self._document_changed)
+        parent.documents.did_close.add(self._document_closed)
+        parent.documents_cache.namespace_invalidated.add(self._namespace_invalidated)
+        parent.diagnostics.on_workspace_loaded.add(self._on_workspace_loaded)
+
+        self._index: Optional[SymbolIndex] = None
+        self._index_lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._changed_documents_lock = threading.RLock()
+        self._changed_documents: Dict[str, TextDocument] = {}
+        self._library_symbols_lock = threading.RLock()
+        self._library_symbols: Dict[int, Tuple[LibraryDoc, List[PreparedSymbol]]] = {}
+
+    def _on_initialized(self, sender: Any) -> None:
+        # load the persisted index in the background, so the first query does not have to wait for it
+        run_as_task_with_priority(TaskPriority.LOW, self.get_index)
+
+    def _on_shutdown(self, sender: Any) -> None:
+        with self._index_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+
+            if self._index is not None:
+                self._index.save()
+
+    def get_index(self) -> SymbolIndex:
+        with self._index_lock:
+            if self._index is None:
+                folders = self.parent.workspace.workspace_folders
+                imports_manager = self.parent.documents_cache.get_imports_manager_for_workspace_folder(
+                    folders[0] if folders else None
+                )
+
+                self._index = SymbolIndex(imports_manager.cache_path / "symbol_index.json")
+                self._index.load()
+
+            return self._index
+
+    def _schedule_save(self, index: SymbolIndex) -> None:
+        with self._index_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+
+            self._save_timer = threading.Timer(SYMBOL_INDEX_SAVE_DELAY, index.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    @language_id("robotframework")
+    def _document_changed(self, sender: Any, document: TextDocument) -> None:
+        with self._changed_documents_lock:
+            self._changed_documents[str(document.uri)] = document
+
+    @language_id("robotframework")
+    def _document_closed(self, sender: Any, document: TextDocument) -> None:
+        if self.parent.documents.get(document.uri) is not None:
+            # closed in the editor, the document is reverted to the content on disk
+            self._document_changed(sender, document)
+            return
+
+        with self._changed_documents_lock:
+            self._changed_documents.pop(str(document.uri), None)
+
+        index = self.get_index()
+        index.remove(str(document.uri.to_path()))
+        if index.modified:
+            self._schedule_save(index)
+
+    def _namespace_invalidated(self, sender: Any, namespace: Namespace) -> None:
+        if namespace.document is not None:
+            self._document_changed(sender, namespace.document)
+
+    def _on_workspace_loaded(self, sender: Any) -> None:
+        run_as_task_with_priority(TaskPriority.LOW, self._retain_loaded_documents)
+
+    def _retain_loaded_documents(self) -> None:
+        index = self.get_index()
+
+        # remove documents from the persisted index that do not exist anymore
+        index.retain(str(d.uri.to_path()) for d in self.parent.documents.documents if d.language_id == "robotframework")
+
+        self.update_index()
+
+    def update_index(self) -> SymbolIndex:
+        """Indexes the documents that were added or changed since the last update."""
+
+        index = self.get_index()
+
+        with self._changed_documents_lock:
+            documents = list(self._changed_documents.values())
+            self._changed_documents.clear()
+
+        try:
+            while documents:
+                check_current_task_canceled()
+
+                document = documents[-1]
+                if self.parent.documents.get(document.uri) is document:
+                    document.get_cache(self.__get_indexed_document, index)
+
+                documents.pop()
+        finally:
+            if documents:
+                with self._changed_documents_lock:
+                    for document in documents:
+                        self._changed_documents.setdefault(str(document.uri), document)
+
+        if index.modified:
+            self._schedule_save(index)
+
+        return index
+
+    def __get_indexed_document(self, document: TextDocument, index: SymbolIndex) -> IndexedDocument:
+        source = str(document.uri.to_path())
+        content_hash = get_content_hash(document)
+
+        result = index.get(source)
+        if result is None or result.content_hash != content_hash:
+            result = IndexedDocument(source, content_hash, self.collect_document_symbols(document))
+            index.update(result)
+
+        return result
+
+    def collect_document_symbols(self, document: TextDocument) -> List[IndexedSymbol]:
+        path = document.uri.to_path()
+        document_type = self.parent.documents_cache.get_document_type(document)
+
+        if document_type == DocumentType.RESOURCE:
+            container_name = path.stem
+            result = [IndexedSymbol(path.name, SymbolKind.FILE, Range.zero())]
+        else:
+            container_name = _get_suite_name(path)
+            result = [IndexedSymbol(container_name, SymbolKind.MODULE, Range.zero())]
+
+        model = cast(File, self.parent.documents_cache.get_model(document, True))
+
+        for section in model.sections:
+            for node in section.body:
+                token: Optional[Token] = None
+                kind: Optional[SymbolKind] = None
+
+                if isinstance(node, Keyword):
+                    token = node.header.get_token(Token.KEYWORD_NAME)
+                    kind = SymbolKind.FUNCTION
+                elif isinstance(node, TestCase):
+                    token = node.header.get_token(Token.TESTCASE_NAME)
+                    kind = SymbolKind.METHOD
+                elif isinstance(node, Variable):
+                    token = node.get_token(Token.VARIABLE)
+                    kind = SymbolKind.VARIABLE
+
+                if token is None or kind is None or not token.value:
+                    continue
+
+                name = (
+                    token.value[:-1].rstrip()
+                    if kind == SymbolKind.VARIABLE and token.value.endswith("=")
+                    else token.value
+                )
+                result.append(IndexedSymbol(name, kind, range_from_token(token), container_name))
+
+        return result
+
+    def _get_library_symbols(self) -> List[PreparedSymbol]:
+        library_docs: Dict[int, LibraryDoc] = {}
+        folders: List[Optional[WorkspaceFolder]] = [*self.parent.workspace.workspace_folders] or [None]
+        for folder in folders:
+            imports_manager = self.parent.documents_cache.get_imports_manager_for_workspace_folder(folder)
+            for library_doc in imports_manager.get_loaded_library_docs():
+                library_docs[id(library_doc)] = library_doc
+
+        with self._library_symbols_lock:
+            library_symbols: Dict[int, Tuple[LibraryDoc, List[PreparedSymbol]]] = {}
+
+            for key, library_doc in library_docs.items():
+                entry = self._library_symbols.get(key)
+                if entry is None or entry[0] is not library_doc:
+                    entry = (
+                        library_doc,
+                        [
+                            p
+                            for kw in library_doc.keywords.values()
+                            if kw.source
+                            for p in prepare_symbols(
+                                kw.source, [IndexedSymbol(kw.name, SymbolKind.FUNCTION, kw.range, library_doc.name)]
+                            )
+                        ],
+                    )
+                library_symbols[key] = entry
+
+            self._library_symbols = library_symbols
+
+            return [p for _, symbols in library_symbols.values() for p in symbols]
+
+    @_logger.call
+    def collect(self, sender: Any, query: str) -> Optional[List[SymbolInformation]]:
+        index = self.update_index()
+
+        return [
+            SymbolInformation(
+                name=p.symbol.name,
+                kind=p.symbol.kind,
+                location=Location(str(Uri.from_path(p.source)), p.symbol.range),
+                container_name=p.symbol.container_name,
+            )
+            for _, p in index.search(query, MAX_WORKSPACE_SYMBOLS, self._get_library_symbols())
+        ]
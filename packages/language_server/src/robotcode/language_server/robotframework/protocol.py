@@ -58,6 +58,7 @@ from .parts.robot_workspace import RobotWorkspaceProtocolPart
 from .parts.selection_range import RobotSelectionRangeProtocolPart
 from .parts.semantic_tokens import RobotSemanticTokenProtocolPart
 from .parts.signature_help import RobotSignatureHelpProtocolPart
+from .parts.workspace_symbols import RobotWorkspaceSymbolsProtocolPart
 
 if TYPE_CHECKING:
     from .server import RobotLanguageServer
@@ -121,6 +122,7 @@ class RobotLanguageServerProtocol(LanguageServerProtocol):
     robot_code_action_documentation = ProtocolPartDescriptor(RobotCodeActionDocumentationProtocolPart)
     robot_code_action_quick_fixes = ProtocolPartDescriptor(RobotCodeActionQuickFixesProtocolPart)
     robot_code_action_refactor = ProtocolPartDescriptor(RobotCodeActionRefactorProtocolPart)
+    robot_workspace_symbols = ProtocolPartDescriptor(RobotWorkspaceSymbolsProtocolPart)
 
     robot_debugging_utils = ProtocolPartDescriptor(RobotDebuggingUtilsProtocolPart)
 
@@ -35,6 +35,7 @@ from typing import (
 
 from robot.parsing.lexer.tokens import Token
 from robotcode.core.lsp.types import Position, Range
+from robotcode.core.utils.caching import CacheStatistics, SimpleLRUCache
 from robotcode.robot.diagnostics.entities import (
     ArgumentDefinition,
     ImportedVariableDefinition,
@@ -143,6 +144,39 @@ def convert_from_rest(text: str) -> str:
     return text
 
 
+DOC_MARKDOWN_CACHE_SIZE = 1024
+LIBRARY_MARKDOWN_CACHE_SIZE = 128
+
+_doc_markdown_cache = SimpleLRUCache(max_items=DOC_MARKDOWN_CACHE_SIZE)
+_library_markdown_cache = SimpleLRUCache(max_items=LIBRARY_MARKDOWN_CACHE_SIZE)
+
+
+def _convert_doc_to_markdown(doc: str, doc_format: str) -> str:
+    if doc_format == ROBOT_DOC_FORMAT:
+        return MarkDownFormatter().format(doc)
+
+    if doc_format == REST_DOC_FORMAT:
+        return convert_from_rest(doc)
+
+    return doc
+
+
+def doc_to_markdown(doc: str, doc_format: str = ROBOT_DOC_FORMAT) -> str:
+    return _doc_markdown_cache.get(_convert_doc_to_markdown, doc, doc_format)
+
+
+def clear_markdown_cache() -> None:
+    _doc_markdown_cache.clear()
+    _library_markdown_cache.clear()
+
+
+def get_markdown_cache_statistics() -> Dict[str, CacheStatistics]:
+    return {
+        "doc": _doc_markdown_cache.get_statistics(),
+        "library": _library_markdown_cache.get_statistics(),
+    }
+
+
 def is_embedded_keyword(name: str) -> bool:
     from robot.errors import DataError, VariableError
     from robot.running.arguments.embedded import EmbeddedArguments
@@ -300,12 +334,7 @@ class TypeDoc:
             result += f"###{'#' * header_level} Documentation:\n\n"
             result += "\n\n"
 
-            if self.doc_format == ROBOT_DOC_FORMAT:
-                result += MarkDownFormatter().format(self.doc)
-            elif self.doc_format == REST_DOC_FORMAT:
-                result += convert_from_rest(self.doc)
-            else:
-                result += self.doc
+            result += doc_to_markdown(self.doc, self.doc_format)
 
         if self.members:
             result += f"\n\n###{'#' * header_level} Allowed Values:\n\n"
@@ -691,12 +720,7 @@ class KeywordDoc(SourceEntity):
 
             result += f"##{'#' * header_level} Documentation:\n"
 
-            if self.doc_format == ROBOT_DOC_FORMAT:
-                result += MarkDownFormatter().format(self.doc)
-            elif self.doc_format == REST_DOC_FORMAT:
-                result += convert_from_rest(self.doc)
-            else:
-                result += self.doc
+            result += doc_to_markdown(self.doc, self.doc_format)
 
         return result
 
@@ -1059,6 +1083,24 @@ class LibraryDoc:
         add_signature: bool = True,
         only_doc: bool = True,
         header_level: int = 2,
+    ) -> str:
+        if not only_doc:
+            return self._to_markdown(add_signature, only_doc, header_level)
+
+        return _library_markdown_cache.get(
+            lambda *_: self._to_markdown(add_signature, only_doc, header_level),
+            self.digest,
+            self.doc,
+            tuple(str(i) for i in self.inits) if add_signature else None,
+            add_signature,
+            header_level,
+        )
+
+    def _to_markdown(
+        self,
+        add_signature: bool,
+        only_doc: bool,
+        header_level: int,
     ) -> str:
         with io.StringIO(newline="\n") as result:
 
@@ -1087,18 +1129,12 @@ class LibraryDoc:
             if self.doc:
                 write_lines(f"##{'#' * header_level} Introduction", "")
 
-                if self.doc_format == ROBOT_DOC_FORMAT:
-                    doc = MarkDownFormatter().format(self.doc)
+                doc = doc_to_markdown(self.doc, self.doc_format)
 
-                    if "%TOC%" in doc:
-                        doc = self._add_toc(doc, only_doc)
+                if self.doc_format == ROBOT_DOC_FORMAT and "%TOC%" in doc:
+                    doc = self._add_toc(doc, only_doc)
 
-                    result.write(doc)
-
-                elif self.doc_format == REST_DOC_FORMAT:
-                    result.write(convert_from_rest(self.doc))
-                else:
-                    result.write(self.doc)
+                result.write(doc)
 
             if not only_doc:
                 result.write(self._get_doc_for_keywords(header_level=header_level))
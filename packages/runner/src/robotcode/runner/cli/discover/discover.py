@@ -447,6 +447,45 @@ def build_diagnostics(messages: List[Message]) -> Dict[str, List[Diagnostic]]:
     return result
 
 
+def build_suite(settings: RobotSettings, arguments: List[str]) -> TestSuite:
+    if get_robot_version() >= (5, 0):
+        if settings.pythonpath:
+            sys.path = settings.pythonpath + sys.path
+
+    if get_robot_version() > (6, 1):
+        builder = TestSuiteBuilder(
+            included_extensions=settings.extension,
+            included_files=settings.parse_include,
+            custom_parsers=settings.parsers,
+            rpa=settings.rpa,
+            lang=settings.languages,
+            allow_empty_suite=settings.run_empty_suite,
+        )
+    elif get_robot_version() >= (6, 0):
+        builder = TestSuiteBuilder(
+            settings["SuiteNames"],
+            included_extensions=settings.extension,
+            rpa=settings.rpa,
+            lang=settings.languages,
+            allow_empty_suite=settings.run_empty_suite,
+        )
+    else:
+        builder = TestSuiteBuilder(
+            settings["SuiteNames"],
+            included_extensions=settings.extension,
+            rpa=settings.rpa,
+            allow_empty_suite=settings.run_empty_suite,
+        )
+
+    suite = builder.build(*arguments)
+    settings.rpa = suite.rpa
+    if settings.pre_run_modifiers:
+        suite.visit(ModelModifier(settings.pre_run_modifiers, settings.run_empty_suite, LOGGER))
+    suite.configure(**settings.suite_config)
+
+    return suite
+
+
 def handle_options(
     app: Application,
     by_longname: Tuple[str, ...],
@@ -481,40 +520,7 @@ def handle_options(
         diagnostics_logger = DiagnosticsLogger()
         LOGGER.register_logger(diagnostics_logger)
 
-        if get_robot_version() >= (5, 0):
-            if settings.pythonpath:
-                sys.path = settings.pythonpath + sys.path
-
-        if get_robot_version() > (6, 1):
-            builder = TestSuiteBuilder(
-                included_extensions=settings.extension,
-                included_files=settings.parse_include,
-                custom_parsers=settings.parsers,
-                rpa=settings.rpa,
-                lang=settings.languages,
-                allow_empty_suite=settings.run_empty_suite,
-            )
-        elif get_robot_version() >= (6, 0):
-            builder = TestSuiteBuilder(
-                settings["SuiteNames"],
-                included_extensions=settings.extension,
-                rpa=settings.rpa,
-                lang=settings.languages,
-                allow_empty_suite=settings.run_empty_suite,
-            )
-        else:
-            builder = TestSuiteBuilder(
-                settings["SuiteNames"],
-                included_extensions=settings.extension,
-                rpa=settings.rpa,
-                allow_empty_suite=settings.run_empty_suite,
-            )
-
-        suite = builder.build(*arguments)
-        settings.rpa = suite.rpa
-        if settings.pre_run_modifiers:
-            suite.visit(ModelModifier(settings.pre_run_modifiers, settings.run_empty_suite, LOGGER))
-        suite.configure(**settings.suite_config)
+        suite = build_suite(settings, arguments)
 
         collector = Collector()
         suite.visit(collector)
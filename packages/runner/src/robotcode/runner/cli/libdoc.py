@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Any, Optional, Tuple, cast
 
 import click
-from robot.errors import DataError, Information
+from robot.errors import DATA_ERROR, INFO_PRINTED, DataError, Information
 from robot.libdoc import USAGE, LibDoc
 from robot.version import get_full_version
 
@@ -13,6 +13,7 @@ from robotcode.robot.config.model import LibDocProfile
 from robotcode.robot.config.utils import get_config_files
 
 from ..__version__ import __version__
+from .libdoc_batch import INDEX_FILE, LibDocBatchParser, run_libdoc_batch
 
 
 class LibDocEx(LibDoc):
@@ -52,12 +53,55 @@ class LibDocEx(LibDoc):
     prog_name="RobotCode libdoc",
     message=f"%(prog)s %(version)s\n{USAGE.splitlines()[0].split(' -- ')[0].strip()} {get_full_version()}",
 )
+@click.option(
+    "--batch",
+    is_flag=True,
+    help="Builds the documentation for any number of libraries, resource files or glob patterns "
+    "in parallel. Outputs of unchanged libraries are not rebuilt and an index of the generated "
+    "files is written.",
+)
+@click.option(
+    "--batch-output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default="libdoc",
+    help="The directory for the outputs in batch mode.",
+    show_default=True,
+)
+@click.option(
+    "--batch-index",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=f"The index file written in batch mode. [default: <batch-output-dir>/{INDEX_FILE}]",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=0),
+    default=0,
+    help="The number of worker processes in batch mode, 0 means one per CPU.",
+    show_default=True,
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Rebuilds all outputs in batch mode, even if the libraries are unchanged.",
+)
 @click.argument("robot_options_and_args", nargs=-1, type=click.Path())
 @pass_application
-def libdoc(app: Application, robot_options_and_args: Tuple[str, ...]) -> None:
+def libdoc(
+    app: Application,
+    batch: bool,
+    batch_output_dir: Path,
+    batch_index: Optional[Path],
+    jobs: int,
+    force: bool,
+    robot_options_and_args: Tuple[str, ...],
+) -> None:
     """Runs `libdoc` with the selected configuration, profiles, options and arguments.
 
     The options and arguments are passed to `libdoc` as is.
+
+    With `--batch`, all arguments after the options are libraries, resource files or glob patterns,
+    and the output format is selected with `--format`.
     """
 
     robot_arguments = None
@@ -96,6 +140,20 @@ def libdoc(app: Application, robot_options_and_args: Tuple[str, ...]) -> None:
         + " ".join(f'"{o}"' for o in (options + list(robot_options_and_args)))
     )
 
+    if batch:
+        if root_folder is not None:
+            os.chdir(root_folder)
+
+        try:
+            batch_options, sources = LibDocBatchParser().parse_arguments((*options, *robot_options_and_args))
+            app.exit(run_libdoc_batch(app, batch_options, sources, batch_output_dir, batch_index, jobs, force))
+        except Information as err:
+            app.echo(str(err))
+            app.exit(cast(int, INFO_PRINTED))
+        except DataError as err:
+            app.warning(str(err), err=True)
+            app.exit(cast(int, DATA_ERROR))
+
     app.exit(
         cast(
             int,
@@ -0,0 +1,318 @@
+import glob
+import hashlib
+import importlib.util
+import multiprocessing as mp
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from robot.errors import DataError
+from robot.libdoc import USAGE
+from robot.utils import Application as RobotApplication
+from robot.version import get_version
+
+from robotcode.core.utils.dataclasses import as_json, from_json
+from robotcode.plugin import Application
+from robotcode.robot.utils import get_robot_version
+
+INDEX_FILE = "libdoc.json"
+
+FORMAT_EXTENSIONS = {
+    "HTML": ".html",
+    "XML": ".xml",
+    "JSON": ".json",
+    "LIBSPEC": ".libspec",
+}
+
+
+class SpecStatus(str, Enum):
+    GENERATED = "generated"
+    UNCHANGED = "unchanged"
+    FAILED = "failed"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass
+class LibDocBatchOptions:
+    format: str = "HTML"
+    doc_format: Optional[str] = None
+    spec_doc_format: Optional[str] = None
+    theme: Optional[str] = None
+    version: Optional[str] = None
+    python_path: List[str] = field(default_factory=list)
+
+
+@dataclass
+class LibDocSpecInfo:
+    name: str
+    type: str
+    version: str
+    keywords: int
+
+
+@dataclass
+class LibDocSpec:
+    source: str
+    output: str
+    fingerprint: str
+    status: SpecStatus = SpecStatus.GENERATED
+    name: Optional[str] = None
+    type: Optional[str] = None
+    version: Optional[str] = None
+    keywords: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class LibDocIndex:
+    robot_version: str
+    format: str
+    specs: List[LibDocSpec] = field(default_factory=list)
+
+
+class LibDocBatchParser(RobotApplication):
+    """Parses the `libdoc` options, but accepts any number of libraries or resources as arguments."""
+
+    def __init__(self) -> None:
+        super().__init__(USAGE, arg_limits=(1,), auto_version=False)
+
+    def validate(self, options: Any, arguments: Any) -> Any:
+        return options, arguments
+
+
+def _upper(value: Optional[str]) -> Optional[str]:
+    return value.upper() if value else None
+
+
+def get_batch_options(options: Dict[str, Any]) -> LibDocBatchOptions:
+    result = LibDocBatchOptions(
+        format=_upper(options.get("format")) or "HTML",
+        doc_format=_upper(options.get("docformat")),
+        spec_doc_format=_upper(options.get("specdocformat")),
+        theme=_upper(options.get("theme")),
+        version=options.get("version") or None,
+        python_path=list(options.get("pythonpath") or []),
+    )
+
+    if result.format not in FORMAT_EXTENSIONS:
+        raise DataError(f"Format must be {', '.join(FORMAT_EXTENSIONS)}, got '{result.format}'.")
+    if result.theme == "NONE":
+        result.theme = None
+    if result.theme and result.format != "HTML":
+        raise DataError("The --theme option is only applicable with HTML outputs.")
+    if result.spec_doc_format and result.format == "HTML":
+        raise DataError("The --specdocformat option is not applicable with HTML outputs.")
+
+    return result
+
+
+def expand_sources(patterns: Sequence[str]) -> List[str]:
+    """Expands glob patterns, library names and paths without wildcards are used as is."""
+    result: List[str] = []
+
+    for pattern in patterns:
+        if any(c in pattern for c in "*?["):
+            result.extend(sorted(Path(p).as_posix() for p in glob.glob(pattern, recursive=True)))
+        else:
+            result.append(pattern)
+
+    return list(dict.fromkeys(result))
+
+
+def _is_path(library: str) -> bool:
+    return "/" in library or os.sep in library or Path(library).suffix.lower() in (".py", ".resource", ".robot")
+
+
+def get_output_file(source: str, output_dir: Path, format: str) -> Path:
+    library = source.split("::", 1)[0]
+
+    if _is_path(library):
+        path = Path(library)
+        if path.is_absolute():
+            try:
+                path = path.relative_to(Path.cwd())
+            except ValueError:
+                path = Path(path.name)
+
+        return Path(output_dir, path.parent, path.stem + FORMAT_EXTENSIONS[format])
+
+    return Path(output_dir, library + FORMAT_EXTENSIONS[format])
+
+
+def _get_source_files(source: str) -> List[Path]:
+    library = source.split("::", 1)[0]
+
+    if _is_path(library):
+        path = Path(library)
+        if path.is_dir():
+            return sorted(path.rglob("*.py"))
+
+        return [path] if path.exists() else []
+
+    spec = importlib.util.find_spec(library.split(".", 1)[0])
+    if spec is None or spec.origin is None or not Path(spec.origin).exists():
+        return []
+
+    if spec.submodule_search_locations:
+        return sorted(f for location in spec.submodule_search_locations for f in Path(location).rglob("*.py"))
+
+    return [Path(spec.origin)]
+
+
+def get_fingerprint(source: str, options: LibDocBatchOptions) -> str:
+    """Identifies a spec by the source, the options and the size and modification time of the source files.
+
+    Libraries that are part of Robot Framework or can not be found are identified by the Robot Framework version.
+    """
+
+    files: List[Tuple[str, int, int]] = []
+    for file in _get_source_files(source):
+        try:
+            stat = file.stat()
+        except OSError:
+            continue
+        files.append((str(file.absolute()), stat.st_mtime_ns, stat.st_size))
+
+    data = as_json([get_version(), source, options, files], compact=True)
+
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def _init_worker(python_path: List[str], working_dir: str) -> None:
+    os.chdir(working_dir)
+    sys.path = [*python_path, *sys.path]
+
+
+def build_spec(source: str, output: str, options: LibDocBatchOptions) -> LibDocSpecInfo:
+    from robot.libdocpkg import LibraryDocumentation
+
+    libdoc = LibraryDocumentation(source, version=options.version or "", doc_format=options.doc_format)
+
+    if (
+        options.format == "HTML"
+        or options.spec_doc_format == "HTML"
+        or options.format in ("JSON", "LIBSPEC")
+        and options.spec_doc_format != "RAW"
+    ):
+        libdoc.convert_docs_to_html()
+
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    if get_robot_version() >= (6, 0):
+        libdoc.save(output, options.format, options.theme)
+    else:
+        libdoc.save(output, options.format)
+
+    return LibDocSpecInfo(libdoc.name, libdoc.type, libdoc.version, len(libdoc.keywords))
+
+
+def load_index(index_file: Path) -> Dict[str, LibDocSpec]:
+    if not index_file.exists():
+        return {}
+
+    try:
+        return {s.source: s for s in from_json(index_file.read_text("utf-8"), LibDocIndex).specs}
+    except (SystemExit, KeyboardInterrupt):
+        raise
+    except BaseException:
+        return {}
+
+
+def run_libdoc_batch(
+    app: Application,
+    options: Dict[str, Any],
+    sources: Sequence[str],
+    output_dir: Path,
+    index_file: Optional[Path],
+    jobs: int,
+    force: bool,
+) -> int:
+    batch_options = get_batch_options(options)
+
+    if options.get("name"):
+        app.warning("The --name option is ignored in batch mode.")
+
+    sys.path = [*batch_options.python_path, *sys.path]
+
+    if index_file is None:
+        index_file = output_dir / INDEX_FILE
+
+    previous = {} if force else load_index(index_file)
+
+    specs: List[LibDocSpec] = []
+    outputs: Dict[Path, str] = {}
+    for source in expand_sources(sources):
+        output = get_output_file(source, output_dir, batch_options.format)
+        if output in outputs:
+            app.warning(f"Skip {source}, it has the same output file {output} as {outputs[output]}.")
+            continue
+        outputs[output] = source
+
+        spec = LibDocSpec(source, output.as_posix(), get_fingerprint(source, batch_options))
+
+        old = previous.get(source)
+        if (
+            old is not None
+            and old.status != SpecStatus.FAILED
+            and old.fingerprint == spec.fingerprint
+            and old.output == spec.output
+            and output.exists()
+        ):
+            old.status = SpecStatus.UNCHANGED
+            spec = old
+
+        specs.append(spec)
+
+    todo = [s for s in specs if s.status == SpecStatus.GENERATED]
+
+    if app.config.dry:
+        for spec in specs:
+            app.echo(
+                f"{spec.source} -> {spec.output} ({'build' if spec.status == SpecStatus.GENERATED else spec.status})"
+            )
+        return 0
+
+    if todo:
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(todo)),
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(batch_options.python_path, str(Path.cwd())),
+        ) as executor:
+            futures: Dict[Future[LibDocSpecInfo], LibDocSpec] = {
+                executor.submit(build_spec, spec.source, spec.output, batch_options): spec for spec in todo
+            }
+
+            for future in as_completed(futures):
+                spec = futures[future]
+                try:
+                    info = future.result()
+                except (SystemExit, KeyboardInterrupt):
+                    raise
+                except BaseException as e:
+                    spec.status = SpecStatus.FAILED
+                    spec.error = str(e)
+                    app.warning(f"Can't build documentation for {spec.source}: {spec.error.splitlines()[0]}", err=True)
+                    continue
+
+                spec.name, spec.type, spec.version, spec.keywords = info.name, info.type, info.version, info.keywords
+                app.verbose(lambda: f"{spec.source} -> {Path(spec.output).absolute()}")
+
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    index_file.write_text(as_json(LibDocIndex(get_version(), batch_options.format, specs), indent=True), "utf-8")
+
+    failed = sum(1 for s in specs if s.status == SpecStatus.FAILED)
+    app.echo(
+        f"{len(todo) - failed} generated, {len(specs) - len(todo)} unchanged, {failed} failed. "
+        f"Index: {index_file.absolute()}"
+    )
+
+    return 1 if failed else 0
@@ -0,0 +1,409 @@
+import os
+import shutil
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, cast
+
+import click
+from robot.conf import RobotSettings
+from robot.errors import DATA_ERROR, INFO_PRINTED, DataError, Information
+from robot.model import SuiteVisitor, TestCase, TestSuite
+from robot.output import LOGGER
+from robot.reporting import ResultWriter
+from robot.result import ExecutionResult, Result
+from robot.result import TestCase as ResultTestCase
+from robot.result import TestSuite as ResultSuite
+
+from robotcode.core.utils.dataclasses import as_json
+from robotcode.plugin import Application, ColoredOutput
+
+from ..output_xml import get_test_id
+from ..timings import TimingDatabase, get_timings_file
+from .discover.discover import build_suite
+from .robot import RobotFrameworkEx, handle_robot_options
+
+PARALLEL_OUTPUT_DIR = "parallel"
+WORKER_ORDER_FILE = "order.json"
+WORKER_CONSOLE_FILE = "console.txt"
+WORKER_OUTPUT_FILE = "output.xml"
+
+
+class SplitMode(str, Enum):
+    SUITE = "suite"
+    TEST = "test"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass
+class WorkItem:
+    longname: str
+    source: Optional[str]
+    test_count: int = 1
+    duration: float = 1.0
+
+
+@dataclass
+class WorkerOrder:
+    index: int
+    output_dir: str
+    longnames: List[str] = field(default_factory=list)
+
+
+@dataclass
+class WorkerResult:
+    index: int
+    return_code: int
+    duration: float
+    output: Optional[Path]
+    console: Path
+
+
+class WorkItemCollector(SuiteVisitor):
+    def __init__(self, split: SplitMode, timings: Optional[TimingDatabase] = None) -> None:
+        super().__init__()
+        self.split = split
+        self.timings = timings
+        self.items: List[WorkItem] = []
+
+    def _estimate(self, test: TestCase) -> float:
+        if self.timings is None:
+            return 1.0
+
+        return self.timings.estimate(get_test_id(test.source, test.longname, test.lineno))
+
+    def start_suite(self, suite: TestSuite) -> Optional[bool]:
+        if self.split == SplitMode.SUITE and suite.tests:
+            self.items.append(
+                WorkItem(
+                    suite.longname,
+                    str(suite.source) if suite.source else None,
+                    suite.test_count,
+                    sum(self._estimate(t) for t in suite.tests),
+                )
+            )
+            return False
+
+        return None
+
+    def visit_test(self, test: TestCase) -> None:
+        self.items.append(WorkItem(test.longname, str(test.source) if test.source else None, 1, self._estimate(test)))
+
+
+def collect_work_items(suite: TestSuite, split: SplitMode, timings: Optional[TimingDatabase] = None) -> List[WorkItem]:
+    collector = WorkItemCollector(split, timings)
+    suite.visit(collector)
+    return collector.items
+
+
+def partition_work_items(items: Sequence[WorkItem], workers: int) -> List[List[WorkItem]]:
+    """Distributes the items to at most `workers` partitions with the longest processing time first rule.
+
+    The longest items are assigned first, each to the partition with the shortest total duration so far.
+    """
+
+    partitions: List[Tuple[float, List[WorkItem]]] = [(0.0, []) for _ in range(max(1, min(workers, len(items))))]
+
+    for item in sorted(items, key=lambda v: -v.duration):
+        index = min(range(len(partitions)), key=lambda i: partitions[i][0])
+        duration, partition = partitions[index]
+        partition.append(item)
+        partitions[index] = (duration + item.duration, partition)
+
+    return [p for _, p in partitions if p]
+
+
+def get_worker_options(order: WorkerOrder) -> Dict[str, Any]:
+    return {
+        "outputdir": order.output_dir,
+        "output": WORKER_OUTPUT_FILE,
+        "log": "NONE",
+        "report": "NONE",
+        "xunit": None,
+    }
+
+
+def _build_global_options(app: Application) -> List[str]:
+    result: List[str] = []
+
+    for config_file in app.config.config_files or ():
+        result += ["--config", str(Path(config_file).absolute())]
+    for profile in app.config.profiles or ():
+        result += ["--profile", profile]
+    for default_path in app.config.default_paths or ():
+        result += ["--default-path", default_path]
+    if app.config.verbose:
+        result.append("--verbose")
+    if app.config.colored_output == ColoredOutput.YES:
+        result.append("--color")
+    elif app.config.colored_output == ColoredOutput.NO:
+        result.append("--no-color")
+
+    return result
+
+
+def _run_workers(
+    app: Application,
+    orders: List[WorkerOrder],
+    by_longname: Tuple[str, ...],
+    exclude_by_longname: Tuple[str, ...],
+    failed_first: bool,
+    robot_options_and_args: Tuple[str, ...],
+) -> List[WorkerResult]:
+    global_options = _build_global_options(app)
+    running: List[Tuple[WorkerOrder, subprocess.Popen[bytes], Any, float]] = []
+
+    try:
+        for order in orders:
+            output_dir = Path(order.output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            order_file = output_dir / WORKER_ORDER_FILE
+            order_file.write_text(as_json(order), "utf-8")
+
+            console = open(output_dir / WORKER_CONSOLE_FILE, "wb")
+            args = [
+                sys.executable,
+                "-m",
+                "robotcode.cli",
+                *global_options,
+                "robot",
+                *(f"--by-longname={v}" for v in by_longname),
+                *(f"--exclude-by-longname={v}" for v in exclude_by_longname),
+                *(["--failed-first"] if failed_first else []),
+                "--parallel-worker",
+                str(order_file),
+                *robot_options_and_args,
+            ]
+            app.verbose(lambda: f"Start worker {order.index}: {' '.join(args)}")
+
+            running.append(
+                (
+                    order,
+                    subprocess.Popen(args, stdout=console, stderr=subprocess.STDOUT, cwd=Path.cwd()),
+                    console,
+                    time.monotonic(),
+                )
+            )
+
+        results: List[WorkerResult] = []
+        while running:
+            for entry in list(running):
+                order, process, console, start_time = entry
+
+                return_code = process.poll()
+                if return_code is None:
+                    continue
+
+                running.remove(entry)
+                console.close()
+
+                output = Path(order.output_dir, WORKER_OUTPUT_FILE)
+                result = WorkerResult(
+                    order.index,
+                    return_code,
+                    time.monotonic() - start_time,
+                    output if output.exists() else None,
+                    Path(order.output_dir, WORKER_CONSOLE_FILE),
+                )
+                results.append(result)
+
+                app.echo(
+                    f"Worker {result.index} finished with return code {result.return_code} "
+                    f"in {result.duration:.2f}s ({len(order.longnames)} items)."
+                )
+                if result.output is None:
+                    app.warning(
+                        f"Worker {result.index} did not create an output file:\n"
+                        + result.console.read_text("utf-8", errors="replace"),
+                        err=True,
+                    )
+
+            if running:
+                time.sleep(0.1)
+
+        return sorted(results, key=lambda r: r.index)
+    finally:
+        for _, process, console, _ in running:
+            process.kill()
+            process.wait()
+            console.close()
+
+
+def _iter_suites(suite: ResultSuite) -> Iterator[ResultSuite]:
+    yield suite
+    for child in suite.suites:
+        yield from _iter_suites(child)
+
+
+def _combine_times(target: ResultSuite, parts: List[ResultSuite]) -> None:
+    if hasattr(target, "start_time"):
+        starts = [p.start_time for p in parts if p.start_time is not None]
+        ends = [p.end_time for p in parts if p.end_time is not None]
+        if starts:
+            target.start_time = min(starts)
+        if ends:
+            target.end_time = max(ends)
+    else:
+        starts = [p.starttime for p in parts if p.starttime and p.starttime != "N/A"]
+        ends = [p.endtime for p in parts if p.endtime and p.endtime != "N/A"]
+        if starts:
+            target.starttime = min(starts)
+        if ends:
+            target.endtime = max(ends)
+
+
+def combine_results(suite: TestSuite, outputs: List[Path]) -> Result:
+    """Combines the results of the workers into one result in the order of the executed `suite`.
+
+    Unlike `rebot --merge`, the messages of the suites and tests are not changed. A suite that was run by more than
+    one worker gets the setup, teardown and message of the first worker and spans the times of all workers.
+    """
+
+    results = [ExecutionResult(str(o)) for o in outputs]
+
+    suites: Dict[str, List[ResultSuite]] = {}
+    tests: Dict[str, ResultTestCase] = {}
+    for result in results:
+        for result_suite in _iter_suites(result.suite):
+            suites.setdefault(result_suite.longname, []).append(result_suite)
+            for test in result_suite.tests:
+                tests.setdefault(test.longname, test)
+
+    def graft(running: TestSuite) -> Optional[ResultSuite]:
+        parts = suites.get(running.longname)
+        if not parts:
+            return None
+
+        target = parts[0]
+        target.suites = [c for c in (graft(s) for s in running.suites) if c is not None]
+        target.tests = [tests[t.longname] for t in running.tests if t.longname in tests]
+        _combine_times(target, parts)
+
+        return target
+
+    combined = results[0]
+    root = graft(suite)
+    if root is not None:
+        combined.suite = root
+    for result in results[1:]:
+        combined.errors.add(result.errors)
+
+    return combined
+
+
+def merge_results(app: Application, settings: RobotSettings, suite: TestSuite, outputs: List[Path]) -> int:
+    app.verbose(lambda: f"Combine results of {' '.join(str(o) for o in outputs)}")
+
+    try:
+        result = combine_results(suite, outputs)
+    except DataError as err:
+        LOGGER.error(err)
+        return cast(int, DATA_ERROR)
+
+    result.configure(status_rc=settings.status_rc)
+
+    return int(
+        ResultWriter(result).write_results(
+            outputdir=str(settings.output_directory),
+            output=str(settings.output) if settings.output else "NONE",
+            log=str(settings.log) if settings.log else "NONE",
+            report=str(settings.report) if settings.report else "NONE",
+            xunit=str(settings.xunit) if settings.xunit else "NONE",
+        )
+    )
+
+
+def run_parallel(
+    app: Application,
+    workers: int,
+    split: SplitMode,
+    failed_first: bool,
+    by_longname: Tuple[str, ...],
+    exclude_by_longname: Tuple[str, ...],
+    robot_options_and_args: Tuple[str, ...],
+) -> int:
+    root_folder, profile, cmd_options = handle_robot_options(
+        app, by_longname, exclude_by_longname, robot_options_and_args
+    )
+
+    try:
+        options, arguments = RobotFrameworkEx(
+            app,
+            [*(app.config.default_paths if app.config.default_paths else ())]
+            if profile.paths is None
+            else profile.paths
+            if isinstance(profile.paths, list)
+            else [profile.paths],
+            False,
+            root_folder,
+        ).parse_arguments((*cmd_options, *robot_options_and_args))
+
+        settings = RobotSettings(options)
+
+        LOGGER.register_console_logger(**settings.console_output_config)
+
+        suite = build_suite(settings, arguments)
+    except Information as err:
+        app.echo(str(err))
+        return cast(int, INFO_PRINTED)
+    except DataError as err:
+        LOGGER.error(err)
+        return cast(int, DATA_ERROR)
+
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    timings = TimingDatabase.load(get_timings_file(root_folder))
+    app.verbose(lambda: f"Use timings of {len(timings)} tests from {timings.path}")
+
+    partitions = partition_work_items(collect_work_items(suite, split, timings), workers)
+
+    parallel_dir = Path(settings.output_directory, PARALLEL_OUTPUT_DIR)
+    orders = [
+        WorkerOrder(i, str(parallel_dir / f"{i:03}"), [item.longname for item in partition])
+        for i, partition in enumerate(partitions, 1)
+    ]
+
+    if app.config.dry:
+        for order, partition in zip(orders, partitions):
+            app.echo(f"Worker {order.index} (estimated {sum(i.duration for i in partition):.2f}s):")
+            for longname in order.longnames:
+                app.echo(f"    {longname}")
+        return 0
+
+    if not orders:
+        raise click.ClickException("No tests or tasks found to execute.")
+
+    app.echo(f"Run {sum(len(o.longnames) for o in orders)} {split}s in {len(orders)} worker processes.")
+
+    if parallel_dir.exists():
+        shutil.rmtree(parallel_dir)
+
+    results = _run_workers(app, orders, by_longname, exclude_by_longname, failed_first, robot_options_and_args)
+
+    outputs = [r.output for r in results if r.output is not None]
+    if not outputs:
+        raise click.ClickException("No worker created an output file.")
+
+    try:
+        for output in outputs:
+            timings.add_output(output)
+        timings.save()
+    except (SystemExit, KeyboardInterrupt):
+        raise
+    except BaseException as e:
+        app.warning(f"Can't update timings in {timings.path}: {e}")
+
+    return_code = merge_results(app, settings, suite, outputs)
+
+    errors = [r.return_code for r in results if r.output is None or r.return_code > 250]
+    if errors:
+        return max(return_code, *errors)
+
+    return return_code
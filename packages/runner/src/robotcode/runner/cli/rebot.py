@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Any, Optional, Tuple, cast
 
 import click
-from robot.errors import DataError, Information
+from robot.errors import DATA_ERROR, INFO_PRINTED, DataError, Information
 from robot.rebot import USAGE, Rebot
 from robot.version import get_full_version
 
@@ -13,6 +13,8 @@ from robotcode.robot.config.model import RebotProfile
 from robotcode.robot.config.utils import get_config_files
 
 from ..__version__ import __version__
+from ..output_xml import SPILL_THRESHOLD, merge_outputs
+from ..timings import TimingDatabase, get_timings_file
 
 
 class RebotEx(Rebot):
@@ -41,6 +43,47 @@ class RebotEx(Rebot):
         return super().main(datasources, **options)
 
 
+def run_streaming_merge(
+    app: Application,
+    rebot: RebotEx,
+    args: Tuple[str, ...],
+    spill_dir: Optional[Path],
+    spill_threshold: int,
+) -> int:
+    try:
+        options, arguments = rebot.parse_arguments(args)
+    except Information as err:
+        app.echo(str(err))
+        return cast(int, INFO_PRINTED)
+    except DataError as err:
+        app.warning(str(err), err=True)
+        return cast(int, DATA_ERROR)
+
+    if not arguments:
+        raise click.ClickException("No outputs to merge given.")
+
+    unsupported = [o for o in ("log", "report", "xunit") if options.get(o) not in (None, "NONE")]
+    if unsupported:
+        app.warning(f"Option(s) {', '.join(unsupported)} are not supported in streaming mode and are ignored.")
+
+    output = Path(options.get("outputdir") or ".", options.get("output") or "output.xml").absolute()
+
+    try:
+        result = merge_outputs(arguments, output, spill_dir, spill_threshold)
+    except (DataError, OSError, SyntaxError) as err:
+        app.warning(f"Merging outputs failed: {err}", err=True)
+        return cast(int, DATA_ERROR)
+
+    app.echo(f"{result.suites} suites, {result.statistics}")
+    if result.peak_rss is not None:
+        app.echo(f"Peak RSS: {result.peak_rss / (1024 * 1024):.1f} MB")
+    app.echo(f"Output:  {output}")
+
+    if options.get("nostatusrc"):
+        return 0
+    return min(result.statistics.failed, 250)
+
+
 @click.command(
     context_settings={"allow_extra_args": True, "ignore_unknown_options": True},
     add_help_option=True,
@@ -52,9 +95,43 @@ class RebotEx(Rebot):
     prog_name="RobotCode rebot",
     message=f"%(prog)s %(version)s\n{USAGE.splitlines()[0].split(' -- ')[0].strip()} {get_full_version()}",
 )
+@click.option(
+    "--streaming",
+    is_flag=True,
+    help="Merges the outputs with an incremental parser into a single output file and prints the combined "
+    "statistics, with bounded memory usage. Only `--outputdir`, `--output` and `--nostatusrc` are supported, "
+    "log, report and xunit files are not created in this mode.",
+)
+@click.option(
+    "--spill-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Directory for the temporary spill file of a streaming merge. Defaults to the system temp directory.",
+)
+@click.option(
+    "--spill-threshold",
+    type=click.IntRange(min=0),
+    default=SPILL_THRESHOLD // (1024 * 1024),
+    show_default=True,
+    help="Size in MB of the serialized elements of a streaming merge kept in memory before they are spilled "
+    "to disk. 0 keeps everything in memory.",
+)
+@click.option(
+    "--record-timings",
+    is_flag=True,
+    help="Records the durations and results of the tests/tasks of the given outputs in "
+    "`.robotcode_cache/timings.json`, they are used to balance parallel runs.",
+)
 @click.argument("robot_options_and_args", nargs=-1, type=click.Path())
 @pass_application
-def rebot(app: Application, robot_options_and_args: Tuple[str, ...]) -> None:
+def rebot(
+    app: Application,
+    streaming: bool,
+    spill_dir: Optional[Path],
+    spill_threshold: int,
+    record_timings: bool,
+    robot_options_and_args: Tuple[str, ...],
+) -> None:
     """Runs `rebot` with the selected configuration, profiles, options and arguments.
 
     The options and arguments are passed to `rebot` as is.
@@ -100,6 +177,29 @@ def rebot(app: Application, robot_options_and_args: Tuple[str, ...]) -> None:
         + " ".join(f'"{o}"' for o in (options + list(robot_options_and_args)))
     )
 
+    if record_timings and robot_arguments and not app.config.dry:
+        timings = TimingDatabase.load(get_timings_file(root_folder))
+        for output in robot_arguments:
+            try:
+                count = timings.add_output(output)
+                app.verbose(f"Recorded timings of {count} tests from {output}")
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as e:
+                app.warning(f"Can't read timings from {output}: {e}")
+        timings.save()
+
+    if streaming:
+        app.exit(
+            run_streaming_merge(
+                app,
+                RebotEx(app.config.dry, root_folder),
+                (*options, *robot_options_and_args),
+                spill_dir,
+                spill_threshold * 1024 * 1024,
+            )
+        )
+
     app.exit(
         cast(
             int,
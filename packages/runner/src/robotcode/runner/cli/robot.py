@@ -1,13 +1,16 @@
 import os
 import sys
 from pathlib import Path
-from typing import Any, List, Optional, Set, Tuple, Union, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 import click
 from robot.errors import DataError, Information
 from robot.run import USAGE, RobotFramework
 from robot.version import get_full_version
 
+from robotcode.core.utils.cli import show_hidden_arguments
+from robotcode.core.utils.dataclasses import from_json
+from robotcode.modifiers import ByLongName
 from robotcode.plugin import Application, pass_application
 from robotcode.plugin.click_helper.aliases import AliasedCommand
 from robotcode.plugin.click_helper.types import add_options
@@ -16,6 +19,7 @@ from robotcode.robot.config.model import RobotBaseProfile
 from robotcode.robot.config.utils import get_config_files
 
 from ..__version__ import __version__
+from ..timings import FailedFirst, TimingDatabase, TimingsListener, get_timings_file
 
 
 class RobotFrameworkEx(RobotFramework):
@@ -25,12 +29,14 @@ class RobotFrameworkEx(RobotFramework):
         paths: List[str],
         dry: bool,
         root_folder: Optional[Path],
+        options_override: Optional[Dict[str, Any]] = None,
     ) -> None:
         super().__init__()
         self.app = app
         self.paths = paths
         self.dry = dry
         self.root_folder = root_folder
+        self.options_override = options_override
         self._orig_cwd = Path.cwd()
 
     def parse_arguments(self, cli_args: Any) -> Any:
@@ -53,6 +59,13 @@ class RobotFrameworkEx(RobotFramework):
         if not arguments:
             arguments = self.paths
 
+        if self.options_override:
+            for k, v in self.options_override.items():
+                if isinstance(v, list):
+                    options[k] = [*(options.get(k) or []), *v]
+                else:
+                    options[k] = v
+
         if self.dry:
             line_end = "\n"
             raise Information(
@@ -153,11 +166,49 @@ def handle_robot_options(
     epilog='Use "-- --help" to see `robot` help.',
 )
 @add_options(*ROBOT_OPTIONS)
+@click.option(
+    "--parallel",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Runs the tests/tasks in the given number of worker processes and merges the results with `rebot`. "
+    "0 uses the number of CPUs.",
+)
+@click.option(
+    "--split",
+    type=click.Choice(["suite", "test"]),
+    default="suite",
+    show_default=True,
+    help="How the tests/tasks are distributed to the parallel workers. `suite` runs every suite file in a single "
+    "worker, so suite setups and teardowns run only once, `test` distributes single tests/tasks.",
+)
+@click.option(
+    "--failed-first",
+    is_flag=True,
+    help="Runs the tests/tasks that failed in their last recorded run first.",
+)
+@click.option(
+    "--record-timings",
+    is_flag=True,
+    help="Records the durations and results of the tests/tasks in `.robotcode_cache/timings.json`. "
+    "Parallel runs always record them and use them to balance the workers.",
+)
+@click.option(
+    "--parallel-worker",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    hidden=show_hidden_arguments(),
+    help="Runs as a worker of a parallel run. This is an internal option.",
+)
 @pass_application
 def robot(
     app: Application,
     by_longname: Tuple[str, ...],
     exclude_by_longname: Tuple[str, ...],
+    parallel: Optional[int],
+    split: str,
+    failed_first: bool,
+    record_timings: bool,
+    parallel_worker: Optional[Path],
     robot_options_and_args: Tuple[str, ...],
 ) -> None:
     """Runs `robot` with the selected configuration, profiles, options and arguments.
@@ -172,13 +223,46 @@ def robot(
     robotcode robot tests
     robotcode robot -i regression -e wip tests
     robotcode --profile ci robot -i regression -e wip tests
+    robotcode robot --parallel 8 --failed-first tests
     ```
     """
 
+    if parallel is not None and parallel_worker is None:
+        from .parallel import SplitMode, run_parallel
+
+        app.exit(
+            run_parallel(
+                app,
+                parallel,
+                SplitMode(split),
+                failed_first,
+                by_longname,
+                exclude_by_longname,
+                robot_options_and_args,
+            )
+        )
+
     root_folder, profile, cmd_options = handle_robot_options(
         app, by_longname, exclude_by_longname, robot_options_and_args
     )
 
+    options_override: Dict[str, Any] = {"prerunmodifier": [], "listener": []}
+
+    if parallel_worker is not None:
+        from .parallel import WorkerOrder, get_worker_options
+
+        order = from_json(parallel_worker.read_text("utf-8"), WorkerOrder)
+        options_override.update(get_worker_options(order))
+        options_override["prerunmodifier"].append(ByLongName(*order.longnames))
+
+    if failed_first or record_timings:
+        timings = TimingDatabase.load(get_timings_file(root_folder))
+
+        if failed_first:
+            options_override["prerunmodifier"].append(FailedFirst(timings))
+        if record_timings and parallel_worker is None:
+            options_override["listener"].append(TimingsListener(timings))
+
     app.exit(
         cast(
             int,
@@ -191,6 +275,7 @@ def robot(
                 else [profile.paths],
                 app.config.dry,
                 root_folder,
+                options_override,
             ).execute_cli((*cmd_options, *robot_options_and_args), exit=False),
         )
     )
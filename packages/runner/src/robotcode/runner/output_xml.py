@@ -0,0 +1,457 @@
+import re
+import sys
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union, cast
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape, quoteattr
+
+from robot.errors import DataError
+
+from .__version__ import __version__
+
+
+def get_peak_rss() -> Optional[int]:
+    """Returns the peak resident set size of the current process in bytes, if the platform can tell it."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    if "T" in timestamp:
+        return datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc)
+
+    return datetime.strptime(timestamp, "%Y%m%d %H:%M:%S.%f").replace(tzinfo=timezone.utc)
+
+
+def get_status_times(status: ElementTree.Element) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Returns the start and end time of a `status` element of the old and the new (RF 7) output format."""
+
+    start = status.get("start")
+    if start is not None:
+        start_time = _parse_timestamp(start)
+        return start_time, start_time + timedelta(seconds=float(status.get("elapsed", "0")))
+
+    start, end = status.get("starttime"), status.get("endtime")
+    return (
+        _parse_timestamp(start) if start and start != "N/A" else None,
+        _parse_timestamp(end) if end and end != "N/A" else None,
+    )
+
+
+def get_elapsed(status: ElementTree.Element) -> Optional[float]:
+    elapsed = status.get("elapsed")
+    if elapsed is not None:
+        return float(elapsed)
+
+    start, end = get_status_times(status)
+    if start is None or end is None:
+        return None
+
+    return (end - start).total_seconds()
+
+
+def get_test_id(source: Union[str, Path, None], longname: str, lineno: Optional[int]) -> str:
+    """Returns the id of a test like `robotcode discover` creates it."""
+    return f"{Path(source).resolve() if source else ''};{longname};{lineno}"
+
+
+class TestResult(NamedTuple):
+    id: str
+    status: str
+    duration: float
+
+
+def iter_test_results(output: Union[str, Path]) -> Iterator[TestResult]:
+    """Reads the test results from an `output.xml` incrementally, without building the whole result model."""
+
+    names: List[str] = []
+    sources: List[Optional[str]] = []
+    elements: List[str] = []
+    test: Optional[ElementTree.Element] = None
+
+    for event, elem in ElementTree.iterparse(output, events=("start", "end")):
+        if event == "start":
+            if elem.tag == "suite":
+                names.append(elem.get("name", ""))
+                sources.append(elem.get("source") or (sources[-1] if sources else None))
+            elif elem.tag == "test":
+                test = elem
+            elements.append(elem.tag)
+            continue
+
+        elements.pop()
+
+        if elem.tag == "status" and test is not None and elements[-1] == "test":
+            duration = get_elapsed(elem)
+            if duration is not None:
+                line = test.get("line")
+                yield TestResult(
+                    get_test_id(sources[-1], ".".join((*names, test.get("name", ""))), int(line) if line else None),
+                    elem.get("status", ""),
+                    duration,
+                )
+        elif elem.tag == "test":
+            test = None
+        elif elem.tag == "suite":
+            names.pop()
+            sources.pop()
+
+        if test is None or elem is not test:
+            elem.clear()
+
+
+class Chunk(NamedTuple):
+    offset: int
+    length: int
+    id: Optional[str] = None
+
+
+@dataclass
+class Statistics:
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.passed + self.failed + self.skipped
+
+    @property
+    def status(self) -> str:
+        return "FAIL" if self.failed else "PASS" if self.passed else "SKIP"
+
+    def add(self, status: str) -> None:
+        if status == "PASS":
+            self.passed += 1
+        elif status == "FAIL":
+            self.failed += 1
+        else:
+            self.skipped += 1
+
+    def update(self, other: "Statistics") -> None:
+        self.passed += other.passed
+        self.failed += other.failed
+        self.skipped += other.skipped
+
+    def to_xml(self) -> str:
+        return f'pass="{self.passed}" fail="{self.failed}" skip="{self.skipped}"'
+
+    def __str__(self) -> str:
+        return f"{self.total} tests, {self.passed} passed, {self.failed} failed, {self.skipped} skipped"
+
+
+@dataclass
+class MergedTest:
+    chunk: Chunk
+    status: str
+    tags: Tuple[str, ...]
+
+
+@dataclass
+class MergedSuite:
+    name: str
+    attributes: Dict[str, str]
+    setup: Optional[Chunk] = None
+    teardown: Optional[Chunk] = None
+    extras: List[Chunk] = field(default_factory=list)
+    extras_source: Optional[int] = None
+    children: Dict[str, Union["MergedSuite", MergedTest]] = field(default_factory=dict)
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    message: Optional[str] = None
+
+    def get_suite(self, name: str, attributes: Dict[str, str]) -> "MergedSuite":
+        suite = self.children.get(f"s:{name}")
+        if not isinstance(suite, MergedSuite):
+            suite = MergedSuite(name, {k: v for k, v in attributes.items() if k != "id"})
+            self.children[f"s:{name}"] = suite
+        return suite
+
+    def add_status(self, start: Optional[datetime], end: Optional[datetime], message: Optional[str]) -> None:
+        if start is not None and (self.start is None or start < self.start):
+            self.start = start
+        if end is not None and (self.end is None or end > self.end):
+            self.end = end
+        if message and not self.message:
+            self.message = message
+
+
+class _SpillFile:
+    def __init__(self, directory: Optional[Path], threshold: int) -> None:
+        self._file = tempfile.SpooledTemporaryFile(max_size=threshold, dir=str(directory) if directory else None)
+        self._size = 0
+
+    def write(self, data: bytes) -> Chunk:
+        self._file.seek(self._size)
+        self._file.write(data)
+        chunk = Chunk(self._size, len(data))
+        self._size += len(data)
+        return chunk
+
+    def read(self, chunk: Chunk) -> bytes:
+        self._file.seek(chunk.offset)
+        return self._file.read(chunk.length)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _serialize(elem: ElementTree.Element) -> bytes:
+    return cast(bytes, ElementTree.tostring(elem, encoding="utf-8"))
+
+
+SPILL_THRESHOLD = 64 * 1024 * 1024
+
+_ID_PATTERN = re.compile(rb'(\sid=")([^"]*)"')
+_SUITE_CHILDREN = {"kw", "test", "doc", "meta", "suite", "status"}
+
+
+@dataclass
+class MergeResult:
+    statistics: Statistics
+    suites: int
+    peak_rss: Optional[int]
+
+
+class StreamingMerger:
+    """Merges `output.xml` files like `rebot --merge`, but without loading them into a result model.
+
+    The files are parsed incrementally. The tests and the suite setups and teardowns are serialized as soon as
+    they are complete, only the suite structure, the status and the tags of the tests are kept as objects.
+    The serialized elements are kept in memory until they exceed `spill_threshold` bytes, after that they are
+    spilled to a temporary file in `spill_dir`. A threshold of 0 never spills.
+    Tests with the same name in the same suite are replaced by the later one.
+    """
+
+    def __init__(self, spill_dir: Optional[Path] = None, spill_threshold: int = SPILL_THRESHOLD) -> None:
+        self._spill = _SpillFile(spill_dir, spill_threshold)
+        self._root = MergedSuite("", {})
+        self._errors: List[Chunk] = []
+        self._root_attributes: Dict[str, str] = {}
+        self._new_format: Optional[bool] = None
+        self._outputs = 0
+
+    def close(self) -> None:
+        self._spill.close()
+
+    def __enter__(self) -> "StreamingMerger":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def add(self, output: Union[str, Path]) -> None:
+        self._outputs += 1
+
+        suites: List[MergedSuite] = []
+        elements: List[ElementTree.Element] = []
+
+        for event, elem in ElementTree.iterparse(output, events=("start", "end")):
+            if event == "start":
+                if elem.tag == "robot" and not elements:
+                    if not self._root_attributes:
+                        self._root_attributes = dict(elem.attrib)
+                elif elem.tag == "suite" and all(e.tag in ("robot", "suite") for e in elements):
+                    suites.append((suites[-1] if suites else self._root).get_suite(elem.get("name", ""), elem.attrib))
+                elements.append(elem)
+                continue
+
+            elements.pop()
+            parent = elements[-1].tag if elements else None
+
+            if parent == "suite" and elem.tag in _SUITE_CHILDREN and suites:
+                self._add_suite_child(suites[-1], elem, elements[-1].get("id"))
+                if elem.tag == "suite":
+                    suites.pop()
+                elem.clear()
+            elif parent == "errors" and elem.tag == "msg":
+                self._errors.append(self._spill.write(_serialize(elem)))
+                elem.clear()
+            elif parent == "robot":
+                elem.clear()
+
+    def _add_suite_child(self, suite: MergedSuite, elem: ElementTree.Element, suite_id: Optional[str]) -> None:
+        if elem.tag == "test":
+            status = elem.find("status")
+            tags = tuple(t.text or "" for t in (*elem.findall("tag"), *elem.findall("tags/tag")))
+            suite.children[f"t:{elem.get('name', '')}"] = MergedTest(
+                self._spill.write(_serialize(elem))._replace(id=elem.get("id")),
+                status.get("status", "FAIL") if status is not None else "FAIL",
+                tags,
+            )
+        elif elem.tag == "kw" and elem.get("type", "").upper() in ("SETUP", "TEARDOWN"):
+            chunk = self._spill.write(_serialize(elem))._replace(id=suite_id)
+            if elem.get("type", "").upper() == "SETUP":
+                suite.setup = suite.setup or chunk
+            else:
+                suite.teardown = suite.teardown or chunk
+        elif elem.tag in ("doc", "meta"):
+            if suite.extras_source is None:
+                suite.extras_source = self._outputs
+            if suite.extras_source == self._outputs:
+                suite.extras.append(self._spill.write(_serialize(elem)))
+        elif elem.tag == "status":
+            if self._new_format is None:
+                self._new_format = "start" in elem.attrib
+            elif self._new_format != ("start" in elem.attrib):
+                raise DataError("Cannot merge outputs of Robot Framework 7 and older versions.")
+
+            suite.add_status(*get_status_times(elem), elem.text)
+
+    def write(self, output: Union[str, Path]) -> MergeResult:
+        suites = list(c for c in self._root.children.values() if isinstance(c, MergedSuite))
+        if not suites:
+            raise DataError("No suites to merge.")
+
+        if len(suites) == 1:
+            root = suites[0]
+        else:
+            root = MergedSuite(" & ".join(s.name for s in suites), {}, children={f"s:{s.name}": s for s in suites})
+            for s in suites:
+                root.add_status(s.start, s.end, None)
+
+        suite_statistics: List[Tuple[str, str, str, Statistics]] = []
+        tag_statistics: Dict[str, Statistics] = {}
+        tag_names: Dict[str, Counter[str]] = {}
+
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w", encoding="utf-8") as out:
+            now = datetime.now(timezone.utc).astimezone().replace(tzinfo=None)
+            attributes = {
+                **self._root_attributes,
+                "generator": f"RobotCode Streaming Rebot {__version__} (Python {sys.version.split()[0]})",
+                "generated": now.isoformat() if self._new_format else now.strftime("%Y%m%d %H:%M:%S.%f")[:-3],
+            }
+            out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            out.write(f"<robot{self._format_attributes(attributes)}>\n")
+
+            total = self._write_suite(out, root, "s1", root.name, suite_statistics, tag_statistics, tag_names)
+
+            out.write("<statistics>\n<total>\n")
+            out.write(f"<stat {total.to_xml()}>All Tests</stat>\n")
+            out.write("</total>\n<tag>\n")
+            for tag, stats in sorted(tag_statistics.items()):
+                out.write(f"<stat {stats.to_xml()}>{escape(tag_names[tag].most_common(1)[0][0])}</stat>\n")
+            out.write("</tag>\n<suite>\n")
+            for suite_id, name, longname, stats in suite_statistics:
+                out.write(f"<stat {stats.to_xml()} id={quoteattr(suite_id)} name={quoteattr(name)}>")
+                out.write(f"{escape(longname)}</stat>\n")
+            out.write("</suite>\n</statistics>\n<errors>\n")
+            for chunk in self._errors:
+                out.write(self._spill.read(chunk).decode("utf-8"))
+            out.write("</errors>\n</robot>\n")
+
+        return MergeResult(total, len(suite_statistics), get_peak_rss())
+
+    @staticmethod
+    def _format_attributes(attributes: Dict[str, str]) -> str:
+        return "".join(f" {k}={quoteattr(v)}" for k, v in attributes.items())
+
+    def _format_status(self, status: str, suite: MergedSuite) -> str:
+        if self._new_format:
+            times = (
+                f' start="{suite.start.replace(tzinfo=None).isoformat()}"'
+                f' elapsed="{(suite.end - suite.start).total_seconds():.6f}"'
+                if suite.start is not None and suite.end is not None
+                else ""
+            )
+        else:
+            times = "".join(
+                f' {n}="{t.strftime("%Y%m%d %H:%M:%S.%f")[:-3] if t is not None else "N/A"}"'
+                for n, t in (("starttime", suite.start), ("endtime", suite.end))
+            )
+
+        if suite.message:
+            return f'<status status="{status}"{times}>{escape(suite.message)}</status>\n'
+        return f'<status status="{status}"{times}/>\n'
+
+    def _write_chunk(self, out: IO[str], chunk: Chunk, new_id: Optional[str] = None) -> None:
+        """Writes a serialized element, the ids of the element and of all nested elements that start with the
+        original id of the test or suite the chunk belongs to are moved to `new_id`."""
+        data = self._spill.read(chunk)
+        if new_id is not None and chunk.id is not None and chunk.id != new_id:
+            old_prefix = chunk.id.encode()
+            new_prefix = new_id.encode()
+
+            def replace(match: "re.Match[bytes]") -> bytes:
+                value = match.group(2)
+                if value != old_prefix and not value.startswith(old_prefix + b"-"):
+                    return match.group(0)
+                return match.group(1) + new_prefix + value[len(old_prefix) :] + b'"'
+
+            data = _ID_PATTERN.sub(replace, data)
+        out.write(data.decode("utf-8"))
+
+    def _write_suite(
+        self,
+        out: IO[str],
+        suite: MergedSuite,
+        suite_id: str,
+        longname: str,
+        suite_statistics: List[Tuple[str, str, str, Statistics]],
+        tag_statistics: Dict[str, Statistics],
+        tag_names: Dict[str, Counter[str]],
+    ) -> Statistics:
+        attributes = {"id": suite_id, "name": suite.name, **{k: v for k, v in suite.attributes.items() if k != "name"}}
+        out.write(f"<suite{self._format_attributes(attributes)}>\n")
+
+        if suite.setup is not None:
+            self._write_chunk(out, suite.setup, suite_id)
+
+        stats = Statistics()
+        suite_statistics.append((suite_id, suite.name, longname, stats))
+
+        suite_index = test_index = 0
+        for child in suite.children.values():
+            if isinstance(child, MergedSuite):
+                suite_index += 1
+                stats.update(
+                    self._write_suite(
+                        out,
+                        child,
+                        f"{suite_id}-s{suite_index}",
+                        f"{longname}.{child.name}",
+                        suite_statistics,
+                        tag_statistics,
+                        tag_names,
+                    )
+                )
+            else:
+                test_index += 1
+                self._write_chunk(out, child.chunk, f"{suite_id}-t{test_index}")
+                stats.add(child.status)
+                for tag in child.tags:
+                    normalized = tag.lower().replace(" ", "").replace("_", "")
+                    tag_statistics.setdefault(normalized, Statistics()).add(child.status)
+                    tag_names.setdefault(normalized, Counter()).update([tag])
+
+        if suite.teardown is not None:
+            self._write_chunk(out, suite.teardown, suite_id)
+        for chunk in suite.extras:
+            self._write_chunk(out, chunk)
+
+        out.write(self._format_status(stats.status, suite))
+        out.write("</suite>\n")
+
+        return stats
+
+
+def merge_outputs(
+    outputs: Iterable[Union[str, Path]],
+    output: Union[str, Path],
+    spill_dir: Optional[Path] = None,
+    spill_threshold: int = SPILL_THRESHOLD,
+) -> MergeResult:
+    with StreamingMerger(spill_dir, spill_threshold) as merger:
+        for o in outputs:
+            merger.add(o)
+        return merger.write(output)
@@ -0,0 +1,153 @@
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from robot.model import SuiteVisitor, TestCase, TestSuite
+
+from robotcode.core.utils.dataclasses import as_json, from_json
+
+from .output_xml import TestResult, get_test_id, iter_test_results
+
+TIMINGS_FILE = Path(".robotcode_cache", "timings.json")
+
+# weight of the newest run in the stored duration
+DURATION_SMOOTHING = 0.5
+
+
+def get_timings_file(root_folder: Optional[Path]) -> Path:
+    return Path(root_folder or Path.cwd(), TIMINGS_FILE)
+
+
+@dataclass
+class TestTiming:
+    duration: float
+    status: str
+    runs: int = 1
+
+
+@dataclass
+class TimingsData:
+    tests: Dict[str, TestTiming] = field(default_factory=dict)
+
+
+class TimingDatabase:
+    """Stores the durations and the last status of tests, keyed by the test ids of `robotcode discover`."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._data = TimingsData()
+        self._default_duration: Optional[float] = None
+
+    @classmethod
+    def load(cls, path: Path) -> "TimingDatabase":
+        result = cls(path)
+        if path.exists():
+            try:
+                result._data = from_json(path.read_text("utf-8"), TimingsData)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException:
+                pass
+
+        return result
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(as_json(self._data), "utf-8")
+
+    def __len__(self) -> int:
+        return len(self._data.tests)
+
+    def get(self, test_id: str) -> Optional[TestTiming]:
+        return self._data.tests.get(test_id)
+
+    def add(self, result: TestResult) -> None:
+        timing = self._data.tests.get(result.id)
+        if timing is None:
+            self._data.tests[result.id] = TestTiming(result.duration, result.status)
+        else:
+            timing.duration = DURATION_SMOOTHING * result.duration + (1 - DURATION_SMOOTHING) * timing.duration
+            timing.status = result.status
+            timing.runs += 1
+
+        self._default_duration = None
+
+    def add_results(self, results: Iterable[TestResult]) -> int:
+        count = 0
+        for result in results:
+            if result.status == "SKIP":
+                continue
+            self.add(result)
+            count += 1
+
+        return count
+
+    def add_output(self, output: Union[str, Path]) -> int:
+        return self.add_results(iter_test_results(output))
+
+    @property
+    def default_duration(self) -> float:
+        """The duration assumed for unknown tests: the median of the known durations."""
+        if self._default_duration is None:
+            self._default_duration = (
+                statistics.median(t.duration for t in self._data.tests.values()) if self._data.tests else 1.0
+            )
+
+        return self._default_duration
+
+    def estimate(self, test_id: str) -> float:
+        timing = self._data.tests.get(test_id)
+        return timing.duration if timing is not None else self.default_duration
+
+    def has_failed(self, test_id: str) -> bool:
+        timing = self._data.tests.get(test_id)
+        return timing is not None and timing.status == "FAIL"
+
+
+class FailedFirst(SuiteVisitor):
+    """Moves the tests that failed in their last run, and the suites containing them, to the front.
+
+    The order of the other tests and suites is not changed.
+    """
+
+    def __init__(self, timings: TimingDatabase) -> None:
+        super().__init__()
+        self.timings = timings
+
+    def visit_suite(self, suite: TestSuite) -> None:
+        self._sort(suite)
+
+    def _has_failed(self, test: TestCase) -> bool:
+        return self.timings.has_failed(get_test_id(test.source, test.longname, test.lineno))
+
+    def _sort(self, suite: TestSuite) -> bool:
+        failed_tests = {id(t) for t in suite.tests if self._has_failed(t)}
+        failed_suites = {id(s) for s in suite.suites if self._sort(s)}
+
+        suite.tests = sorted(suite.tests, key=lambda t: id(t) not in failed_tests)
+        suite.suites = sorted(suite.suites, key=lambda s: id(s) not in failed_suites)
+
+        return bool(failed_tests or failed_suites)
+
+
+class TimingsListener:
+    """A listener that records the test results of a run into a `TimingDatabase`."""
+
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, timings: TimingDatabase) -> None:
+        self.timings = timings
+
+    def end_test(self, data: TestCase, result: TestCase) -> None:
+        if result.status != "SKIP":
+            self.timings.add(
+                TestResult(
+                    get_test_id(data.source, result.longname, data.lineno),
+                    result.status,
+                    result.elapsedtime / 1000,
+                )
+            )
+
+    def close(self) -> None:
+        self.timings.save()
@@ -0,0 +1,62 @@
+import argparse
+import logging
+import timeit
+from typing import Callable
+
+from robotcode.core.utils.logging import LoggingDescriptor
+
+
+class Example:
+    _logger = LoggingDescriptor(name="benchmark.call_tracing")
+
+    def plain(self, value: int) -> int:
+        return value
+
+    @_logger.call
+    def traced(self, value: int) -> int:
+        return value
+
+    @_logger.call(exiting=True, timed=True)
+    def traced_timed(self, value: int) -> int:
+        return value
+
+
+def _measure(name: str, func: Callable[[int], int], count: int) -> None:
+    seconds = min(timeit.repeat(lambda: func(1), number=count, repeat=5))
+    print(f"{name:<45} {seconds / count * 1e9:>8.1f}ns per call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the overhead of LoggingDescriptor.call.")
+    parser.add_argument("-n", "--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    logger = logging.getLogger("benchmark.call_tracing")
+    logger.propagate = False
+    logger.addHandler(logging.NullHandler())
+    logger.setLevel(logging.CRITICAL)
+
+    example = Example()
+
+    _measure("undecorated", example.plain, args.count)
+    _measure("tracing disabled", example.traced, args.count)
+
+    LoggingDescriptor.set_call_tracing(True)
+    _measure("tracing enabled, level not enabled", example.traced, args.count)
+
+    logger.setLevel(logging.NOTSET + 1)
+
+    _measure("tracing enabled, logged", example.traced, args.count // 10)
+    _measure("tracing enabled, logged, exiting and timed", example.traced_timed, args.count // 10)
+
+    LoggingDescriptor.set_call_tracing(True, sample_rate=100)
+    _measure("tracing enabled, every 100th call logged", example.traced, args.count)
+
+    LoggingDescriptor.set_call_tracing(False, name="benchmark")
+    _measure("tracing disabled for this logger", example.traced, args.count)
+
+    LoggingDescriptor.set_call_tracing(False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import time
+from typing import Callable, List
+
+from robotcode.robot.diagnostics.library_doc import LibraryDoc, clear_markdown_cache, get_library_doc
+
+
+def _measure(func: Callable[[], object], repeat: int) -> List[float]:
+    result = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        result.append((time.perf_counter() - start) * 1000)
+    return result
+
+
+def _hover_all(lib_doc: LibraryDoc) -> None:
+    lib_doc.to_markdown()
+    for kw in lib_doc.keywords:
+        kw.to_markdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure hover documentation rendering latency for libraries.")
+    parser.add_argument("libraries", nargs="*", default=["SeleniumLibrary", "Browser"])
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name in args.libraries:
+        try:
+            lib_doc = get_library_doc(name)
+        except BaseException as e:
+            print(f"{name}: cannot load library: {e}")
+            continue
+
+        clear_markdown_cache()
+
+        cold = _measure(lambda: _hover_all(lib_doc), 1)[0]
+        warm = _measure(lambda: _hover_all(lib_doc), args.repeat)
+        intro = _measure(lib_doc.to_markdown, args.repeat)
+
+        print(
+            f"{name}: {len(lib_doc.keywords)} keywords, "
+            f"cold {cold:.2f}ms, warm {min(warm):.2f}ms (best of {args.repeat}), "
+            f"library hover {min(intro):.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, BinaryIO, Dict, List
+
+from robotcode.jsonrpc2.protocol import JsonRPCProtocol, rpc_method
+from robotcode.jsonrpc2.server import JsonRPCServer
+
+
+class EchoProtocol(JsonRPCProtocol):
+    @rpc_method(name="echo")
+    def _echo(self, text: str, *args: Any, **kwargs: Any) -> str:
+        return text
+
+
+class EchoServer(JsonRPCServer[EchoProtocol]):
+    def create_protocol(self) -> EchoProtocol:
+        return EchoProtocol()
+
+
+def _send(wfile: BinaryIO, message: Dict[str, Any]) -> None:
+    body = json.dumps(message).encode("utf-8")
+    wfile.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    wfile.flush()
+
+
+def _receive(rfile: BinaryIO) -> Dict[str, Any]:
+    length = 0
+    while True:
+        line = rfile.readline()
+        if not line:
+            raise EOFError("server closed the connection")
+        if line == b"\r\n":
+            break
+        name, value = line.decode("ascii").split(":", 1)
+        if name.lower() == "content-length":
+            length = int(value)
+
+    return json.loads(rfile.read(length))  # type: ignore[no-any-return]
+
+
+def _measure(process: "subprocess.Popen[bytes]", count: int, size: int) -> List[float]:
+    assert process.stdin is not None
+    assert process.stdout is not None
+
+    text = "x" * size
+    result = []
+    for i in range(count):
+        start = time.perf_counter()
+        _send(process.stdin, {"jsonrpc": "2.0", "id": i, "method": "echo", "params": {"text": text}})
+        response = _receive(process.stdout)
+        result.append((time.perf_counter() - start) * 1000)
+        assert response["id"] == i, response
+
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the round trip latency of the JSON-RPC stdio transport.")
+    parser.add_argument("-n", "--count", type=int, default=1000)
+    parser.add_argument("--server", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.server:
+        with EchoServer() as server:
+            server.run()
+        return
+
+    process = subprocess.Popen([sys.executable, __file__, "--server"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    try:
+        _measure(process, 10, 10)
+
+        for size in [10, 10_000, 1_000_000]:
+            count = args.count if size < 1_000_000 else max(1, args.count // 100)
+            latencies = _measure(process, count, size)
+            print(
+                f"payload {size:>9} bytes: {count:>5} requests, "
+                f"median {statistics.median(latencies):.3f}ms, "
+                f"p95 {sorted(latencies)[int(len(latencies) * 0.95) - 1]:.3f}ms, "
+                f"max {max(latencies):.3f}ms"
+            )
+    finally:
+        process.kill()
+
+
+if __name__ == "__main__":
+    main()
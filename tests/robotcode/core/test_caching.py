@@ -0,0 +1,35 @@
+from robotcode.core.utils.caching import SimpleLRUCache
+
+
+def test_simple_lru_cache_evicts_least_recently_used() -> None:
+    calls = []
+
+    def func(v: int) -> int:
+        calls.append(v)
+        return v * 2
+
+    cache = SimpleLRUCache(max_items=2)
+
+    assert cache.get(func, 1) == 2
+    assert cache.get(func, 2) == 4
+    assert cache.get(func, 1) == 2
+    assert cache.get(func, 3) == 6
+
+    assert cache.has(1)
+    assert not cache.has(2)
+    assert cache.has(3)
+    assert calls == [1, 2, 3]
+
+    stats = cache.get_statistics()
+    assert stats.items == 2
+    assert stats.hits == 1
+    assert stats.misses == 3
+
+
+def test_simple_lru_cache_without_limit_keeps_all_items() -> None:
+    cache = SimpleLRUCache(max_items=None)
+
+    for i in range(1000):
+        cache.get(str, i)
+
+    assert len(cache) == 1000
@@ -0,0 +1,108 @@
+import threading
+import time
+from concurrent.futures import CancelledError
+from typing import List
+
+import pytest
+
+from robotcode.core.concurrent import (
+    TaskPriority,
+    WorkerPool,
+    check_current_task_canceled,
+    run_as_task,
+)
+
+
+def test_worker_pool_runs_higher_priority_first() -> None:
+    pool = WorkerPool(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    result: List[str] = []
+
+    def block() -> None:
+        started.set()
+        release.wait(5)
+
+    blocker = pool.submit(TaskPriority.NORMAL, block)
+    started.wait(5)
+
+    tasks = [
+        pool.submit(TaskPriority.LOW, result.append, "low"),
+        pool.submit(TaskPriority.NORMAL, result.append, "normal"),
+        pool.submit(TaskPriority.HIGH, result.append, "high"),
+    ]
+    release.set()
+
+    blocker.result(5)
+    for t in tasks:
+        t.result(5)
+
+    assert result == ["high", "normal", "low"]
+
+    stats = pool.get_statistics()
+    assert stats.priorities["high"].started == 1
+    assert stats.priorities["low"].max_wait_time > 0
+
+
+def test_worker_pool_does_not_deadlock_on_nested_tasks() -> None:
+    pool = WorkerPool(max_workers=1)
+
+    def outer() -> int:
+        return pool.submit(TaskPriority.NORMAL, lambda: 42).result(5)
+
+    assert pool.submit(TaskPriority.NORMAL, outer).result(10) == 42
+
+
+def test_worker_pool_limits_overflow_workers() -> None:
+    pool = WorkerPool(max_workers=1, max_overflow_workers=1, idle_timeout=0.1)
+    release = threading.Event()
+    running: List[str] = []
+
+    def block(name: str) -> None:
+        running.append(name)
+        release.wait(5)
+
+    def outer() -> None:
+        tasks = [pool.submit(TaskPriority.NORMAL, block, name) for name in ["first", "second"]]
+
+        for _ in range(100):
+            if running:
+                break
+            time.sleep(0.01)
+
+        stats = pool.get_statistics()
+        assert stats.workers == 2
+        assert stats.overflow_workers == 1
+        assert running == ["first"]
+
+        release.set()
+        for t in tasks:
+            t.result(5)
+
+    pool.submit(TaskPriority.NORMAL, outer).result(10)
+
+    assert running == ["first", "second"]
+
+    for _ in range(100):
+        if pool.get_statistics().overflow_workers == 0:
+            break
+        time.sleep(0.05)
+
+    assert pool.get_statistics().overflow_workers == 0
+
+
+def test_run_as_task_can_be_cancelled() -> None:
+    started = threading.Event()
+
+    def loop() -> None:
+        started.set()
+        while True:
+            check_current_task_canceled()
+            time.sleep(0.01)
+
+    task = run_as_task(loop)
+    started.wait(5)
+    task.cancel()
+
+    with pytest.raises(CancelledError):
+        task.result(5)
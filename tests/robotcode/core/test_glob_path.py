@@ -0,0 +1,69 @@
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from robotcode.core.utils.glob_path import iter_files
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for name in [
+        "a.robot",
+        "b.resource",
+        "c.txt",
+        ".hidden/d.robot",
+        "tests/e.robot",
+        "tests/sub/f.robot",
+        "results/g.robot",
+        "node_modules/pkg/h.robot",
+        "src/lib/i.robot",
+        "src/lib/j.py",
+    ]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+    return tmp_path
+
+
+def _files(root: Path, *args: object, **kwargs: object) -> List[str]:
+    return sorted(f.relative_to(root).as_posix() for f in iter_files(root, *args, **kwargs) if f.is_file())
+
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_iter_files_with_patterns_and_ignore_patterns(tree: Path, workers: Optional[int]) -> None:
+    assert _files(tree, "**/*.{robot,resource}", ["results/", "**/node_modules"], workers=workers) == [
+        "a.robot",
+        "b.resource",
+        "src/lib/i.robot",
+        "tests/e.robot",
+        "tests/sub/f.robot",
+    ]
+
+
+def test_iter_files_with_literal_prefix_only_returns_files_below_prefix(tree: Path) -> None:
+    assert _files(tree, "tests/**/*.robot") == ["tests/e.robot", "tests/sub/f.robot"]
+
+
+def test_iter_files_should_include_hidden_if_requested(tree: Path) -> None:
+    assert ".hidden/d.robot" in _files(tree, "**/*.robot", include_hidden=True)
+    assert ".hidden/d.robot" not in _files(tree, "**/*.robot")
+
+
+def test_iter_files_respects_ignore_files(tree: Path) -> None:
+    (tree / ".gitignore").write_text("# comment\nresults/\nnode_modules\n*.txt\n/src/lib/*\n!/src/lib/i.robot\n")
+    (tree / "tests" / ".gitignore").write_text("sub/\n")
+
+    assert _files(tree, ignore_files=[".gitignore"]) == [
+        "a.robot",
+        "b.resource",
+        "src/lib/i.robot",
+        "tests/e.robot",
+    ]
+
+
+def test_iter_files_yields_directories_after_their_content(tree: Path) -> None:
+    result = [f.relative_to(tree).as_posix() for f in iter_files(tree, "tests/**")]
+
+    assert result.index("tests/sub/f.robot") < result.index("tests/sub")
@@ -0,0 +1,77 @@
+import inspect
+import logging
+from typing import Iterator, List
+
+import pytest
+
+from robotcode.core.utils.logging import LoggingDescriptor
+
+
+class Traced:
+    _logger = LoggingDescriptor(name="robotcode.tests.call_tracing")
+
+    @_logger.call(level=logging.INFO)
+    def add(self, a: int, b: int = 0) -> int:
+        return a + b
+
+
+@pytest.fixture(autouse=True)
+def _reset_call_tracing() -> Iterator[None]:
+    # initialize the logger, so caplog.set_level is not overwritten by the descriptor
+    _ = Traced._logger.logger
+
+    enabled = LoggingDescriptor._call_tracing_enabled
+    sample_rate = LoggingDescriptor._call_tracing_sample_rate
+    yield
+    LoggingDescriptor.set_call_tracing(enabled, sample_rate=sample_rate)
+
+
+def _traced_messages(caplog: pytest.LogCaptureFixture) -> List[str]:
+    return [r.getMessage() for r in caplog.records if r.name == "robotcode.tests.call_tracing"]
+
+
+def test_call_tracing_can_be_enabled_at_runtime(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO, "robotcode.tests.call_tracing")
+    traced = Traced()
+
+    LoggingDescriptor.set_call_tracing(False)
+    assert traced.add(1, b=2) == 3
+    assert _traced_messages(caplog) == []
+
+    LoggingDescriptor.set_call_tracing(True)
+    assert traced.add(1, b=2) == 3
+    assert _traced_messages(caplog) == ["Traced.add(1, b=2)"]
+
+
+def test_call_tracing_can_be_disabled_per_logger(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO, "robotcode.tests.call_tracing")
+    traced = Traced()
+
+    LoggingDescriptor.set_call_tracing(True)
+    LoggingDescriptor.set_call_tracing(False, name="robotcode.tests")
+    traced.add(1)
+
+    assert _traced_messages(caplog) == []
+
+
+def test_call_tracing_samples_calls(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO, "robotcode.tests.call_tracing")
+    traced = Traced()
+
+    LoggingDescriptor.set_call_tracing(True, sample_rate=10)
+    for i in range(100):
+        traced.add(i)
+
+    assert len(_traced_messages(caplog)) == 10
+
+
+def test_call_tracing_records_the_caller(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO, "robotcode.tests.call_tracing")
+    traced = Traced()
+
+    LoggingDescriptor.set_call_tracing(True)
+    line = inspect.currentframe().f_lineno + 1  # type: ignore[union-attr]
+    traced.add(1)
+
+    records = [r for r in caplog.records if r.name == "robotcode.tests.call_tracing"]
+    assert [(r.funcName, r.lineno) for r in records] == [("test_call_tracing_records_the_caller", line)]
@@ -0,0 +1,56 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from robotcode.core.utils.metrics import Histogram, Metrics
+
+
+def test_metrics_are_not_collected_if_disabled() -> None:
+    m = Metrics()
+
+    with m.timer("phase.parse"):
+        pass
+    m.observe("rpc.request.test", 1)
+    m.increment("counter")
+
+    snapshot = m.snapshot()
+    assert snapshot["histograms"] == {}
+    assert snapshot["counters"] == {}
+
+
+def test_metrics_collects_histograms_counters_and_gauges(tmp_path: Path) -> None:
+    @dataclass
+    class Stats:
+        queued: int
+
+    m = Metrics()
+    m.enabled = True
+    m.register_gauge("pool", lambda: Stats(3))
+
+    with m.timer("phase.parse"):
+        pass
+    m.observe("rpc.request.test", 0.003)
+    m.observe("rpc.request.test", 0.5)
+    m.increment("counter")
+    m.increment("counter", 2)
+
+    snapshot = m.snapshot()
+    assert snapshot["histograms"]["phase.parse"]["count"] == 1
+    assert snapshot["histograms"]["rpc.request.test"]["count"] == 2
+    assert snapshot["histograms"]["rpc.request.test"]["max"] == 0.5
+    assert snapshot["counters"] == {"counter": 3}
+    assert snapshot["gauges"] == {"pool": {"queued": 3}}
+
+    file = m.dump(tmp_path / "metrics.json")
+    assert file is not None
+    assert json.loads(file.read_text())["counters"] == {"counter": 3}
+
+
+def test_histogram_percentile_returns_bucket_upper_bound() -> None:
+    h = Histogram()
+    for _ in range(99):
+        h.observe(0.0015)
+    h.observe(3)
+
+    assert h.percentile(50) == 0.002
+    assert h.percentile(100) == 5.0
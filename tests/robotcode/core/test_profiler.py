@@ -0,0 +1,54 @@
+import pstats
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from robotcode.core.utils.profiler import get_profiling_output_dir, is_profiling, start_profiling, stop_profiling
+
+
+def _busy(seconds: float) -> None:
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        sum(range(100))
+
+
+def test_profiler_samples_all_threads(tmp_path: Path) -> None:
+    assert start_profiling(tmp_path, interval=0.001)
+    assert is_profiling()
+    assert not start_profiling(tmp_path)
+
+    thread = threading.Thread(target=_busy, args=(0.2,), name="worker")
+    thread.start()
+    thread.join()
+
+    result = stop_profiling()
+
+    assert not is_profiling()
+    assert result is not None
+    assert result.samples > 0
+
+    collapsed = result.collapsed_file.read_text()
+    assert any(line.startswith("worker;") and "_busy" in line for line in collapsed.splitlines())
+
+    stats = pstats.Stats(str(result.pstats_file))
+    assert any(func[2] == "_busy" for func in stats.stats)  # type: ignore[attr-defined]
+
+
+def test_profiler_stops_after_duration(tmp_path: Path) -> None:
+    start_profiling(tmp_path, duration=0.05, interval=0.001)
+    time.sleep(0.5)
+
+    assert not is_profiling()
+
+    result = stop_profiling()
+    assert result is not None
+    assert result.pstats_file.exists()
+
+
+def test_profiling_output_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_profiling_output_dir(tmp_path) == tmp_path / ".robotcode_cache" / "profiles"
+
+    monkeypatch.chdir(tmp_path)
+    assert get_profiling_output_dir() == tmp_path / ".robotcode_cache" / "profiles"
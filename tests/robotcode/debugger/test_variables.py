@@ -0,0 +1,58 @@
+from robot.utils import DotDict
+
+from robotcode.debugger.debugger import (
+    MAX_UNPAGED_VARIABLES,
+    Debugger,
+    ValueFormatter,
+    VariablesReferences,
+)
+
+
+def test_variables_are_paged() -> None:
+    debugger = Debugger.instance()
+
+    variable = debugger._create_variable("${list}", list(range(10_000)))
+    assert variable.named_variables == 1
+    assert variable.indexed_variables == 10_000
+
+    page = debugger.get_variables(variable.variables_reference, "indexed", 100, 3)
+    assert [(v.name, v.value) for v in page] == [("100", "100"), ("101", "101"), ("102", "102")]
+
+    named = debugger.get_variables(variable.variables_reference, "named")
+    assert [(v.name, v.value) for v in named] == [("len()", "10000")]
+
+    unpaged = debugger.get_variables(variable.variables_reference)
+    assert len(unpaged) == MAX_UNPAGED_VARIABLES + 2
+    assert unpaged[-1].name == "Unable to handle"
+
+
+def test_mapping_items_are_indexed() -> None:
+    debugger = Debugger.instance()
+
+    variable = debugger._create_variable("&{dict}", DotDict((f"key{i}", i) for i in range(1_000)))
+    assert variable.indexed_variables == 1_000
+
+    page = debugger.get_variables(variable.variables_reference, "indexed", 998, 10)
+    assert [(v.name, v.value) for v in page] == [("'key998'", "998"), ("'key999'", "999")]
+
+
+def test_variables_references_drop_least_recently_used() -> None:
+    references = VariablesReferences(2)
+    first, second, third = [1], [2], [3]
+
+    first_id = references.add(first)
+    second_id = references.add(second)
+    assert references.add(first) == first_id
+
+    references.add(third)
+    assert len(references) == 2
+    assert references.get(first_id) is first
+    assert references.get(second_id) is None
+
+
+def test_value_formatter_has_a_budget() -> None:
+    formatter = ValueFormatter(20)
+
+    assert formatter.format("x" * 10) == repr("x" * 10)
+    assert formatter.format(list(range(100))) == "[0, 1, 2, 3, 4, 5, ...]"
+    assert formatter.format(list(range(100))) == "<list with 100 items>"
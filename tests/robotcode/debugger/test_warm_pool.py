@@ -0,0 +1,76 @@
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+
+from robotcode.core.utils.dataclasses import as_json, from_json
+from robotcode.debugger.warm_pool import (
+    WarmOrder,
+    WarmPoolEntry,
+    WarmReply,
+    claim_warm_process,
+    get_warm_pool_file,
+    get_warm_pool_key,
+    spawn_warm_process,
+)
+
+
+def test_warm_pool_key_depends_on_the_launch_environment() -> None:
+    key = get_warm_pool_key("python", ["-m", "robotcode.cli"], {"A": "1"}, [], [])
+
+    assert key == get_warm_pool_key("python", ["-m", "robotcode.cli"], {"A": "1"}, [], [])
+    assert key != get_warm_pool_key("python", ["-m", "robotcode.cli"], {"A": "2"}, [], [])
+    assert key != get_warm_pool_key("python", ["-m", "robotcode.cli"], {"A": "1"}, ["SeleniumLibrary"], [])
+
+
+def test_warm_process_can_only_be_claimed_once(tmp_path: Path) -> None:
+    pool_file = get_warm_pool_file(tmp_path, "key")
+    pool_file.parent.mkdir(parents=True)
+    pool_file.write_text(as_json(WarmPoolEntry(1, 2, "token")), "utf-8")
+
+    assert claim_warm_process(pool_file) == WarmPoolEntry(1, 2, "token")
+    assert claim_warm_process(pool_file) is None
+    assert list(pool_file.parent.iterdir()) == []
+
+
+def test_warm_process_runs_the_launch_order(tmp_path: Path) -> None:
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "warm.robot").write_text(
+        "*** Test Cases ***\nFirst\n    Log To Console    hello from warm process\n", "utf-8"
+    )
+
+    pool_file = get_warm_pool_file(tmp_path, "key")
+    process = spawn_warm_process(
+        [sys.executable, "-m", "robotcode.cli"], pool_file, tmp_path, dict(os.environ), [], [], 30
+    )
+    assert process is not None
+
+    try:
+        deadline = time.monotonic() + 30
+        while not pool_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        entry = claim_warm_process(pool_file)
+        assert entry is not None
+
+        with socket.create_connection(("127.0.0.1", entry.port), timeout=30) as connection:
+            order = WarmOrder(
+                entry.token,
+                str(tmp_path),
+                dict(os.environ),
+                ["debug", "--no-debug", "--no-wait-for-client", "--", "-d", "out", "tests"],
+            )
+            connection.sendall(as_json(order, compact=True).encode("utf-8") + b"\n")
+
+            with connection.makefile("rb") as reader:
+                assert from_json(reader.readline(), WarmReply).accepted
+                output = reader.read().decode("utf-8")
+
+        assert "hello from warm process" in output
+        assert process.wait(30) == 0
+        assert (tmp_path / "out" / "output.xml").exists()
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 from typing import Any, Dict, List, Optional, cast
 
 import pytest
@@ -10,9 +11,11 @@ from robotcode.jsonrpc2.protocol import (
     JsonRPCErrorObject,
     JsonRPCErrors,
     JsonRPCMessage,
+    JsonRPCNotification,
     JsonRPCProtocol,
     JsonRPCRequest,
     JsonRPCResponse,
+    ReceivedRequestEntry,
 )
 from robotcode.jsonrpc2.server import JsonRPCServer
 
@@ -242,3 +245,95 @@ async def test_receive_response_with_generic_dict_should_return_unchanged() -> N
     a = r.result(10)
 
     assert a == [as_dict(MessageActionItem(title="hi there"))]
+
+
+@pytest.mark.asyncio
+async def test_drop_received_requests_should_cancel_matching_requests() -> None:
+    protocol = DummyJsonRPCProtocol(None)
+
+    entries = [
+        ReceivedRequestEntry(asyncio.get_running_loop().create_future(), JsonRPCRequest(id=i, method=m), True)
+        for i, m in enumerate(["textDocument/codeLens", "textDocument/hover", "textDocument/codeLens"])
+    ]
+    for entry in entries:
+        protocol._received_request[entry.request.id] = entry
+
+    assert protocol.drop_received_requests(lambda r: r.method == "textDocument/codeLens", -32801, "modified") == 2
+
+    assert [e.future.cancelled() for e in entries] == [True, False, True]
+    assert entries[0].cancel_error_code == -32801
+    assert protocol.dropped_requests == {"textDocument/codeLens": 2}
+
+
+class WriteRecordingJsonRPCProtocol(JsonRPCProtocol):
+    def __init__(self) -> None:
+        super().__init__()
+        self.written_messages: List[JsonRPCMessage] = []
+
+    def _write_message(self, message: JsonRPCMessage) -> None:
+        self.written_messages.append(message)
+
+
+@pytest.mark.asyncio
+async def test_coalesced_notifications_should_only_send_the_last_one_per_key() -> None:
+    protocol = WriteRecordingJsonRPCProtocol()
+    protocol._loop = asyncio.get_running_loop()
+
+    for i in range(5):
+        protocol.send_notification("$/progress", {"token": "a", "value": i}, coalesce_key="a")
+    protocol.send_notification("$/progress", {"token": "b", "value": 1}, coalesce_key="b")
+
+    assert protocol.written_messages == []
+
+    await asyncio.sleep(protocol.notification_coalesce_delay * 4)
+
+    assert [cast(JsonRPCNotification, m).params for m in protocol.written_messages] == [
+        {"token": "a", "value": 4},
+        {"token": "b", "value": 1},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_notifications_should_be_sent_before_other_messages() -> None:
+    protocol = WriteRecordingJsonRPCProtocol()
+    protocol._loop = asyncio.get_running_loop()
+
+    protocol.send_notification("$/progress", {"value": 1}, coalesce_key="a")
+    protocol.send_notification("$/progress", {"value": "end"})
+
+    assert [cast(JsonRPCNotification, m).params for m in protocol.written_messages] == [{"value": 1}, {"value": "end"}]
+
+
+class SlowWriteRecordingJsonRPCProtocol(WriteRecordingJsonRPCProtocol):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writing = threading.Event()
+        self.continue_writing = threading.Event()
+
+    def _write_message(self, message: JsonRPCMessage) -> None:
+        if isinstance(message, JsonRPCNotification) and message.method == "$/progress":
+            self.writing.set()
+            self.continue_writing.wait(5)
+        super()._write_message(message)
+
+
+@pytest.mark.asyncio
+async def test_messages_sent_while_flushing_notifications_should_not_overtake_them() -> None:
+    protocol = SlowWriteRecordingJsonRPCProtocol()
+    protocol._loop = asyncio.get_running_loop()
+
+    protocol.send_notification("$/progress", {"value": 1}, coalesce_key="a")
+
+    flush = threading.Thread(target=protocol.flush_notifications)
+    flush.start()
+    assert protocol.writing.wait(5)
+
+    send = threading.Thread(target=protocol.send_notification, args=("window/logMessage", {"value": "end"}))
+    send.start()
+    send.join(0.1)
+
+    protocol.continue_writing.set()
+    flush.join(5)
+    send.join(5)
+
+    assert [cast(JsonRPCNotification, m).params for m in protocol.written_messages] == [{"value": 1}, {"value": "end"}]
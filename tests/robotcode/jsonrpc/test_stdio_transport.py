@@ -0,0 +1,24 @@
+import io
+import time
+
+from robotcode.jsonrpc2.server import StdOutTransportAdapter
+
+
+class BrokenPipe(io.BytesIO):
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        raise BrokenPipeError
+
+
+def test_write_drops_data_after_the_output_failed() -> None:
+    transport = StdOutTransportAdapter(io.BytesIO(), BrokenPipe())
+
+    transport.write(b"first")
+
+    deadline = time.monotonic() + 5
+    while not transport.is_closing() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert transport.is_closing()
+
+    transport.write(b"second")
+    assert transport._write_buffer == []
@@ -0,0 +1,114 @@
+import threading
+import time
+from concurrent.futures import CancelledError
+from typing import Any, List
+
+import pytest
+
+from robotcode.core.concurrent import check_current_task_canceled, run_as_task
+from robotcode.core.lsp.types import Diagnostic, Position, Range
+from robotcode.core.text_document import TextDocument
+from robotcode.language_server.common.parts.diagnostics import DiagnosticsResult
+from robotcode.language_server.common.protocol import LanguageServerProtocol
+
+
+@pytest.fixture
+def protocol() -> LanguageServerProtocol:
+    result = LanguageServerProtocol(None)  # type: ignore[arg-type]
+    result.diagnostics._diagnostics_collector_timeout = 0.5
+    return result
+
+
+@pytest.fixture
+def document() -> TextDocument:
+    return TextDocument("file:///test.robot", "*** Test Cases ***\n", "robotframework", 1)
+
+
+def _diagnostic(message: str) -> Diagnostic:
+    return Diagnostic(Range(Position(0, 0), Position(0, 1)), message)
+
+
+def _wait_until_cancelled(cancelled: threading.Event) -> None:
+    try:
+        while True:
+            check_current_task_canceled()
+            time.sleep(0.01)
+    except CancelledError:
+        cancelled.set()
+        raise
+
+
+def test_each_collector_has_its_own_time_budget(protocol: LanguageServerProtocol, document: TextDocument) -> None:
+    cancelled = threading.Event()
+
+    def fast(sender: Any, document: TextDocument) -> DiagnosticsResult:
+        return DiagnosticsResult(fast, [_diagnostic("fast")])
+
+    def slow(sender: Any, document: TextDocument) -> DiagnosticsResult:
+        time.sleep(0.3)
+        return DiagnosticsResult(slow, [_diagnostic("slow")])
+
+    def hanging(sender: Any, document: TextDocument) -> DiagnosticsResult:
+        _wait_until_cancelled(cancelled)
+        return DiagnosticsResult(hanging, [])
+
+    protocol.diagnostics.collect.add(fast)
+    protocol.diagnostics.collect.add(slow)
+    protocol.diagnostics.collect.add(hanging)
+
+    start = time.monotonic()
+    results = list(protocol.diagnostics._collect_diagnostics(document))
+    assert time.monotonic() - start < 5
+
+    assert sorted(r.key.__name__ for r in results if isinstance(r, DiagnosticsResult)) == ["fast", "slow"]
+    assert cancelled.wait(5)
+
+
+def test_cancelling_the_diagnostics_task_cancels_the_collectors(
+    protocol: LanguageServerProtocol, document: TextDocument
+) -> None:
+    protocol.diagnostics._diagnostics_collector_timeout = 60
+    started = threading.Event()
+    cancelled: List[threading.Event] = [threading.Event(), threading.Event()]
+
+    def first(sender: Any, document: TextDocument) -> DiagnosticsResult:
+        started.set()
+        _wait_until_cancelled(cancelled[0])
+        return DiagnosticsResult(first, [])
+
+    def second(sender: Any, document: TextDocument) -> DiagnosticsResult:
+        _wait_until_cancelled(cancelled[1])
+        return DiagnosticsResult(second, [])
+
+    protocol.diagnostics.collect.add(first)
+    protocol.diagnostics.collect.add(second)
+
+    task = run_as_task(lambda: list(protocol.diagnostics._collect_diagnostics(document)))
+    assert started.wait(5)
+
+    task.cancel()
+
+    assert cancelled[0].wait(5)
+    assert cancelled[1].wait(5)
+
+
+def test_shutdown_cancels_and_joins_the_workspace_loading(protocol: LanguageServerProtocol) -> None:
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    def load_workspace_documents(sender: Any) -> None:
+        started.set()
+        _wait_until_cancelled(cancelled)
+
+    protocol.diagnostics.load_workspace_documents.add(load_workspace_documents)
+
+    protocol.diagnostics.server_initialized(protocol)
+    assert started.wait(5)
+
+    task = protocol.diagnostics._load_workspace_task
+    assert task is not None
+
+    protocol.diagnostics.cancel_workspace_diagnostics_task(protocol)
+
+    assert cancelled.is_set()
+    assert task.done()
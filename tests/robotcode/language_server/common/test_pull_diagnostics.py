@@ -0,0 +1,138 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from robotcode.core.lsp.types import Diagnostic, Position, Range
+from robotcode.core.text_document import TextDocument
+from robotcode.core.uri import Uri
+from robotcode.core.utils.dataclasses import as_json
+from robotcode.jsonrpc2.protocol import JsonRPCMessage, JsonRPCNotification, JsonRPCRequest, JsonRPCResponse
+from robotcode.language_server.common.parts import diagnostics as diagnostics_part
+from robotcode.language_server.common.parts.diagnostics import DiagnosticsMode, DiagnosticsResult
+from robotcode.language_server.common.protocol import LanguageServerProtocol
+
+
+class RecordingLanguageServerProtocol(LanguageServerProtocol):
+    def __init__(self) -> None:
+        super().__init__(None)  # type: ignore[arg-type]
+        self.sent: List[JsonRPCMessage] = []
+
+    def send_message(self, message: JsonRPCMessage) -> None:
+        self.sent.append(message)
+
+    @staticmethod
+    def to_wire(value: Any) -> Any:
+        return json.loads(as_json(value, compact=True))
+
+    async def request(self, id: int, method: str, params: Dict[str, Any]) -> Any:
+        await self.handle_request(JsonRPCRequest(id=id, method=method, params=params))
+
+        for _ in range(100):
+            response = next((m for m in self.sent if isinstance(m, JsonRPCResponse) and m.id == id), None)
+            if response is not None:
+                return self.to_wire(response.result)
+            await asyncio.sleep(0.01)
+
+        raise AssertionError(f"no response for request {id}: {self.sent!r}")
+
+    def progress(self, token: str) -> List[Any]:
+        return [
+            self.to_wire(m.params)["value"]
+            for m in self.sent
+            if isinstance(m, JsonRPCNotification)
+            and m.method == "$/progress"
+            and self.to_wire(m.params)["token"] == token
+        ]
+
+
+def _workspace_mode(sender: Any, uri: Uri) -> DiagnosticsMode:
+    return DiagnosticsMode.WORKSPACE
+
+
+@pytest.fixture
+def protocol() -> RecordingLanguageServerProtocol:
+    result = RecordingLanguageServerProtocol()
+    result.is_initialized.set()
+    result.diagnostics.on_get_diagnostics_mode.add(_workspace_mode)
+    return result
+
+
+class Messages:
+    def __init__(self) -> None:
+        self.messages: Dict[str, List[str]] = {}
+
+    def collect(self, sender: Any, document: TextDocument) -> Optional[DiagnosticsResult]:
+        return DiagnosticsResult(
+            self.collect,
+            [
+                Diagnostic(Range(Position(0, 0), Position(0, 1)), m)
+                for m in self.messages.get(document.document_uri, [])
+            ],
+        )
+
+
+def _add_document(protocol: LanguageServerProtocol, name: str) -> TextDocument:
+    return protocol.documents.append_document(str(Uri.from_path(f"/tmp/{name}.robot")), "robotframework", "", 1)
+
+
+async def test_document_diagnostic_result_id_round_trip(protocol: RecordingLanguageServerProtocol) -> None:
+    messages = Messages()
+    protocol.diagnostics.collect.add(messages.collect)
+
+    document = _add_document(protocol, "first")
+    messages.messages[document.document_uri] = ["an error"]
+    params = {"textDocument": {"uri": document.document_uri}}
+
+    full = await protocol.request(1, "textDocument/diagnostic", params)
+    assert full["kind"] == "full"
+    assert [d["message"] for d in full["items"]] == ["an error"]
+    assert full["resultId"]
+
+    unchanged = await protocol.request(2, "textDocument/diagnostic", {**params, "previousResultId": full["resultId"]})
+    assert unchanged == {"kind": "unchanged", "resultId": full["resultId"]}
+
+    # recollected diagnostics that are the same keep the result id
+    protocol.diagnostics.force_refresh_document(document, False)
+    unchanged = await protocol.request(3, "textDocument/diagnostic", {**params, "previousResultId": full["resultId"]})
+    assert unchanged == {"kind": "unchanged", "resultId": full["resultId"]}
+
+    messages.messages[document.document_uri] = ["another error"]
+    protocol.diagnostics.force_refresh_document(document, False)
+    changed = await protocol.request(4, "textDocument/diagnostic", {**params, "previousResultId": full["resultId"]})
+    assert changed["kind"] == "full"
+    assert changed["resultId"] != full["resultId"]
+    assert [d["message"] for d in changed["items"]] == ["another error"]
+
+
+async def test_workspace_diagnostic_streams_partial_results(
+    protocol: RecordingLanguageServerProtocol, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(diagnostics_part, "WORKSPACE_DIAGNOSTICS_PARTIAL_RESULT_SIZE", 2)
+
+    messages = Messages()
+    protocol.diagnostics.collect.add(messages.collect)
+
+    documents = [_add_document(protocol, f"doc{i}") for i in range(5)]
+    for document in documents:
+        messages.messages[document.document_uri] = [f"error in {document.document_uri}"]
+
+    result = await protocol.request(
+        1, "workspace/diagnostic", {"previousResultIds": [], "partialResultToken": "partial"}
+    )
+    assert result == {"items": []}
+
+    partial_results = protocol.progress("partial")
+    assert [len(p["items"]) for p in partial_results] == [2, 2, 1]
+
+    reports = {item["uri"]: item for p in partial_results for item in p["items"]}
+    assert set(reports) == {d.document_uri for d in documents}
+    assert all(r["kind"] == "full" for r in reports.values())
+    assert all([d["message"] for d in r["items"]] == [f"error in {uri}"] for uri, r in reports.items())
+
+    previous_result_ids = [{"uri": uri, "value": r["resultId"]} for uri, r in reports.items()]
+    result = await protocol.request(2, "workspace/diagnostic", {"previousResultIds": previous_result_ids})
+    assert sorted(item["uri"] for item in result["items"]) == sorted(reports)
+    assert all(item["kind"] == "unchanged" for item in result["items"])
+    assert all(item["resultId"] == reports[item["uri"]]["resultId"] for item in result["items"])
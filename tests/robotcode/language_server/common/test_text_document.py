@@ -4,6 +4,8 @@ from robotcode.core.lsp.types import Position, Range
 from robotcode.core.text_document import (
     InvalidRangeError,
     TextDocument,
+    position_from_utf16,
+    position_to_utf16,
 )
 
 
@@ -340,3 +342,21 @@ third
     del dummy
 
     assert len(document._cache) == 0
+
+
+def test_utf16_conversion_should_give_the_same_result_as_the_line_based_functions() -> None:
+    document = TextDocument(document_uri="file:///test.robot", text="a😀b😀c\nabc\n\u00e4\u00f6\u00fc\n")
+    lines = document.get_lines()
+
+    for line in range(5):
+        for character in range(-1, 10):
+            position = Position(line, character)
+
+            assert document.position_to_utf16(position) == position_to_utf16(lines, position)
+            assert document.position_from_utf16(position) == position_from_utf16(lines, position)
+
+    assert document.range_to_utf16(Range(Position(0, 2), Position(0, 4))) == Range(Position(0, 3), Position(0, 6))
+
+    document.apply_full_change(None, "😀\n")
+
+    assert document.position_to_utf16(Position(0, 1)) == Position(0, 2)
@@ -0,0 +1,67 @@
+import time
+from typing import Any, List, Optional
+
+import pytest
+
+from robotcode.language_server.common.parts.window import Progress
+from robotcode.language_server.common.protocol import LanguageServerProtocol
+
+
+@pytest.fixture
+def sent() -> List[Any]:
+    return []
+
+
+def _create_progress(monkeypatch: pytest.MonkeyPatch, sent: List[Any]) -> Progress:
+    protocol = LanguageServerProtocol(None)  # type: ignore[arg-type]
+    window = protocol.window
+    window.progress_update_interval = 0.1
+
+    def progress_begin(token: Any, message: Optional[str] = None, percentage: Optional[int] = None, *args: Any) -> None:
+        sent.append(("begin", percentage))
+
+    def progress_report(
+        token: Any, message: Optional[str] = None, percentage: Optional[int] = None, *args: Any
+    ) -> None:
+        sent.append(("report", percentage))
+
+    def progress_end(token: Any, message: Optional[str] = None) -> None:
+        sent.append(("end", None))
+
+    monkeypatch.setattr(window, "progress_begin", progress_begin)
+    monkeypatch.setattr(window, "progress_report", progress_report)
+    monkeypatch.setattr(window, "progress_end", progress_end)
+
+    progress = Progress(window, "token", max=100)
+    progress.begin()
+    return progress
+
+
+def test_progress_sends_throttled_report_at_the_end_of_the_interval(
+    monkeypatch: pytest.MonkeyPatch, sent: List[Any]
+) -> None:
+    progress = _create_progress(monkeypatch, sent)
+
+    progress.report(current=1)
+    progress.report(current=2)
+    progress.report(current=3)
+
+    assert sent == [("begin", None), ("report", 1)]
+
+    time.sleep(0.3)
+
+    assert sent == [("begin", None), ("report", 1), ("report", 3)]
+
+    progress.end()
+
+
+def test_progress_end_sends_throttled_report_once(monkeypatch: pytest.MonkeyPatch, sent: List[Any]) -> None:
+    progress = _create_progress(monkeypatch, sent)
+
+    progress.report(current=1)
+    progress.report(current=2)
+    progress.end()
+
+    time.sleep(0.3)
+
+    assert sent == [("begin", None), ("report", 1), ("report", 2), ("end", None)]
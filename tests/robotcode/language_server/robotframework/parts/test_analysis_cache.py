@@ -0,0 +1,120 @@
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List, Optional
+
+from robotcode.core.lsp.types import Diagnostic, Position, Range
+from robotcode.core.text_document import TextDocument
+from robotcode.core.uri import Uri
+from robotcode.language_server.robotframework.diagnostics.analysis_cache import AnalysisCache
+from robotcode.language_server.robotframework.protocol import RobotLanguageServerProtocol
+
+
+def _namespace(
+    resources: List[Path],
+    diagnostics: List[Diagnostic],
+    libraries: Optional[List[Optional[str]]] = None,
+    unresolved_imports: bool = False,
+) -> Any:
+    entries = {str(r): SimpleNamespace(library_doc=SimpleNamespace(source_or_origin=str(r))) for r in resources}
+    library_entries = {
+        str(i): SimpleNamespace(library_doc=SimpleNamespace(source_or_origin=s)) for i, s in enumerate(libraries or [])
+    }
+
+    return SimpleNamespace(
+        get_libraries=lambda: library_entries,
+        get_resources=lambda: entries,
+        get_imported_variables=lambda: {},
+        get_diagnostics=lambda: diagnostics,
+        has_unresolved_imports=lambda: unresolved_imports,
+    )
+
+
+def _document(path: Path, text: str) -> TextDocument:
+    return TextDocument(str(Uri.from_path(path)), text, "robotframework", 1)
+
+
+def _save(cache: AnalysisCache, document: TextDocument, namespace: Any) -> None:
+    entry = cache.create_entry(document, namespace)
+    assert entry is not None
+    cache.save(entry)
+
+
+def test_analysis_cache_roundtrip(tmp_path: Path) -> None:
+    resource = tmp_path / "common.resource"
+    resource.write_text("*** Keywords ***\n", "utf-8")
+    source = tmp_path / "suite.robot"
+    diagnostic = Diagnostic(Range(Position(1, 0), Position(1, 4)), "Keyword 'Foo' not found.")
+
+    cache = AnalysisCache(tmp_path / "cache", "env")
+    _save(cache, _document(source, "*** Test Cases ***\n"), _namespace([resource], [diagnostic]))
+
+    entry = cache.load(_document(source, "*** Test Cases ***\n"))
+    assert entry is not None
+    assert [d.source for d in entry.dependencies] == [str(resource)]
+    assert entry.get_diagnostics() == [diagnostic]
+    assert entry.get_diagnostics()[0] is not entry.diagnostics[0]
+
+
+def test_analysis_cache_is_invalidated_by_content_changes(tmp_path: Path) -> None:
+    source = tmp_path / "suite.robot"
+
+    cache = AnalysisCache(tmp_path / "cache", "env")
+    _save(cache, _document(source, "*** Test Cases ***\n"), _namespace([], []))
+
+    assert cache.load(_document(source, "*** Test Cases ***\nFirst\n")) is None
+    assert AnalysisCache(tmp_path / "cache", "other env").load(_document(source, "*** Test Cases ***\n")) is None
+    assert cache.load(_document(source, "*** Test Cases ***\n")) is not None
+
+
+def test_analysis_cache_is_invalidated_by_import_changes(tmp_path: Path) -> None:
+    resource = tmp_path / "common.resource"
+    resource.write_text("*** Keywords ***\n", "utf-8")
+    source = tmp_path / "suite.robot"
+    document = _document(source, "*** Test Cases ***\n")
+
+    cache = AnalysisCache(tmp_path / "cache", "env")
+    _save(cache, document, _namespace([resource], []))
+    assert cache.load(document) is not None
+
+    stat = resource.stat()
+    os.utime(resource, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.load(document) is None
+
+    _save(cache, document, _namespace([resource], []))
+    resource.write_text("*** Keywords ***\nFoo\n    No Operation\n", "utf-8")
+    os.utime(resource, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.load(document) is None
+
+    _save(cache, document, _namespace([resource], []))
+    resource.unlink()
+    assert cache.load(document) is None
+
+
+def test_analysis_cache_skips_documents_with_missing_imports(tmp_path: Path) -> None:
+    cache = AnalysisCache(tmp_path / "cache", "env")
+    document = _document(tmp_path / "suite.robot", "*** Test Cases ***\n")
+
+    assert cache.create_entry(document, _namespace([tmp_path / "missing.resource"], [])) is None
+
+
+def test_analysis_cache_skips_documents_with_unresolved_imports(tmp_path: Path) -> None:
+    cache = AnalysisCache(tmp_path / "cache", "env")
+    document = _document(tmp_path / "suite.robot", "*** Test Cases ***\n")
+
+    assert cache.create_entry(document, _namespace([], [], unresolved_imports=True)) is None
+    assert cache.create_entry(document, _namespace([], [], libraries=[None])) is None
+    assert cache.create_entry(document, _namespace([], [])) is not None
+
+
+def test_namespace_reports_unresolved_imports(protocol: RobotLanguageServerProtocol, tmp_path: Path) -> None:
+    resource = tmp_path / "common.resource"
+    resource.write_text("*** Settings ***\nResource    missing.resource\n", "utf-8")
+
+    resolved = _document(tmp_path / "resolved.robot", "*** Settings ***\nLibrary    Collections\n")
+    missing_library = _document(tmp_path / "library.robot", "*** Settings ***\nLibrary    NotInstalledLibrary\n")
+    nested_resource = _document(tmp_path / "resource.robot", f"*** Settings ***\nResource    {resource}\n")
+
+    assert not protocol.documents_cache.get_namespace(resolved).has_unresolved_imports()
+    assert protocol.documents_cache.get_namespace(missing_library).has_unresolved_imports()
+    assert protocol.documents_cache.get_namespace(nested_resource).has_unresolved_imports()
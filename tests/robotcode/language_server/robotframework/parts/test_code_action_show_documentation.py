@@ -1,3 +1,5 @@
+import gzip
+import os
 from pathlib import Path
 from typing import Union
 
@@ -14,6 +16,9 @@ from robotcode.core.lsp.types import (
     Range,
 )
 from robotcode.core.text_document import TextDocument
+from robotcode.language_server.robotframework.parts.code_action_documentation import (
+    DocumentationRequest,
+)
 from robotcode.language_server.robotframework.protocol import (
     RobotLanguageServerProtocol,
 )
@@ -78,3 +83,95 @@ def test(
             }
         )
     )
+
+
+def test_documentation_is_cached(protocol: RobotLanguageServerProtocol) -> None:
+    request = DocumentationRequest("Collections", type="md")
+
+    result = protocol.robot_code_action_documentation.get_documentation(request)
+    assert result.content is not None
+    assert b"Collections" in gzip.decompress(result.content)
+
+    imports_manager = protocol.documents_cache.get_imports_manager_for_workspace_folder(None)
+    assert list(imports_manager.documentation_cache_path.glob("**/*.html.gz"))
+
+    cached = protocol.robot_code_action_documentation.get_documentation(request)
+    assert cached == result
+
+    not_modified = protocol.robot_code_action_documentation.get_documentation(request, [result.etag])
+    assert not_modified.etag == result.etag
+    assert not_modified.content is None
+
+
+def test_documentation_cache_keeps_pages_of_other_requests(protocol: RobotLanguageServerProtocol) -> None:
+    documentation = protocol.robot_code_action_documentation
+    imports_manager = protocol.documents_cache.get_imports_manager_for_workspace_folder(None)
+
+    markdown = documentation._get_cache_file(imports_manager, DocumentationRequest("Collections", type="md"))
+    html = documentation._get_cache_file(imports_manager, DocumentationRequest("Collections"))
+    dark = documentation._get_cache_file(imports_manager, DocumentationRequest("Collections", theme="dark"))
+    assert markdown is not None
+    assert html is not None
+    assert dark is not None
+
+    documentation._write_cache_file(markdown, b"markdown")
+    documentation._write_cache_file(html, b"html")
+    documentation._write_cache_file(dark, b"dark")
+    assert markdown.read_bytes() == b"markdown"
+    assert html.read_bytes() == b"html"
+
+    outdated = markdown.with_name(f"{markdown.name.rsplit('.', 3)[0]}.0000000000000000.html.gz")
+    documentation._write_cache_file(outdated, b"outdated")
+    assert not markdown.exists()
+    assert html.exists()
+    assert dark.exists()
+
+
+def test_documentation_usages_are_kept_in_memory(
+    protocol: RobotLanguageServerProtocol, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from robotcode.language_server.robotframework.parts import code_action_documentation
+
+    monkeypatch.setattr(code_action_documentation, "MAX_DOCUMENTATION_USAGES", 3)
+
+    documentation = protocol.robot_code_action_documentation
+    imports_manager = protocol.documents_cache.get_imports_manager_for_workspace_folder(None)
+    usages_file = documentation._get_usages_file(imports_manager)
+    usages_file.unlink(missing_ok=True)
+    documentation._usages = None
+
+    for name in ["A", "A", "B", "C", "D"]:
+        documentation._track_usage(imports_manager, DocumentationRequest(name))
+
+    assert not usages_file.exists()
+    assert {r.name: u.count for r, u in documentation._get_usages(imports_manager).items()} == {
+        "A": 2,
+        "C": 1,
+        "D": 1,
+    }
+
+    documentation._flush_usages()
+    assert usages_file.exists()
+    assert documentation._usages_flush_timer is None
+
+
+def test_documentation_is_rendered_again_when_the_library_changes(
+    protocol: RobotLanguageServerProtocol, tmp_path: Path
+) -> None:
+    library = tmp_path / "ChangingLibrary.py"
+    request = DocumentationRequest(str(library), type="md")
+
+    library.write_text("def first_keyword():\n    pass\n", "utf-8")
+    first = protocol.robot_code_action_documentation.get_documentation(request)
+    assert first.content is not None
+    assert b"First Keyword" in gzip.decompress(first.content)
+
+    library.write_text("def second_keyword():\n    pass\n", "utf-8")
+    stat = library.stat()
+    os.utime(library, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = protocol.robot_code_action_documentation.get_documentation(request)
+    assert second.etag != first.etag
+    assert second.content is not None
+    assert b"Second Keyword" in gzip.decompress(second.content)
+    assert b"First Keyword" not in gzip.decompress(second.content)
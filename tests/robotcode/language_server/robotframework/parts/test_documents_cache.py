@@ -0,0 +1,54 @@
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from robotcode.core.text_document import TextDocument
+from robotcode.language_server.robotframework.parts import documents_cache
+from robotcode.language_server.robotframework.protocol import (
+    RobotLanguageServerProtocol,
+)
+
+
+def _wait_for_evicted_documents(protocol: RobotLanguageServerProtocol, evicted: int) -> int:
+    for _ in range(100):
+        current = protocol.documents_cache.get_cache_statistics().evicted_documents
+        if current > evicted:
+            return current
+        time.sleep(0.1)
+
+    return protocol.documents_cache.get_cache_statistics().evicted_documents
+
+
+def test_workspace_diagnostics_pass_builds_each_namespace_once(
+    protocol: RobotLanguageServerProtocol, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    protocol.diagnostics.cancel_workspace_diagnostics_task(None)
+
+    # every document exceeds the memory budget on its own
+    monkeypatch.setattr(documents_cache, "DOCUMENT_CACHE_SIZE_FACTOR", 1024 * 1024 * 1024)
+
+    documents: List[TextDocument] = []
+    for i in range(3):
+        path = tmp_path / f"suite{i}.robot"
+        path.write_text(f"*** Test Cases ***\nTest {i}\n    Log    {i}\n")
+        documents.append(protocol.documents.get_or_open_document(path, "robotframework"))
+
+    evicted = protocol.documents_cache.get_cache_statistics().evicted_documents
+
+    protocol.diagnostics.on_workspace_diagnostics_start(protocol.diagnostics)
+    protocol.diagnostics.on_workspace_diagnostics_analyze(protocol.diagnostics)
+
+    analyzed = [protocol.documents_cache.get_namespace(document) for document in documents]
+
+    protocol.diagnostics.on_workspace_diagnostics_collect(protocol.diagnostics)
+
+    collected = [protocol.documents_cache.get_namespace(document) for document in documents]
+
+    assert all(a is c for a, c in zip(analyzed, collected))
+    assert protocol.documents_cache.get_cache_statistics().evicted_documents == evicted
+
+    protocol.diagnostics.on_workspace_diagnostics_end(protocol.diagnostics)
+
+    assert _wait_for_evicted_documents(protocol, evicted) > evicted
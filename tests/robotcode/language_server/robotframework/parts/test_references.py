@@ -53,3 +53,64 @@ def test(
             }
         )
     )
+
+
+PREFILTER_SUITE = """\
+*** Settings ***
+Library    Collections
+
+*** Variables ***
+${URL}    example.com
+
+*** Test Cases ***
+First
+    Given Open Chrome With ${URL}
+    When Collections.Append To List    ${{[]}}    1
+    Then my keyword
+    And BuiltIn.Log    hi
+    Wait For 5 Seconds
+
+*** Keywords ***
+Open ${browser} With ${url}
+    Log    ${browser} ${url}
+
+My Keyword
+    No Operation
+
+Wait For ${n} Seconds
+    Log    ${n}
+
+Unused Keyword
+    No Operation
+"""
+
+
+def test_reference_prefilter_has_no_false_negatives(protocol: RobotLanguageServerProtocol, tmp_path: Path) -> None:
+    path = tmp_path / "prefilter.robot"
+    path.write_text(PREFILTER_SUITE, "utf-8")
+    document = protocol.documents.get_or_open_document(path, "robotframework")
+    references = protocol.robot_references
+
+    namespace = protocol.documents_cache.get_namespace(document)
+
+    keyword_references = {kw.name: refs for kw, refs in namespace.get_keyword_references().items()}
+    for name in [
+        "Open ${browser} With ${url}",
+        "My Keyword",
+        "Wait For ${n} Seconds",
+        "Append To List",
+        "Log",
+    ]:
+        assert keyword_references.get(name), name
+
+    for kw in namespace.get_keyword_references():
+        assert references._is_keyword_candidate(document, kw), kw.name
+
+    for var in namespace.get_variable_references():
+        assert references._is_variable_candidate(document, var), var.name
+
+    unused = next(kw for kw in namespace.get_library_doc().keywords.values() if kw.name == "Unused Keyword")
+    other_document = protocol.documents.get_or_open_document(
+        Path(Path(__file__).parent, "data/tests/references.robot"), "robotframework"
+    )
+    assert not references._is_keyword_candidate(other_document, unused)
@@ -0,0 +1,69 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from robotcode.core.lsp.types import Location, Position, Range
+from robotcode.language_server.robotframework.diagnostics.tag_index import (
+    DocumentTags,
+    TagIndex,
+    TagLocation,
+)
+from robotcode.language_server.robotframework.protocol import (
+    RobotLanguageServerProtocol,
+)
+
+
+def _range(line: int) -> Range:
+    return Range(Position(line, 0), Position(line, 5))
+
+
+def test_tag_index_updates_incrementally() -> None:
+    index = TagIndex()
+
+    a: DocumentTags = {
+        "smoke": [TagLocation("smoke", _range(1)), TagLocation("Smoke", _range(2))],
+        "slow": [TagLocation("slow", _range(3))],
+    }
+    b: DocumentTags = {"smoke": [TagLocation("smoke", _range(4))]}
+
+    index.update("file:///a.robot", a)
+    index.update("file:///b.robot", b)
+
+    assert index.get_tags() == [("smoke", 3), ("slow", 1)]
+    assert index.get_document_counts("file:///a.robot") == {"smoke": 2, "slow": 1}
+    assert index.get_locations("smoke") == [
+        Location("file:///a.robot", _range(1)),
+        Location("file:///a.robot", _range(2)),
+        Location("file:///b.robot", _range(4)),
+    ]
+
+    index.update("file:///a.robot", {"fast": [TagLocation("fast", _range(1))]})
+
+    assert index.get_tags() == [("fast", 1), ("smoke", 1)]
+    assert index.get_locations("slow") == []
+
+    index.retain(["file:///a.robot"])
+
+    assert index.get_tags() == [("fast", 1)]
+    assert "file:///b.robot" not in index
+
+
+def test_project_tags_are_read_from_the_index(
+    protocol: RobotLanguageServerProtocol, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    references = protocol.robot_references
+    document = protocol.documents.get_or_open_document(
+        Path(Path(__file__).parent, "data/tests/goto.robot"), "robotframework"
+    )
+    assert str(document.uri) in references._changed_tag_documents or str(document.uri) in references._tag_index
+
+    references.update_tag_index()
+    assert str(document.uri) in references._tag_index
+
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("documents must not be parsed while collecting project tags")
+
+    monkeypatch.setattr(references, "get_document_tags", fail)
+
+    assert "first" in [tag for tag, _ in references.get_project_tags()]
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import pytest
+
+from robotcode.core.lsp.types import Range, SymbolKind
+from robotcode.core.uri import Uri
+from robotcode.language_server.robotframework.diagnostics.symbol_index import (
+    IndexedDocument,
+    IndexedSymbol,
+    SymbolIndex,
+    match_symbol,
+    normalize_symbol_name,
+    split_words,
+)
+from robotcode.language_server.robotframework.protocol import (
+    RobotLanguageServerProtocol,
+)
+
+
+@pytest.mark.parametrize(
+    ("query", "name", "expected"),
+    [
+        ("Open Browser", "Open Browser", 0),
+        ("open", "Open Browser", 1),
+        ("ob", "Open Browser", 2),
+        ("gvj", "Get Value From Json", 2),
+        ("owser", "Open Browser", 3),
+        ("opbrw", "Open Browser", 4),
+        ("${a_var}", "${A_VAR}", 0),
+        ("close", "Open Browser", None),
+        ("", "Open Browser", 5),
+    ],
+)
+def test_match_symbol(query: str, name: str, expected: int) -> None:
+    assert match_symbol(normalize_symbol_name(query), normalize_symbol_name(name), split_words(name)) == expected
+
+
+def test_symbol_index_save_and_load(tmp_path: Path) -> None:
+    cache_file = tmp_path / "symbol_index.json"
+
+    index = SymbolIndex(cache_file)
+    index.update(
+        IndexedDocument(
+            "/tmp/a.robot",
+            "hash",
+            [
+                IndexedSymbol("Open Browser", SymbolKind.FUNCTION, Range.zero(), "A"),
+                IndexedSymbol("Close Browser", SymbolKind.FUNCTION, Range.zero(), "A"),
+            ],
+        )
+    )
+    index.save()
+    assert cache_file.exists()
+
+    loaded = SymbolIndex(cache_file)
+    loaded.load()
+
+    assert loaded.get("/tmp/a.robot") == index.get("/tmp/a.robot")
+    assert [p.symbol.name for _, p in loaded.search("browser", 10)] == ["Open Browser", "Close Browser"]
+
+    loaded.retain([])
+    assert len(loaded) == 0
+    assert loaded.modified
+
+
+def test_workspace_symbols(protocol: RobotLanguageServerProtocol) -> None:
+    document = protocol.documents.get_or_open_document(
+        Path(Path(__file__).parent, "data/tests/symbols.robot"), "robotframework"
+    )
+    uri = str(Uri.from_path(document.uri.to_path()))
+
+    result = protocol.robot_workspace_symbols.collect(protocol, "a keyw")
+    assert result
+    assert any(s.name == "a keywords" and s.kind == SymbolKind.FUNCTION and s.location.uri == uri for s in result)
+
+    result = protocol.robot_workspace_symbols.collect(protocol, "a_var")
+    assert result
+    assert any(s.name == "${A_VAR}" and s.kind == SymbolKind.VARIABLE and s.container_name == "Symbols" for s in result)
+
+
+def test_workspace_symbols_index_only_changed_documents(protocol: RobotLanguageServerProtocol) -> None:
+    symbols = protocol.robot_workspace_symbols
+    document = protocol.documents.get_or_open_document(
+        Path(Path(__file__).parent, "data/tests/symbols.robot"), "robotframework"
+    )
+    symbols.update_index()
+    assert str(document.uri) not in symbols._changed_documents
+
+    symbols._document_changed(protocol.documents, document)
+    assert symbols._changed_documents[str(document.uri)] is document
+
+    index = symbols.update_index()
+    assert str(document.uri) not in symbols._changed_documents
+    assert index.get(str(document.uri.to_path())) is not None
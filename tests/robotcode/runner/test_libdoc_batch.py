@@ -0,0 +1,75 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from robotcode.core.utils.dataclasses import from_json
+from robotcode.plugin import Application
+from robotcode.runner.cli.libdoc_batch import (
+    LibDocBatchOptions,
+    LibDocIndex,
+    SpecStatus,
+    expand_sources,
+    get_fingerprint,
+    get_output_file,
+    run_libdoc_batch,
+)
+
+
+def test_get_output_file() -> None:
+    assert get_output_file("Collections", Path("docs"), "HTML") == Path("docs", "Collections.html")
+    assert get_output_file("libs/MyLib.py::arg", Path("docs"), "JSON") == Path("docs", "libs", "MyLib.json")
+    assert get_output_file("res/common.resource", Path("docs"), "LIBSPEC") == Path("docs", "res", "common.libspec")
+
+
+def test_expand_sources(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "libs" / "sub").mkdir(parents=True)
+    (tmp_path / "libs" / "B.py").touch()
+    (tmp_path / "libs" / "A.py").touch()
+    (tmp_path / "libs" / "sub" / "C.py").touch()
+
+    assert expand_sources(["libs/**/*.py", "libs/A.py", "Collections"]) == [
+        "libs/A.py",
+        "libs/B.py",
+        "libs/sub/C.py",
+        "Collections",
+    ]
+
+
+def test_fingerprint_changes_with_the_source(tmp_path: Path) -> None:
+    library = tmp_path / "MyLib.py"
+    library.write_text("def first():\n    pass\n", "utf-8")
+    options = LibDocBatchOptions()
+
+    fingerprint = get_fingerprint(str(library), options)
+    assert fingerprint == get_fingerprint(str(library), options)
+    assert fingerprint != get_fingerprint(str(library), LibDocBatchOptions(format="JSON"))
+
+    library.write_text("def first():\n    pass\n\n\ndef second():\n    pass\n", "utf-8")
+    os.utime(library, (time.time() + 10, time.time() + 10))
+    assert fingerprint != get_fingerprint(str(library), options)
+
+
+def test_run_libdoc_batch_skips_unchanged_libraries(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "libs").mkdir()
+    (tmp_path / "libs" / "MyLib.py").write_text('def hello():\n    """Says hello."""\n', "utf-8")
+    (tmp_path / "common.resource").write_text("*** Keywords ***\nDo Nothing\n    No Operation\n", "utf-8")
+
+    app = Application()
+    sources = ["libs/*.py", "common.resource"]
+
+    assert run_libdoc_batch(app, {"format": "json"}, sources, Path("docs"), None, 2, False) == 0
+    index = from_json((tmp_path / "docs" / "libdoc.json").read_text("utf-8"), LibDocIndex)
+    assert [(s.source, s.name, s.keywords, s.status) for s in index.specs] == [
+        ("libs/MyLib.py", "MyLib", 1, SpecStatus.GENERATED),
+        ("common.resource", "common", 1, SpecStatus.GENERATED),
+    ]
+    assert (tmp_path / "docs" / "libs" / "MyLib.json").exists()
+    assert (tmp_path / "docs" / "common.json").exists()
+
+    assert run_libdoc_batch(app, {"format": "json"}, sources, Path("docs"), None, 2, False) == 0
+    index = from_json((tmp_path / "docs" / "libdoc.json").read_text("utf-8"), LibDocIndex)
+    assert [s.status for s in index.specs] == [SpecStatus.UNCHANGED, SpecStatus.UNCHANGED]
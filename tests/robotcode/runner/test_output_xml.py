@@ -0,0 +1,118 @@
+import re
+from pathlib import Path
+
+from robot.api import ExecutionResult
+
+from robotcode.runner.output_xml import merge_outputs
+
+OUTPUT_XML = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<robot generator="Robot 7.0" generated="2024-01-01T12:00:00.000000" rpa="false" schemaversion="5">
+<suite id="s1" name="Tests" source="/tests">
+<kw name="Log" owner="BuiltIn" type="SETUP">
+<arg>root setup</arg>
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="0.100"/>
+</kw>
+<suite id="s1-s1" name="{suite}" source="/tests/{suite}.robot">
+<test id="s1-s1-t1" name="{test}" line="2">
+<kw name="Log" owner="BuiltIn">
+<msg time="2024-01-01T12:00:00.000000" level="INFO">Grüße</msg>
+<status status="{status}" start="2024-01-01T12:00:0{start}.000000" elapsed="1.000"/>
+</kw>
+<tag>{tag}</tag>
+<status status="{status}" start="2024-01-01T12:00:0{start}.000000" elapsed="1.000"/>
+</test>
+<status status="{status}" start="2024-01-01T12:00:0{start}.000000" elapsed="1.000"/>
+</suite>
+<status status="{status}" start="2024-01-01T12:00:0{start}.000000" elapsed="1.100"/>
+</suite>
+<statistics>
+</statistics>
+<errors>
+<msg time="2024-01-01T12:00:00.000000" level="WARN">warning {suite}</msg>
+</errors>
+</robot>
+"""
+
+
+def test_merge_outputs(tmp_path: Path) -> None:
+    outputs = []
+    for i, (suite, test, status, tag) in enumerate(
+        [("A", "A1", "FAIL", "smoke"), ("B", "B1", "PASS", "Smoke"), ("A", "A1", "PASS", "smoke")]
+    ):
+        output = tmp_path / f"output{i}.xml"
+        output.write_text(OUTPUT_XML.format(suite=suite, test=test, status=status, tag=tag, start=i * 2), "utf-8")
+        outputs.append(output)
+
+    merged = tmp_path / "merged.xml"
+    result = merge_outputs(outputs, merged, spill_threshold=1)
+
+    assert result.suites == 3
+    assert (result.statistics.passed, result.statistics.failed) == (2, 0)
+
+    execution_result = ExecutionResult(str(merged))
+    suite = execution_result.suite
+    assert suite.name == "Tests"
+    assert suite.setup.name == "Log"
+    assert [s.name for s in suite.suites] == ["A", "B"]
+    assert [t.id for t in suite.all_tests] == ["s1-s1-t1", "s1-s2-t1"]
+    assert suite.status == "PASS"
+    assert suite.elapsedtime == 5100
+    assert suite.suites[0].tests[0].body[0].body[0].message == "Grüße"
+    assert execution_result.statistics.tags.tags["smoke"].passed == 2
+    assert [e.message for e in execution_result.errors] == ["warning A", "warning B", "warning A"]
+
+
+NESTED_IDS_OUTPUT_XML = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<robot generator="Robot 7.0" generated="2024-01-01T12:00:00.000000" rpa="false" schemaversion="5">
+<suite id="s1" name="Tests" source="/tests">
+<suite id="s1-s1" name="{suite}" source="/tests/{suite}.robot">
+<kw id="s1-s1-k1" name="Setup" type="SETUP">
+<kw id="s1-s1-k1-k1" name="Log" owner="BuiltIn">
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="0.100"/>
+</kw>
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="0.100"/>
+</kw>
+<test id="s1-s1-t1" name="Test" line="2">
+<kw id="s1-s1-t1-k1" name="Log" owner="BuiltIn">
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="1.000"/>
+</kw>
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="1.000"/>
+</test>
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="1.000"/>
+</suite>
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="1.000"/>
+</suite>
+<statistics>
+</statistics>
+<errors>
+</errors>
+</robot>
+"""
+
+
+def test_merge_outputs_renumbers_nested_ids(tmp_path: Path) -> None:
+    outputs = []
+    for suite in ["A", "B"]:
+        output = tmp_path / f"{suite}.xml"
+        output.write_text(NESTED_IDS_OUTPUT_XML.format(suite=suite), "utf-8")
+        outputs.append(output)
+
+    merged = tmp_path / "merged.xml"
+    merge_outputs(outputs, merged)
+
+    ids = re.findall(r'<(\w+) id="([^"]*)"', merged.read_text("utf-8"))
+    assert ids == [
+        ("suite", "s1"),
+        ("suite", "s1-s1"),
+        ("kw", "s1-s1-k1"),
+        ("kw", "s1-s1-k1-k1"),
+        ("test", "s1-s1-t1"),
+        ("kw", "s1-s1-t1-k1"),
+        ("suite", "s1-s2"),
+        ("kw", "s1-s2-k1"),
+        ("kw", "s1-s2-k1-k1"),
+        ("test", "s1-s2-t1"),
+        ("kw", "s1-s2-t1-k1"),
+    ]
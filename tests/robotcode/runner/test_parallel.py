@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import robot
+from robot.conf import RobotSettings
+from robot.result import ExecutionResult
+from robot.running import TestSuite as RunningSuite
+from robot.running import TestSuiteBuilder as SuiteBuilder
+
+from robotcode.plugin import Application
+from robotcode.runner.cli.parallel import (
+    SplitMode,
+    WorkItem,
+    collect_work_items,
+    merge_results,
+    partition_work_items,
+)
+
+
+def _create_suite() -> RunningSuite:
+    root = RunningSuite(name="Root")
+    a = root.suites.create(name="A")
+    a.tests.create(name="A1")
+    a.tests.create(name="A2")
+    a.tests.create(name="A3")
+    b = root.suites.create(name="B")
+    b.tests.create(name="B1")
+    return root
+
+
+def test_collect_work_items() -> None:
+    suite = _create_suite()
+
+    assert [(i.longname, i.test_count) for i in collect_work_items(suite, SplitMode.SUITE)] == [
+        ("Root.A", 3),
+        ("Root.B", 1),
+    ]
+    assert [i.longname for i in collect_work_items(suite, SplitMode.TEST)] == [
+        "Root.A.A1",
+        "Root.A.A2",
+        "Root.A.A3",
+        "Root.B.B1",
+    ]
+
+
+def test_partition_work_items() -> None:
+    items = [WorkItem(f"Item {i}", None, 1, duration) for i, duration in enumerate([1, 5, 2, 2, 3, 1])]
+
+    partitions = partition_work_items(items, 3)
+
+    assert [sum(i.duration for i in p) for p in partitions] == [5, 5, 4]
+    assert sorted(i.longname for p in partitions for i in p) == sorted(i.longname for i in items)
+
+    assert len(partition_work_items(items, 10)) == len(items)
+    assert partition_work_items([], 4) == []
+
+
+def test_merge_results_keeps_messages_and_source_order(tmp_path: Path) -> None:
+    source = tmp_path / "Root"
+    source.mkdir()
+    (source / "a.robot").write_text("*** Test Cases ***\nA1\n    No Operation\nA2\n    No Operation\n")
+    (source / "b.robot").write_text("*** Test Cases ***\nB1\n    No Operation\nB2\n    Fail    Expected failure\n")
+
+    workers = [["Root.A.A2", "Root.B.B1"], ["Root.A.A1", "Root.B.B2"]]
+    outputs = []
+    for i, tests in enumerate(workers):
+        output = tmp_path / f"worker{i}.xml"
+        robot.run(str(source), test=tests, output=str(output), log="NONE", report="NONE", stdout=None)
+        outputs.append(output)
+
+    suite = SuiteBuilder().build(str(source))
+    settings = RobotSettings(outputdir=str(tmp_path), output="output.xml", log="NONE", report="NONE")
+
+    return_code = merge_results(Application(), settings, suite, outputs)
+
+    assert return_code == 1
+
+    result = ExecutionResult(str(tmp_path / "output.xml"))
+
+    assert [s.longname for s in result.suite.suites] == ["Root.A", "Root.B"]
+    assert [t.name for s in result.suite.suites for t in s.tests] == ["A1", "A2", "B1", "B2"]
+    assert [t.message for s in result.suite.suites for t in s.tests] == ["", "", "", "Expected failure"]
+    assert all(not s.message for s in [result.suite, *result.suite.suites])
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+from robot.running import TestSuite as RunningSuite
+
+from robotcode.runner.output_xml import TestResult as Result
+from robotcode.runner.output_xml import get_test_id, iter_test_results
+from robotcode.runner.timings import FailedFirst, TimingDatabase
+
+OUTPUT_XML = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<robot generator="Robot 7.0" rpa="false" schemaversion="5">
+<suite id="s1" name="Tests" source="{root}">
+<suite id="s1-s1" name="A" source="{root}/a.robot">
+<test id="s1-s1-t1" name="A1" line="2">
+<kw name="Log" owner="BuiltIn">
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="0.500"/>
+</kw>
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="1.500"/>
+</test>
+<test id="s1-s1-t2" name="A2" line="4">
+<status status="FAIL" starttime="20240101 12:00:00.000" endtime="20240101 12:00:02.250">boom</status>
+</test>
+<status status="FAIL" start="2024-01-01T12:00:00.000000" elapsed="4.000"/>
+</suite>
+<status status="FAIL" start="2024-01-01T12:00:00.000000" elapsed="4.100"/>
+</suite>
+</robot>
+"""
+
+
+def test_iter_test_results(tmp_path: Path) -> None:
+    output = tmp_path / "output.xml"
+    output.write_text(OUTPUT_XML.format(root=tmp_path), "utf-8")
+
+    assert list(iter_test_results(output)) == [
+        Result(get_test_id(tmp_path / "a.robot", "Tests.A.A1", 2), "PASS", 1.5),
+        Result(get_test_id(tmp_path / "a.robot", "Tests.A.A2", 4), "FAIL", 2.25),
+    ]
+
+
+def test_timing_database(tmp_path: Path) -> None:
+    timings = TimingDatabase(tmp_path / "timings.json")
+    timings.add(Result("a", "PASS", 2.0))
+    timings.add(Result("a", "FAIL", 4.0))
+    timings.add(Result("b", "PASS", 1.0))
+    timings.add(Result("c", "PASS", 10.0))
+    timings.save()
+
+    loaded = TimingDatabase.load(tmp_path / "timings.json")
+    assert loaded.estimate("a") == 3.0
+    assert loaded.has_failed("a")
+    assert not loaded.has_failed("b")
+    assert loaded.estimate("unknown") == 3.0
+
+
+def test_failed_first(tmp_path: Path) -> None:
+    root = RunningSuite(name="Root")
+    a = root.suites.create(name="A", source=tmp_path / "a.robot")
+    a.tests.create(name="A1", lineno=1)
+    b = root.suites.create(name="B", source=tmp_path / "b.robot")
+    b.tests.create(name="B1", lineno=1)
+    b.tests.create(name="B2", lineno=2)
+
+    timings = TimingDatabase(tmp_path / "timings.json")
+    timings.add(Result(get_test_id(tmp_path / "b.robot", "Root.B.B2", 2), "FAIL", 1.0))
+
+    root.visit(FailedFirst(timings))
+
+    assert [s.name for s in root.suites] == ["B", "A"]
+    assert [t.name for t in root.suites[0].tests] == ["B2", "B1"]
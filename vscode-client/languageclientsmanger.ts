@@ -152,6 +152,9 @@ export class LanguageClientsManager {
         await this.clearCaches();
         await this.restart();
       }),
+      vscode.commands.registerCommand("robotcode.toggleLanguageServerProfiling", async () => {
+        await this.toggleProfiling();
+      }),
     );
     setTimeout(() => {
       this.updateStatusbarItem(vscode.window.activeTextEditor).then(
@@ -167,6 +170,43 @@ export class LanguageClientsManager {
     }
   }
 
+  public async toggleProfiling(): Promise<void> {
+    for (const client of this.clients.values()) {
+      const command = client.initializeResult?.capabilities.executeCommandProvider?.commands.find((c) =>
+        c.endsWith(".robotcode.toggleProfiling"),
+      );
+      if (command === undefined) continue;
+
+      const result = (await client.sendRequest("workspace/executeCommand", { command: command })) as {
+        running: boolean;
+        outputDir?: string;
+        collapsedFile?: string;
+        pstatsFile?: string;
+      };
+
+      if (result.running) {
+        vscode.window.showInformationMessage(`RobotCode: Profiling started for ${client.name}.`).then(
+          (_) => undefined,
+          (_) => undefined,
+        );
+      } else if (result.collapsedFile !== undefined) {
+        vscode.window
+          .showInformationMessage(
+            `RobotCode: Profile for ${client.name} written to ${result.outputDir ?? ""}.`,
+            "Open Folder",
+          )
+          .then(
+            async (item) => {
+              if (item === "Open Folder" && result.outputDir !== undefined) {
+                await vscode.commands.executeCommand("revealFileInOS", vscode.Uri.file(result.collapsedFile ?? ""));
+              }
+            },
+            (_) => undefined,
+          );
+      }
+    }
+  }
+
   public async stopAllClients(): Promise<boolean> {
     const promises: Promise<void>[] = [];
 